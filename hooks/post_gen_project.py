@@ -100,17 +100,26 @@ def remove_empty_files():
             "app/modules/examples",
             "app/modules/examples_agent",
             "app/modules/health_checks/service.py",
+            "app/modules/health_checks/prober.py",
             "app/core/enums.py",
             "app/core/schemas.py",
             "app/core/exceptions.py",
             "app/core/exception_handlers.py",
             "app/core/lifespan.py",
+            "app/core/dependency_health.py",
+            "app/core/circuit_breaker.py",
             "migrations",
             "alembic.ini",
             "tests/api/test_examples.py",
             "tests/api/test_agents.py",
             "tests/factories.py",
             "tests/mocks",
+            "tests/unit/infrastructure",
+            "tests/unit/modules",
+            "tests/unit/core/test_dependency_health.py",
+            "tests/unit/core/test_circuit_breaker.py",
+            "tests/unit/benchmarks",
+            "benchmarks",
         ]
         for p in paths_to_remove:
             _remove_path(project_root, p)
@@ -118,10 +127,17 @@ def remove_empty_files():
     elif PROJECT_TYPE == "fastapi_db":
         paths_to_remove = [
             "app/infrastructure/llms",
+            "app/infrastructure/db/models/agent_thread.py",
+            "app/modules/health_checks/prober.py",
             "app/modules/examples_agent",
             "app/core/enums.py",
             "tests/api/test_agents.py",
             "tests/mocks",
+            "tests/unit/infrastructure",
+            "tests/unit/modules/examples_agent",
+            "tests/unit/modules/health_checks",
+            "tests/unit/benchmarks",
+            "benchmarks",
         ]
         for p in paths_to_remove:
             _remove_path(project_root, p)
@@ -131,8 +147,6 @@ def remove_empty_files():
             "app/infrastructure/db",
             "app/modules/examples",
             "app/core/schemas.py",
-            "app/core/exceptions.py",
-            "app/core/lifespan.py",
             "migrations",
             "alembic.ini",
             "tests/api/test_examples.py",
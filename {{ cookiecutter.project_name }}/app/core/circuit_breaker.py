@@ -0,0 +1,88 @@
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+from functools import lru_cache
+from logging import getLogger
+import time
+from typing import Literal, TypeAlias
+
+from app.core.config import get_settings
+from app.core.exceptions import ServiceUnavailableError
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from app.core.observability.metrics import gauges
+{%- endif %}
+
+_logger = getLogger(__name__)
+
+CircuitState: TypeAlias = Literal['closed', 'half_open', 'open']
+{%- if cookiecutter.use_otel_observability == "yes" %}
+
+CIRCUIT_STATE_GAUGE_VALUES: dict[CircuitState, int] = {'closed': 0, 'half_open': 1, 'open': 2}
+{%- endif %}
+
+
+class CircuitBreaker:
+    """Fails calls to a dependency fast once it keeps failing, instead of letting each one wait for its timeout.
+
+    Opens after `failure_threshold` consecutive failures. After `recovery_seconds` it is half-open and lets a single
+    trial call through while still rejecting the rest: its success closes the circuit, its failure opens it for another
+    `recovery_seconds`. A trial that never reports back is replaced by a new one after `recovery_seconds`.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, recovery_seconds: float) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_seconds = recovery_seconds
+        self._state: CircuitState = 'closed'
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._set_state('closed')
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def is_rejecting(self) -> bool:
+        """Whether calls are currently rejected, i.e. the circuit is open or waiting for its trial call."""
+        return self._state != 'closed' and time.monotonic() - self._opened_at < self._recovery_seconds
+
+    def check(self) -> None:
+        """Raise `ServiceUnavailableError` while the circuit is open or a half-open trial call is in flight."""
+        if self._state == 'closed':
+            return
+        if self.is_rejecting:
+            raise ServiceUnavailableError(f'{self.name} is temporarily unavailable. Please retry shortly.')
+        # This caller is the trial, everyone else is rejected until it reports back or another recovery time passes
+        self._opened_at = time.monotonic()
+        self._set_state('half_open')
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        if self._state != 'closed':
+            _logger.info('Circuit for %s closed', self.name)
+            self._set_state('closed')
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == 'half_open' or (
+            self._state == 'closed' and self._consecutive_failures >= self._failure_threshold
+        ):
+            _logger.warning('Circuit for %s opened after %d failures', self.name, self._consecutive_failures)
+            self._opened_at = time.monotonic()
+            self._set_state('open')
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+{%- if cookiecutter.use_otel_observability == "yes" %}
+        gauges.circuit_breaker_state.labels(dependency=self.name).set(CIRCUIT_STATE_GAUGE_VALUES[state])
+{%- endif %}
+
+
+@lru_cache
+def get_circuit_breaker(dependency: str) -> CircuitBreaker:
+    settings = get_settings()
+    return CircuitBreaker(
+        name=dependency,
+        failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_seconds=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS,
+    )
+{%- endif %}
@@ -21,7 +21,10 @@ from pydantic import AnyHttpUrl, Field, model_validator
 {%- endif %}
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from app.core.logging import LogFormatType, LogLevel
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from app.core.enums import AIModelName
+{%- endif %}
+from app.core.logging import LogFormatType, LogLevel, LogQueueOverflowPolicy
 
 
 class Settings(BaseSettings):
@@ -29,12 +32,31 @@ class Settings(BaseSettings):
     PROJECT_VERSION: str = '0.1.0'
     LOG_LEVEL: LogLevel = 'INFO'
     LOG_FORMAT: LogFormatType = LogFormatType.STDOUT
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_QUEUE_OVERFLOW_POLICY: LogQueueOverflowPolicy = 'drop'
+    LOG_RATE_LIMIT_ENABLED: bool = True
+    LOG_RATE_LIMIT_PER_SECOND: float = 10.0
+    LOG_RATE_LIMIT_BURST: int = 50
+    LOG_RATE_LIMIT_REPORT_INTERVAL_SECONDS: float = 60.0
+    LOG_ACCESS_ENABLED: bool = True
+    LOG_UVICORN_ACCESS_ENABLED: bool = False
     ROOT_PATH: str = ''
+    WORKERS: int = 1
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
     DATABASE_URL: PostgresDsn
     MIGRATION_ON_STARTUP: bool = True
 {%- endif %}
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+
+    DEPENDENCY_HEALTH_WINDOW_SECONDS: int = 60
+    DEPENDENCY_HEALTH_MIN_CALLS: int = 10
+    DEPENDENCY_HEALTH_MAX_ERROR_RATE: float = 0.5
+
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = 30.0
+{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 
     AWS_REGION: str = 'eu-central-1'
@@ -44,7 +66,14 @@ class Settings(BaseSettings):
 
     OPENAI_API_KEY: SecretStr
     OPENAI_TIMEOUT: int = 180
+    OPENAI_MAX_RETRIES: int = 2
     OPENAI_BASE_URL: str = ''
+    OPENAI_CONNECT_TIMEOUT: int = 5
+    OPENAI_READ_TIMEOUT: int = 180
+    OPENAI_CONNECTIONS_POOL_SIZE: int = 200
+    OPENAI_KEEPALIVE_CONNECTIONS: int = 100
+    OPENAI_KEEPALIVE_EXPIRY: int = 60
+    OPENAI_HTTP2: bool = True
     OPENAI_GPT_5_4_MODEL_NAME: str | Literal['gpt-5.4'] = 'gpt-5.4'
     OPENAI_GPT_5_4_MINI_MODEL_NAME: str | Literal['gpt-5.4-mini'] = 'gpt-5.4-mini'
     OPENAI_GPT_5_2_MODEL_NAME: str | Literal['gpt-5.2'] = 'gpt-5.2'
@@ -53,6 +82,8 @@ class Settings(BaseSettings):
     BEDROCK_CONNECT_TIMEOUT: int = 5
     BEDROCK_READ_TIMEOUT: int = 180
     BEDROCK_CONNECTIONS_POOL_SIZE: int = 30
+    BEDROCK_MAX_ATTEMPTS: int = 3
+    BEDROCK_RETRY_MODE: Literal['standard', 'adaptive'] = 'standard'
     BEDROCK_MODEL_SONNET_4_6: str | Literal['eu.anthropic.claude-sonnet-4-6-20260101-v1:0'] = (
         'eu.anthropic.claude-sonnet-4-6-20260101-v1:0'
     )
@@ -62,13 +93,64 @@ class Settings(BaseSettings):
     BEDROCK_MODEL_HAIKU_4_5: str | Literal['eu.anthropic.claude-haiku-4-5-20251001-v1:0'] = (
         'eu.anthropic.claude-haiku-4-5-20251001-v1:0'
     )
+
+    LLM_FALLBACK_MODELS: tuple[AIModelName, ...] = ()
+
+    LLM_RECORD_REPLAY_MODE: Literal['off', 'record', 'replay'] = 'off'
+    LLM_RECORDINGS_DIR: str = '.llm_recordings'
+    LLM_REPLAY_LATENCY: Literal['none', 'recorded', 'lognormal'] = 'recorded'
+    LLM_REPLAY_LATENCY_MEDIAN_SECONDS: float = 2.0
+    LLM_REPLAY_LATENCY_SIGMA: float = 0.5
+
+    LLM_WARMUP_ON_STARTUP: bool = True
+    LLM_WARMUP_TIMEOUT_SECONDS: float = 10.0
+
+    HEALTH_PROBE_INTERVAL_SECONDS: float = 30.0
+    HEALTH_PROBE_MAX_STALENESS_SECONDS: float = 90.0
+
+    AGENT_HEDGING_ENABLED: bool = False
+    AGENT_HEDGING_DELAY_SECONDS: float = 20.0
+    AGENT_HEDGING_MODEL: AIModelName = AIModelName.GPT_5_4_MINI
+
+    AGENT_BATCH_CONCURRENCY_PER_MODEL: int = 4
+    AGENT_BATCH_MAX_STORED_JOBS: int = 100
+    AGENT_BATCH_MAX_RUNNING_JOBS: int = 10
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+    AGENT_THREAD_HISTORY_TOKEN_BUDGET: int = 8_000
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.use_otel_observability == "yes" %}
 
     OBSERVABILITY_TRACING_ENABLED: bool = False
     OBSERVABILITY_METRICS_ENABLED: bool = False
+    OBSERVABILITY_METRICS_PORT: int | None = Field(default=None, ge=1, le=65535)
     OBSERVABILITY_TRACING_SAMPLE_RATE_PERCENT: float = Field(default=100.0, ge=0.0, le=100.0)
     OBSERVABILITY_TRACING_OTLP_ENDPOINT: AnyHttpUrl | None = None
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_ENABLED: bool = False
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_SLOW_SECONDS: float = 1.0
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_SLOW_ROUTE_SECONDS: tuple[tuple[str, float], ...] = (('/v1/agents', 30.0),)
+{%- else %}
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_SLOW_ROUTE_SECONDS: tuple[tuple[str, float], ...] = ()
+{%- endif %}
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_MAX_BUFFERED_SPANS: int = 10_000
+    OBSERVABILITY_METRICS_LATENCY_BUCKETS_HEALTH: tuple[float, ...] = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+    )
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+    OBSERVABILITY_METRICS_LATENCY_BUCKETS_EXAMPLES: tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+    )
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+    OBSERVABILITY_METRICS_LATENCY_BUCKETS_AGENT: tuple[float, ...] = (
+        0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 180.0
+    )
+{%- endif %}
+    OBSERVABILITY_METRICS_LATENCY_BUCKETS_GENERAL: tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
 
     @model_validator(mode='after')
     def validate_observability_tracing_config(self) -> Self:
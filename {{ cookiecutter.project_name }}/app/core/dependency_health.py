@@ -0,0 +1,63 @@
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+import time
+
+from app.core.config import get_settings
+
+
+@dataclass(slots=True)
+class _OutcomeBucket:
+    second: int
+    successes: int = 0
+    failures: int = 0
+
+
+class DependencyHealthTracker:
+    """Outcomes of real calls to one dependency, counted in per-second buckets over a sliding window."""
+
+    def __init__(self, name: str, window_seconds: int, min_calls: int, max_error_rate: float) -> None:
+        self.name = name
+        self._window_seconds = window_seconds
+        self._min_calls = min_calls
+        self._max_error_rate = max_error_rate
+        self._buckets: deque[_OutcomeBucket] = deque()
+
+    def record_success(self) -> None:
+        self._current_bucket().successes += 1
+
+    def record_failure(self) -> None:
+        self._current_bucket().failures += 1
+
+    def is_healthy(self) -> bool | None:
+        """Whether the recent error rate is acceptable, `None` while there is too little traffic to tell."""
+        self._evict_expired(int(time.monotonic()))
+        failures = sum(bucket.failures for bucket in self._buckets)
+        calls = failures + sum(bucket.successes for bucket in self._buckets)
+        if calls < self._min_calls:
+            return None
+        return failures / calls <= self._max_error_rate
+
+    def _current_bucket(self) -> _OutcomeBucket:
+        now = int(time.monotonic())
+        self._evict_expired(now)
+        if not self._buckets or self._buckets[-1].second != now:
+            self._buckets.append(_OutcomeBucket(second=now))
+        return self._buckets[-1]
+
+    def _evict_expired(self, now: int) -> None:
+        while self._buckets and self._buckets[0].second <= now - self._window_seconds:
+            self._buckets.popleft()
+
+
+@lru_cache
+def get_dependency_health_tracker(dependency: str) -> DependencyHealthTracker:
+    settings = get_settings()
+    return DependencyHealthTracker(
+        name=dependency,
+        window_seconds=settings.DEPENDENCY_HEALTH_WINDOW_SECONDS,
+        min_calls=settings.DEPENDENCY_HEALTH_MIN_CALLS,
+        max_error_rate=settings.DEPENDENCY_HEALTH_MAX_ERROR_RATE,
+    )
+{%- endif %}
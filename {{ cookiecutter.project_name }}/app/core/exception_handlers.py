@@ -4,14 +4,17 @@ from typing import NoReturn, cast
 from fastapi import FastAPI, HTTPException, Request
 from starlette import status
 from starlette.types import ExceptionHandler
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
-
-from app.core.exceptions import AlreadyExistError, NotFoundError
-{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 
 from botocore.exceptions import ClientError
 from openai import APIConnectionError, APITimeoutError, RateLimitError
+from pydantic_ai.exceptions import FallbackExceptionGroup
+{%- endif %}
+
+{% if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] -%}
+from app.core.exceptions import AlreadyExistError, ConflictError, NotFoundError, ServiceUnavailableError
+{%- else -%}
+from app.core.exceptions import ServiceUnavailableError
 {%- endif %}
 
 
@@ -19,13 +22,22 @@ def include_exception_handlers(app: FastAPI) -> None:
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
     app.add_exception_handler(NotFoundError, cast(ExceptionHandler, not_found_exception_handler))
     app.add_exception_handler(AlreadyExistError, cast(ExceptionHandler, conflict_exception_handler))
+    app.add_exception_handler(ConflictError, cast(ExceptionHandler, conflict_exception_handler))
 {%- endif %}
+    app.add_exception_handler(ServiceUnavailableError, cast(ExceptionHandler, service_unavailable_exception_handler))
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
     app.add_exception_handler(ClientError, cast(ExceptionHandler, aws_client_error_exception_handler))
     app.add_exception_handler(RateLimitError, cast(ExceptionHandler, openai_rate_limit_exception_handler))
     app.add_exception_handler(APIConnectionError, cast(ExceptionHandler, openai_unavailable_exception_handler))
     app.add_exception_handler(APITimeoutError, cast(ExceptionHandler, openai_unavailable_exception_handler))
+    app.add_exception_handler(FallbackExceptionGroup, cast(ExceptionHandler, llm_fallback_exhausted_exception_handler))
 {%- endif %}
+
+
+def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableError) -> NoReturn:  # noqa: ARG001
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc) or 'Service Unavailable'
+    ) from exc
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
 
@@ -33,7 +45,7 @@ def not_found_exception_handler(request: Request, exc: NotFoundError) -> NoRetur
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc) or 'Not Found') from exc
 
 
-def conflict_exception_handler(request: Request, exc: AlreadyExistError) -> NoReturn:  # noqa: ARG001
+def conflict_exception_handler(request: Request, exc: AlreadyExistError | ConflictError) -> NoReturn:  # noqa: ARG001
     raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc) or 'Conflict') from exc
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
@@ -66,5 +78,12 @@ def openai_unavailable_exception_handler(request: Request, exc: APIConnectionErr
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         detail='AI provider temporarily unavailable. Please retry shortly.',
     ) from exc
+
+
+def llm_fallback_exhausted_exception_handler(request: Request, exc: FallbackExceptionGroup) -> NoReturn:  # noqa: ARG001
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail='AI provider temporarily unavailable. Please retry shortly.',
+    ) from exc
 {%- endif %}
 {%- endif %}
@@ -1,6 +1,7 @@
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type != "fastapi_slim" %}
 class BaseServiceError(Exception):
     pass
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
 
 class NotFoundError(BaseServiceError):
@@ -9,4 +10,13 @@ class NotFoundError(BaseServiceError):
 
 class AlreadyExistError(BaseServiceError):
     pass
+
+
+class ConflictError(BaseServiceError):
+    pass
+{%- endif %}
+
+
+class ServiceUnavailableError(BaseServiceError):
+    pass
 {%- endif %}
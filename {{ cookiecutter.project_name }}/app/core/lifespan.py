@@ -1,13 +1,24 @@
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] -%}
+{%- if cookiecutter.project_type != "fastapi_slim" -%}
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 import asyncio
+{%- endif %}
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
+{% if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] -%}
 from alembic.command import upgrade
+{% endif -%}
 from fastapi import FastAPI
 
 from app.core.config import get_settings, Settings
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 from app.infrastructure.db.database import get_alembic_config
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from app.infrastructure.llms.warmup import warm_up_llm_clients
+from app.modules.examples_agent.batch_jobs import get_example_agent_batch_jobs
+from app.modules.health_checks.prober import get_llm_readiness_prober
+{%- endif %}
 
 
 @asynccontextmanager
@@ -19,10 +30,23 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, Any]:
 
 
 async def startup(settings: Settings) -> None:
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
     if settings.MIGRATION_ON_STARTUP:
         alembic_config = get_alembic_config(settings.DATABASE_URL)
         await asyncio.to_thread(upgrade, alembic_config, 'head')
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+    if settings.LLM_WARMUP_ON_STARTUP:
+        await warm_up_llm_clients(settings)
+    get_llm_readiness_prober().start()
+{%- endif %}
 
 
+{% if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] -%}
+async def shutdown() -> None:
+    await get_example_agent_batch_jobs().stop()
+    await get_llm_readiness_prober().stop()
+{%- else -%}
 async def shutdown() -> None: ...
 {%- endif %}
+{%- endif %}
@@ -1,11 +1,15 @@
-from app.core.logging.config import build_logging_config, configure_logging, LogLevel
+from app.core.logging.config import build_logging_config, configure_logging, LogLevel, LogQueueOverflowPolicy
 from app.core.logging.formatters import ColorizedStdoutFormatter, StructuredJsonFormatter
+from app.core.logging.middleware import AccessLogMiddleware, RequestContextMiddleware
 from app.core.logging.models import LogFormatType, StructuredLogRecord
 
 __all__ = [
+    'AccessLogMiddleware',
     'ColorizedStdoutFormatter',
     'LogFormatType',
     'LogLevel',
+    'LogQueueOverflowPolicy',
+    'RequestContextMiddleware',
     'StructuredJsonFormatter',
     'StructuredLogRecord',
     'build_logging_config',
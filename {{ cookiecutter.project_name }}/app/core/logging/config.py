@@ -5,14 +5,69 @@ from app.core.logging.models import LOG_TIMESTAMP_FORMAT, LogFormatType
 
 STDOUT_LOG_FORMAT_TEMPLATE = '[%(asctime)s] %(levelname)s %(name)s %(message)s'
 DEFAULT_HANDLER_NAME = 'console'
+RATE_LIMIT_FILTER_NAME = 'rate_limit'
+REQUEST_CONTEXT_FILTER_NAME = 'request_context'
 ROOT_LOGGER_NAME = 'root'
 UVICORN_LOGGER_NAMES = ('uvicorn', 'uvicorn.error', 'uvicorn.access')
+UVICORN_ACCESS_LOGGER_NAME = 'uvicorn.access'
+ACCESS_LOGGER_NAME = 'app.access'
 
 
 LogLevel: TypeAlias = Literal['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG', 'NOTSET']
+LogQueueOverflowPolicy: TypeAlias = Literal['drop', 'block']
 
 
-def build_logging_config(log_level: LogLevel, format_type: LogFormatType) -> dict[str, Any]:
+def build_logging_config(
+    log_level: LogLevel,
+    format_type: LogFormatType,
+    *,
+    queue_enabled: bool = False,
+    queue_size: int = 10_000,
+    queue_overflow_policy: LogQueueOverflowPolicy = 'drop',
+    rate_limit_enabled: bool = False,
+    rate_limit_per_second: float = 10.0,
+    rate_limit_burst: int = 50,
+    rate_limit_report_interval_seconds: float = 60.0,
+    uvicorn_access_enabled: bool = True,
+) -> dict[str, Any]:
+    """Build the `dictConfig` for the app and Uvicorn loggers.
+
+    With `queue_enabled` records are written to stdout by a background thread through a bounded queue, so a log call
+    never blocks the event loop on the write. With `rate_limit_enabled` each logger may repeat a message template
+    only `rate_limit_per_second` times on average, records below WARNING over that are dropped (access logs never
+    are). Without `uvicorn_access_enabled` the Uvicorn access logger has no handlers, so Uvicorn skips it entirely.
+    """
+    console_handler: dict[str, Any] = {
+        'class': 'logging.StreamHandler',
+        'formatter': format_type,
+        'stream': 'ext://sys.stdout',
+    }
+    if queue_enabled:
+        console_handler = {
+            '()': 'app.core.logging.handlers.BoundedQueueHandler',
+            'formatter': format_type,
+            'stream': 'ext://sys.stdout',
+            'queue_size': queue_size,
+            'overflow_policy': queue_overflow_policy,
+        }
+    filters: dict[str, Any] = {}
+    if rate_limit_enabled:
+        filters[RATE_LIMIT_FILTER_NAME] = {
+            '()': 'app.core.logging.filters.RateLimitingFilter',
+            'rate_per_second': rate_limit_per_second,
+            'burst': rate_limit_burst,
+            'report_interval_seconds': rate_limit_report_interval_seconds,
+            'exempt_loggers': (UVICORN_ACCESS_LOGGER_NAME, ACCESS_LOGGER_NAME),
+        }
+    # Runs last, so only the records that are kept get stamped
+    filters[REQUEST_CONTEXT_FILTER_NAME] = {'()': 'app.core.logging.filters.RequestContextFilter'}
+    console_handler['filters'] = list(filters)
+    uvicorn_loggers = {
+        logger_name: {'level': log_level, 'handlers': [DEFAULT_HANDLER_NAME], 'propagate': False}
+        for logger_name in UVICORN_LOGGER_NAMES
+    }
+    if not uvicorn_access_enabled:
+        uvicorn_loggers[UVICORN_ACCESS_LOGGER_NAME]['handlers'] = []
     return {
         'version': 1,
         'disable_existing_loggers': False,
@@ -25,20 +80,37 @@ def build_logging_config(log_level: LogLevel, format_type: LogFormatType) -> dic
             },
             LogFormatType.JSON: {'()': 'app.core.logging.formatters.StructuredJsonFormatter'},
         },
-        'handlers': {
-            DEFAULT_HANDLER_NAME: {
-                'class': 'logging.StreamHandler',
-                'formatter': format_type,
-                'stream': 'ext://sys.stdout',
-            }
-        },
+        'filters': filters,
+        'handlers': {DEFAULT_HANDLER_NAME: console_handler},
         ROOT_LOGGER_NAME: {'level': log_level, 'handlers': [DEFAULT_HANDLER_NAME]},
-        'loggers': {
-            logger_name: {'level': log_level, 'handlers': [DEFAULT_HANDLER_NAME], 'propagate': False}
-            for logger_name in UVICORN_LOGGER_NAMES
-        },
+        'loggers': uvicorn_loggers,
     }
 
 
-def configure_logging(log_level: LogLevel, format_type: LogFormatType) -> None:
-    dictConfig(build_logging_config(log_level, format_type))
+def configure_logging(
+    log_level: LogLevel,
+    format_type: LogFormatType,
+    *,
+    queue_enabled: bool = False,
+    queue_size: int = 10_000,
+    queue_overflow_policy: LogQueueOverflowPolicy = 'drop',
+    rate_limit_enabled: bool = False,
+    rate_limit_per_second: float = 10.0,
+    rate_limit_burst: int = 50,
+    rate_limit_report_interval_seconds: float = 60.0,
+    uvicorn_access_enabled: bool = True,
+) -> None:
+    dictConfig(
+        build_logging_config(
+            log_level,
+            format_type,
+            queue_enabled=queue_enabled,
+            queue_size=queue_size,
+            queue_overflow_policy=queue_overflow_policy,
+            rate_limit_enabled=rate_limit_enabled,
+            rate_limit_per_second=rate_limit_per_second,
+            rate_limit_burst=rate_limit_burst,
+            rate_limit_report_interval_seconds=rate_limit_report_interval_seconds,
+            uvicorn_access_enabled=uvicorn_access_enabled,
+        )
+    )
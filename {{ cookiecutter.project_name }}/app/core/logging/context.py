@@ -0,0 +1,78 @@
+from collections.abc import Iterator, Sequence
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+from starlette.routing import BaseRoute, Match, Mount
+from starlette.types import Scope
+
+REQUEST_CONTEXT_RECORD_ATTRIBUTE = 'request_context'
+
+
+class RequestContext:
+    """Metadata of the HTTP request being served, attached to every log record written while serving it."""
+
+    __slots__ = ('_app', '_root_path', '_route', 'dependency_seconds', 'method', 'request_id', 'scope', 'user_agent')
+
+    def __init__(self, request_id: str, method: str, user_agent: str | None, scope: Scope) -> None:
+        self.request_id = request_id
+        self.method = method
+        self.user_agent = user_agent
+        self.scope = scope
+        # Mounted apps rewrite the app and root path of the scope, matching needs the ones the request started with
+        self._app = scope.get('app')
+        self._root_path: str = scope.get('root_path', '')
+        self._route: str | None = None
+        # Time spent waiting on each dependency (database, LLM) while serving the request
+        self.dependency_seconds: dict[str, float] = {}
+
+    @property
+    def route(self) -> str | None:
+        """Full template of the matched route, including the prefixes of the routers and mounts it is served under."""
+        # The router stores the matched route on the request scope, after the context was bound
+        if self._route is None and (route := self.scope.get('route')) is not None:
+            template = _resolve_route_template(self._app, self._root_path, self.method, self.scope.get('path', ''))
+            self._route = template or getattr(route, 'path', None)
+        return self._route
+
+
+request_context: ContextVar[RequestContext | None] = ContextVar('request_context', default=None)
+
+
+def record_dependency_time(dependency: str, seconds: float) -> None:
+    """Add time spent waiting on a dependency to the request being served, if any."""
+    context = request_context.get()
+    if context is not None:
+        context.dependency_seconds[dependency] = context.dependency_seconds.get(dependency, 0.0) + seconds
+
+
+@lru_cache(maxsize=1024)
+def _resolve_route_template(app: Any, root_path: str, method: str, path: str) -> str | None:
+    """Template of the route a request is routed to, memoized so logging does not match every request twice."""
+    scope = {'type': 'http', 'method': method, 'path': path, 'root_path': root_path}
+    return _find_route_template(scope, getattr(app, 'routes', ()))
+
+
+def _find_route_template(scope: Scope, routes: Sequence[BaseRoute]) -> str | None:
+    for candidate in _iter_effective_routes(routes):
+        match, child_scope = candidate.matches(scope)
+        if match is Match.NONE:
+            continue
+        if isinstance(candidate, Mount):
+            template = _find_route_template({**scope, **child_scope}, candidate.routes)
+            if template is not None:
+                return candidate.path + template
+        elif match is Match.FULL:
+            return getattr(candidate, 'path', None)
+    return None
+
+
+def _iter_effective_routes(routes: Sequence[BaseRoute]) -> Iterator[Any]:
+    """Routes as they are matched, with routers added by `include_router` expanded into their fully prefixed routes."""
+    for route in routes:
+        effective_route_contexts = getattr(route, 'effective_route_contexts', None)
+        if effective_route_contexts is None:
+            yield route
+            continue
+        for context in effective_route_contexts():
+            yield context.starlette_route if context.starlette_route is not None else context
@@ -0,0 +1,91 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+import logging
+import threading
+import time
+
+from app.core.logging.context import REQUEST_CONTEXT_RECORD_ATTRIBUTE, request_context
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    tokens: float
+    updated_at: float
+    suppressed: int = 0
+
+
+class RateLimitingFilter(logging.Filter):
+    """Caps how often each logger may repeat the same message template, with a token bucket per template.
+
+    Records at `always_keep_level` and above, and those of `exempt_loggers`, always pass. Every
+    `report_interval_seconds` the suppressed count is logged as a warning, so dropped records stay visible.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        report_interval_seconds: float,
+        always_keep_level: int = logging.WARNING,
+        exempt_loggers: Sequence[str] = (),
+    ) -> None:
+        super().__init__()
+        self._exempt_loggers = frozenset(exempt_loggers)
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._report_interval_seconds = report_interval_seconds
+        self._always_keep_level = always_keep_level
+        self._buckets: dict[tuple[str, object], _TokenBucket] = {}
+        self._reported_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self._always_keep_level or record.name in self._exempt_loggers:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            allowed = self._take_token((record.name, record.msg), now)
+            report = self._collect_report(now)
+        if report:
+            _logger.warning('Rate limited %d log records from %d message templates in the last %.0fs', *report)
+        return allowed
+
+    def _take_token(self, key: tuple[str, object], now: float) -> bool:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TokenBucket(tokens=self._burst, updated_at=now)
+        bucket.tokens = min(self._burst, bucket.tokens + (now - bucket.updated_at) * self._rate_per_second)
+        bucket.updated_at = now
+        if bucket.tokens < 1:
+            bucket.suppressed += 1
+            return False
+        bucket.tokens -= 1
+        return True
+
+    def _collect_report(self, now: float) -> tuple[int, int, float] | None:
+        elapsed = now - self._reported_at
+        if elapsed < self._report_interval_seconds:
+            return None
+        self._reported_at = now
+        suppressed = [bucket.suppressed for bucket in self._buckets.values() if bucket.suppressed]
+        # Forget the templates that went quiet, a new bucket starts full just like theirs would be by now
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated_at) * self._rate_per_second < self._burst
+        }
+        for bucket in self._buckets.values():
+            bucket.suppressed = 0
+        if not suppressed:
+            return None
+        return sum(suppressed), len(suppressed), elapsed
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the caller's `RequestContext`, so handlers formatting on another thread still see it."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        setattr(record, REQUEST_CONTEXT_RECORD_ATTRIBUTE, request_context.get())
+        return True
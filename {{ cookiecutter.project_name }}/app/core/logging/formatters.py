@@ -1,8 +1,26 @@
+import json
 import logging
 import sys
-from typing import ClassVar
+import time
+from typing import Any, ClassVar
 
-from app.core.logging.models import LOG_TIMESTAMP_FORMAT, StructuredLogRecord
+from app.core.logging.context import REQUEST_CONTEXT_RECORD_ATTRIBUTE, RequestContext
+from app.core.logging.models import LOG_TIMESTAMP_FORMAT
+
+# Set on every record, by formatting, by the OpenTelemetry logging instrumentation or by Uvicorn, not via `extra=`
+_RESERVED_RECORD_ATTRIBUTES = frozenset(
+    {
+        *logging.LogRecord('', logging.NOTSET, '', 0, '', None, None).__dict__,
+        'message',
+        'asctime',
+        'otelTraceID',
+        'otelSpanID',
+        'otelServiceName',
+        'otelTraceSampled',
+        'color_message',
+        REQUEST_CONTEXT_RECORD_ATTRIBUTE,
+    }
+)
 
 
 def _get_otel_attribute(record: logging.LogRecord, key: str) -> str | None:
@@ -12,25 +30,71 @@ def _get_otel_attribute(record: logging.LogRecord, key: str) -> str | None:
     return value
 
 
+def _add_request_context(structured: dict[str, Any], context: RequestContext) -> None:
+    structured['request_id'] = context.request_id
+    structured['method'] = context.method
+    route = context.route
+    if route is not None:
+        structured['route'] = route
+    if context.user_agent is not None:
+        structured['user_agent'] = context.user_agent
+
+
 class StructuredJsonFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        structured = StructuredLogRecord(
-            timestamp=self.formatTime(record, LOG_TIMESTAMP_FORMAT),
-            logger_name=record.name,
-            level=record.levelname,
-            message=record.getMessage(),
-        )
+    """Renders records as `StructuredLogRecord` JSON without building the model for every record.
+
+    The output is byte-identical to `StructuredLogRecord.model_dump_json(exclude_none=True)`. The timestamp is
+    rendered once per second. Fields passed with `extra=` go under `extra`, values JSON can't encode as strings.
+    """
 
-        structured.trace_id = _get_otel_attribute(record=record, key='otelTraceID')
-        structured.span_id = _get_otel_attribute(record=record, key='otelSpanID')
+    _encoder: ClassVar[json.JSONEncoder] = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # A single tuple so threads sharing the formatter never read a second with another second's text
+        self._timestamp_cache: tuple[int, str] = (-1, '')
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Keys in `StructuredLogRecord` field order, optional ones only when set
+        structured: dict[str, Any] = {
+            'timestamp': self._format_timestamp(record),
+            'logger_name': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
 
         exc_info = record.exc_info
         if exc_info:
             exc_type = exc_info[0]
-            structured.stack_trace = self.formatException(exc_info)
-            structured.exception_type = exc_type.__name__ if exc_type else None
+            structured['stack_trace'] = self.formatException(exc_info)
+            if exc_type:
+                structured['exception_type'] = exc_type.__name__
+
+        trace_id = _get_otel_attribute(record=record, key='otelTraceID')
+        if trace_id is not None:
+            structured['trace_id'] = trace_id
+        span_id = _get_otel_attribute(record=record, key='otelSpanID')
+        if span_id is not None:
+            structured['span_id'] = span_id
+
+        context: RequestContext | None = record.__dict__.get(REQUEST_CONTEXT_RECORD_ATTRIBUTE)
+        if context is not None:
+            _add_request_context(structured, context)
+
+        if record.__dict__.keys() - _RESERVED_RECORD_ATTRIBUTES:
+            structured['extra'] = {
+                key: value for key, value in record.__dict__.items() if key not in _RESERVED_RECORD_ATTRIBUTES
+            }
+
+        return self._encoder.encode(structured)
 
-        return structured.model_dump_json(exclude_none=True)
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        cached_second, timestamp = self._timestamp_cache
+        if cached_second != second:
+            timestamp = time.strftime(LOG_TIMESTAMP_FORMAT, self.converter(second))
+            self._timestamp_cache = (second, timestamp)
+        return timestamp
 
 
 class ColorizedStdoutFormatter(logging.Formatter):
@@ -0,0 +1,70 @@
+import copy
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import TextIO
+
+from app.core.logging.config import LogQueueOverflowPolicy
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from app.core.observability.metrics import counters
+{%- endif %}
+
+
+class _BoundedQueueListener(QueueListener):
+    def __init__(self, queue: Queue[logging.LogRecord | None], handler: logging.Handler) -> None:
+        super().__init__(queue, handler)
+        self._bounded_queue = queue
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room instead of failing to stop when the queue is full
+        self._bounded_queue.put(None)
+
+    def stop(self) -> None:
+        # The handler is closed again by `logging.shutdown` after a reconfiguration already stopped it
+        if self._thread is not None:
+            super().stop()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to a background thread that formats and writes them, so logging never blocks on the stream.
+
+    When the queue is full the record is dropped and counted (`drop`), or the caller waits for room (`block`).
+    """
+
+    def __init__(self, stream: TextIO, queue_size: int, overflow_policy: LogQueueOverflowPolicy) -> None:
+        self._bounded_queue: Queue[logging.LogRecord | None] = Queue(maxsize=queue_size)
+        super().__init__(self._bounded_queue)
+        self._overflow_policy = overflow_policy
+        self._stream_handler = logging.StreamHandler(stream)
+        self.queue_listener = _BoundedQueueListener(self._bounded_queue, self._stream_handler)
+        self.dropped_records = 0
+        self.queue_listener.start()
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        # Records are formatted by the listener thread, off the caller's thread
+        self._stream_handler.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Freeze the message now, the args may be mutated once the caller moves on
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._overflow_policy == 'block':
+            self._bounded_queue.put(record)
+            return
+        try:
+            self._bounded_queue.put_nowait(record)
+        except Full:
+            self.dropped_records += 1
+{%- if cookiecutter.use_otel_observability == "yes" %}
+            counters.log_records_dropped_total.inc()
+{%- endif %}
+
+    def close(self) -> None:
+        # Drains the queued records before the handler goes away
+        self.queue_listener.stop()
+        self._stream_handler.close()
+        super().close()
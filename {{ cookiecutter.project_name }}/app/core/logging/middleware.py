@@ -0,0 +1,104 @@
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging.config import ACCESS_LOGGER_NAME
+from app.core.logging.context import request_context, RequestContext
+
+REQUEST_ID_HEADER = 'x-request-id'
+MAX_REQUEST_ID_LENGTH = 128
+
+_access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+
+class RequestContextMiddleware:
+    """Binds a `RequestContext` for every HTTP request and returns its id in the `X-Request-ID` response header.
+
+    A request id sent by the client (or a proxy in front) is kept, otherwise a new one is generated.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        request_id = headers.get(REQUEST_ID_HEADER, '')
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH or not request_id.isprintable():
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = request_context.set(
+            RequestContext(
+                request_id=request_id, method=scope['method'], user_agent=headers.get('user-agent'), scope=scope
+            )
+        )
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_context.reset(token)
+
+
+class AccessLogMiddleware:
+    """Logs one line per HTTP request with the route template, status, duration, response size and the time spent
+    waiting on each dependency.
+
+    Must run inside `RequestContextMiddleware`, which provides the route and the dependency times.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+        response_bytes = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                response_bytes += len(message.get('body', b''))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            _log_access(scope, status_code, response_bytes, time.perf_counter() - started_at)
+
+
+def _log_access(scope: Scope, status_code: int, response_bytes: int, duration_seconds: float) -> None:
+    if not _access_logger.isEnabledFor(logging.INFO):
+        return
+    context = request_context.get()
+    route = context.route if context is not None else None
+    dependency_seconds = context.dependency_seconds if context is not None else {}
+    duration_ms = round(duration_seconds * 1000, 1)
+    _access_logger.info(
+        '%s %s %d %.1fms',
+        scope['method'],
+        route or scope['path'],
+        status_code,
+        duration_ms,
+        extra={
+            'status_code': status_code,
+            'duration_ms': duration_ms,
+            'response_bytes': response_bytes,
+            **{f'{dependency}_ms': round(seconds * 1000, 1) for dependency, seconds in dependency_seconds.items()},
+        },
+    )
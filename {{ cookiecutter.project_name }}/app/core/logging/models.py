@@ -1,4 +1,5 @@
 from enum import auto, StrEnum
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -19,3 +20,8 @@ class StructuredLogRecord(BaseModel):
     exception_type: str | None = None
     trace_id: str | None = None
     span_id: str | None = None
+    request_id: str | None = None
+    method: str | None = None
+    route: str | None = None
+    user_agent: str | None = None
+    extra: dict[str, Any] | None = None
@@ -16,7 +16,7 @@ def setup(app: FastAPI, settings: Settings) -> None:
         tracing.setup(app=app, settings=settings)
 
     if settings.OBSERVABILITY_METRICS_ENABLED:
-        metrics.setup(app=app)
+        metrics.setup(app=app, settings=settings)
 
     logger.info('Observability setup completed.')
 {%- endif %}
@@ -1,5 +1,6 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
-from app.core.observability.metrics.bootstrap import setup
+from app.core.observability.metrics.bootstrap import setup, start_metrics_server
+from app.core.observability.metrics.multiprocess import reset_multiprocess_dir
 
-__all__ = ('setup',)
+__all__ = ('reset_multiprocess_dir', 'setup', 'start_metrics_server')
 {%- endif %}
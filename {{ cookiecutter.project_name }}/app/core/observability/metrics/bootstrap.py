@@ -2,18 +2,96 @@
 import logging
 
 from fastapi import FastAPI
-from prometheus_client import make_asgi_app
+from prometheus_client import CollectorRegistry, make_asgi_app, REGISTRY, start_http_server
 from prometheus_fastapi_instrumentator import PrometheusFastApiInstrumentator
-from prometheus_fastapi_instrumentator.metrics import default
+from prometheus_fastapi_instrumentator.metrics import request_size, requests, response_size
+
+from app.core.config import Settings
+from app.core.observability.metrics.latency import request_latency
+from app.core.observability.metrics.multiprocess import (
+    create_multiprocess_registry,
+    get_multiprocess_dir,
+    mark_dead_workers,
+    MULTIPROCESS_DIR_ENV,
+)
+from app.core.observability.metrics.primitives import Section
 
 _logger = logging.getLogger(__name__)
 
 
-def setup(app: FastAPI) -> None:
-    instrumentator = PrometheusFastApiInstrumentator(should_group_status_codes=True, should_ignore_untemplated=True)
-    instrumentator.add(default())
+def get_latency_buckets(settings: Settings) -> dict[Section, tuple[float, ...]]:
+    return {
+        Section.HEALTH: settings.OBSERVABILITY_METRICS_LATENCY_BUCKETS_HEALTH,
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+        Section.EXAMPLES: settings.OBSERVABILITY_METRICS_LATENCY_BUCKETS_EXAMPLES,
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+        Section.AGENT: settings.OBSERVABILITY_METRICS_LATENCY_BUCKETS_AGENT,
+{%- endif %}
+        Section.GENERAL: settings.OBSERVABILITY_METRICS_LATENCY_BUCKETS_GENERAL,
+    }
+
+
+def setup(app: FastAPI, settings: Settings, registry: CollectorRegistry = REGISTRY) -> None:
+    instrumentator = PrometheusFastApiInstrumentator(
+        should_group_status_codes=True, should_ignore_untemplated=True, registry=registry
+    )
+    instrumentator.add(
+        requests(registry=registry),
+        request_size(should_include_method=False, should_include_status=False, registry=registry),
+        response_size(should_include_method=False, should_include_status=False, registry=registry),
+        request_latency(get_latency_buckets(settings), registry=registry),
+    )
     instrumentator.instrument(app)
 
-    app.mount('/metrics/', make_asgi_app())
+    multiprocess_dir = get_multiprocess_dir()
+    if multiprocess_dir is not None:
+        mark_dead_workers(multiprocess_dir)
+    elif settings.WORKERS > 1:
+        _logger.warning(
+            'Running %d workers without %s, every scrape only sees the metrics of one of them',
+            settings.WORKERS,
+            MULTIPROCESS_DIR_ENV,
+        )
+
+    if _uses_metrics_port(settings):
+        _logger.info(
+            'Prometheus metrics served by the launching process on port %d', settings.OBSERVABILITY_METRICS_PORT
+        )
+        return
+    app.mount('/metrics/', make_asgi_app(_get_scraped_registry(registry)))
     _logger.info('Prometheus metrics available at "/metrics/"')
+
+
+def start_metrics_server(settings: Settings, registry: CollectorRegistry = REGISTRY) -> None:
+    """Serve metrics on `OBSERVABILITY_METRICS_PORT` from a background thread of the launching process.
+
+    Scrapes then neither wait for nor slow down the application event loop. Without the port metrics stay mounted
+    on the application at "/metrics/".
+    """
+    port = settings.OBSERVABILITY_METRICS_PORT
+    if not settings.OBSERVABILITY_METRICS_ENABLED or port is None:
+        return
+    if not _uses_metrics_port(settings):
+        _logger.warning(
+            'Ignoring OBSERVABILITY_METRICS_PORT, %d workers need %s to share their metrics with the launching '
+            'process; metrics stay mounted on the application at "/metrics/"',
+            settings.WORKERS,
+            MULTIPROCESS_DIR_ENV,
+        )
+        return
+    start_http_server(port, registry=_get_scraped_registry(registry))
+
+
+def _uses_metrics_port(settings: Settings) -> bool:
+    # Worker processes write their metrics elsewhere than the launching process, unless they share a multiprocess dir
+    return settings.OBSERVABILITY_METRICS_PORT is not None and (
+        settings.WORKERS == 1 or get_multiprocess_dir() is not None
+    )
+
+
+def _get_scraped_registry(registry: CollectorRegistry) -> CollectorRegistry:
+    # Metrics are written by every worker process, so a scrape collects all of their files instead of one registry
+    multiprocess_dir = get_multiprocess_dir()
+    return create_multiprocess_registry(multiprocess_dir) if multiprocess_dir is not None else registry
 {%- endif %}
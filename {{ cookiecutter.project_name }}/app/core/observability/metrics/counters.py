@@ -1,11 +1,48 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
 from prometheus_client import Counter
+
+log_records_dropped_total = Counter(
+    name='log_records_dropped_total',
+    documentation='Total number of log records dropped because the log queue was full',
+)
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 
 agent_requests_total = Counter(
     name='agent_requests_total',
     documentation='Total number of AI agent requests',
 )
+
+agent_hedged_requests_total = Counter(
+    name='agent_hedged_requests_total',
+    documentation='Total number of hedged AI agent requests by the run that answered first',
+    labelnames=('winner',),
+)
+
+agent_tokens_total = Counter(
+    name='agent_tokens_total',
+    documentation='Total number of LLM tokens consumed by AI agent runs by model and token kind',
+    labelnames=('model', 'kind'),
+)
+
+agent_model_requests_total = Counter(
+    name='agent_model_requests_total',
+    documentation='Total number of LLM requests made by AI agent runs by model',
+    labelnames=('model',),
+)
+
+agent_tool_calls_total = Counter(
+    name='agent_tool_calls_total',
+    documentation='Total number of tool calls made by AI agent runs by model',
+    labelnames=('model',),
+)
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+agent_tool_memo_hits_total = Counter(
+    name='agent_tool_memo_hits_total',
+    documentation='Total number of agent tool calls answered from the per-run memo by tool',
+    labelnames=('tool',),
+)
+{%- endif %}
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
@@ -5,6 +5,19 @@ from prometheus_client import Gauge
 agent_inflight_requests = Gauge(
     name='agent_inflight_requests',
     documentation='Number of AI agent requests currently being processed',
+    multiprocess_mode='livesum',
+)
+
+openai_http_requests_inflight = Gauge(
+    name='openai_http_requests_inflight',
+    documentation='Number of in-flight OpenAI HTTP requests, from sending until the response body is closed',
+    multiprocess_mode='livesum',
+)
+
+openai_http_pool_max_connections = Gauge(
+    name='openai_http_pool_max_connections',
+    documentation='Size of the shared OpenAI HTTP connection pool',
+    multiprocess_mode='livesum',
 )
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
@@ -12,6 +25,16 @@ agent_inflight_requests = Gauge(
 database_connections_active = Gauge(
     name='database_connections_active',
     documentation='Number of active database connections',
+    multiprocess_mode='livesum',
+)
+{%- endif %}
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+
+circuit_breaker_state = Gauge(
+    name='circuit_breaker_state',
+    documentation='Circuit breaker state by dependency: 0 closed, 1 half-open, 2 open',
+    labelnames=('dependency',),
+    multiprocess_mode='livemax',
 )
 {%- endif %}
 {%- if cookiecutter.project_type == "fastapi_slim" %}
@@ -20,6 +43,7 @@ app_info = Gauge(
     name='app_info',
     documentation='Application info gauge',
     labelnames=('version',),
+    multiprocess_mode='livemax',
 )
 {%- endif %}
 {%- endif %}
@@ -0,0 +1,12 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from prometheus_client import Histogram
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+
+agent_run_duration_seconds = Histogram(
+    name='agent_run_duration_seconds',
+    documentation='Wall time of successful AI agent runs by model',
+    labelnames=('model',),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 180.0),
+)
+{%- endif %}
+{%- endif %}
@@ -0,0 +1,64 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+
+from opentelemetry import trace
+from prometheus_client import CollectorRegistry, Histogram, REGISTRY
+from prometheus_fastapi_instrumentator.metrics import Info
+
+from app.core.observability.metrics.primitives import Section
+
+# Route templates are matched by prefix, the first match wins and anything else falls back to GENERAL
+SECTION_ROUTE_PREFIXES: dict[str, Section] = {
+    '/health': Section.HEALTH,
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+    '/v1/agents': Section.AGENT,
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+    '/v1/examples': Section.EXAMPLES,
+{%- endif %}
+}
+
+
+@lru_cache(maxsize=1024)
+def resolve_section(handler: str) -> Section:
+    for prefix, section in SECTION_ROUTE_PREFIXES.items():
+        if handler.startswith(prefix):
+            return section
+    return Section.GENERAL
+
+
+def request_latency(
+    buckets: Mapping[Section, Sequence[float]], registry: CollectorRegistry = REGISTRY
+) -> Callable[[Info], None]:
+    """Instrumentation observing request latency in a `http_<section>_request_duration_seconds` histogram per section.
+
+    Each section gets its own buckets, so sub-millisecond health checks and minute long agent calls both resolve.
+    Observations made inside a sampled trace carry its id as an OpenMetrics exemplar.
+    """
+    histograms = {
+        section: Histogram(
+            name=f'http_{section}_request_duration_seconds',
+            documentation=f'Latency of {section} HTTP requests by method, status and handler',
+            labelnames=('method', 'status', 'handler'),
+            buckets=section_buckets,
+            registry=registry,
+        )
+        for section, section_buckets in buckets.items()
+    }
+
+    def instrumentation(info: Info) -> None:
+        histogram = histograms[resolve_section(info.modified_handler)]
+        histogram.labels(info.method, info.modified_status, info.modified_handler).observe(
+            info.modified_duration, exemplar=_trace_exemplar()
+        )
+
+    return instrumentation
+
+
+def _trace_exemplar() -> dict[str, str] | None:
+    span_context = trace.get_current_span().get_span_context()
+    if not span_context.is_valid or not span_context.trace_flags.sampled:
+        return None
+    return {'trace_id': trace.format_trace_id(span_context.trace_id)}
+{%- endif %}
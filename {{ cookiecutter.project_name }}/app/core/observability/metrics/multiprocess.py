@@ -0,0 +1,56 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+import logging
+import os
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, multiprocess
+
+# Read from the process environment, not the settings: prometheus_client picks its value storage on import
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+_logger = logging.getLogger(__name__)
+
+
+def get_multiprocess_dir() -> Path | None:
+    multiprocess_dir = os.environ.get(MULTIPROCESS_DIR_ENV)
+    return Path(multiprocess_dir) if multiprocess_dir else None
+
+
+def reset_multiprocess_dir() -> None:
+    """Remove the metric files of a previous run, before any worker process starts writing its own."""
+    multiprocess_dir = get_multiprocess_dir()
+    if multiprocess_dir is None:
+        return
+    multiprocess_dir.mkdir(parents=True, exist_ok=True)
+    for metric_file in multiprocess_dir.glob('*.db'):
+        metric_file.unlink()
+    _logger.info('Prometheus multiprocess mode enabled, metric files are kept in "%s"', multiprocess_dir)
+
+
+def mark_dead_workers(multiprocess_dir: Path) -> None:
+    """Drop the live gauge values of worker processes which are gone, e.g. replaced after a crash.
+
+    Counters and histograms of dead workers are kept, so totals summed over workers never go down.
+    """
+    pids = {int(metric_file.stem.rsplit('_', 1)[1]) for metric_file in multiprocess_dir.glob('gauge_live*_*.db')}
+    for pid in pids:
+        if not _is_running(pid):
+            multiprocess.mark_process_dead(pid, str(multiprocess_dir))
+
+
+def create_multiprocess_registry(multiprocess_dir: Path) -> CollectorRegistry:
+    """Registry collecting the metrics of every worker process from their files, to expose on scrapes."""
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=str(multiprocess_dir))
+    return registry
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+{%- endif %}
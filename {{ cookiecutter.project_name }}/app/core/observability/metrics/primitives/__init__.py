@@ -2,10 +2,11 @@
 from app.core.observability.metrics.primitives.decorators import (
     increment_after,
     increment_on_error,
+    track_call,
     track_inflight,
     track_latency,
 )
 from app.core.observability.metrics.primitives.enums import Section
 
-__all__ = ['Section', 'increment_after', 'increment_on_error', 'track_inflight', 'track_latency']
+__all__ = ['Section', 'increment_after', 'increment_on_error', 'track_call', 'track_inflight', 'track_latency']
 {%- endif %}
@@ -1,15 +1,14 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
-from collections.abc import Awaitable, Callable, Generator
-from contextlib import contextmanager
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from functools import wraps
 import inspect
 import time
-from typing import cast, overload, ParamSpec, TypeAlias, TypeVar
+from typing import cast, ParamSpec, TypeAlias, TypeVar
 
 from prometheus_client import Histogram
 from prometheus_client.metrics import Counter as PromCounter, Gauge as PromGauge
 
-Hook: TypeAlias = Callable[[], None] | None
 InflightMetric: TypeAlias = PromGauge
 CompletionMetric: TypeAlias = PromCounter
 P = ParamSpec('P')
@@ -17,124 +16,113 @@ T = TypeVar('T')
 
 
 def track_inflight(gauge_or_child: InflightMetric) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        return _wrap_with_hooks(
-            func,
-            before=gauge_or_child.inc,
-            after=gauge_or_child.dec,
-            on_exception=gauge_or_child.dec,
-        )
-
-    return decorator
+    return track_call(inflight=gauge_or_child)
 
 
 def increment_after(
     counter_or_child: CompletionMetric, success_only: bool = True
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        on_exception = None if success_only else counter_or_child.inc
-        return _wrap_with_hooks(func, before=None, after=counter_or_child.inc, on_exception=on_exception)
-
-    return decorator
+    return track_call(completed=counter_or_child, success_only=success_only)
 
 
 def increment_on_error(counter_or_child: CompletionMetric) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        return _wrap_with_hooks(func, before=None, after=None, on_exception=counter_or_child.inc)
-
-    return decorator
+    return track_call(errors=counter_or_child)
 
 
 def track_latency(histogram: Histogram) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        if inspect.iscoroutinefunction(func):
-            async_func = cast(Callable[P, Awaitable[T]], func)
-
-            @wraps(func)
-            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                with _observe_latency(histogram):
-                    return await async_func(*args, **kwargs)
+    return track_call(latency=histogram)
 
-            return cast(Callable[P, T], async_wrapper)
 
-        @wraps(func)
-        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            with _observe_latency(histogram):
-                return func(*args, **kwargs)
+def track_call(
+    *,
+    inflight: InflightMetric | None = None,
+    completed: CompletionMetric | None = None,
+    success_only: bool = True,
+    errors: CompletionMetric | None = None,
+    latency: Histogram | None = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Track a call with several metrics from a single wrapper.
+
+    Same as stacking `track_inflight`, `increment_after`, `increment_on_error` and `track_latency`, but each call
+    goes through one wrapper frame instead of one per metric.
+    """
+    hooks = _CallHooks(inflight=inflight, latency=latency)
+    if completed is not None:
+        hooks.on_success.append(completed.inc)
+        if not success_only:
+            hooks.on_error.append(completed.inc)
+    if errors is not None:
+        hooks.on_error.append(errors.inc)
 
-        return sync_wrapper
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        if inspect.iscoroutinefunction(func):
+            return cast(Callable[P, T], _wrap_async(cast(Callable[P, Awaitable[T]], func), hooks))
+        return _wrap_sync(func, hooks)
 
     return decorator
 
 
-@overload
-def _wrap_with_hooks(
-    func: Callable[P, Awaitable[T]],
-    before: Hook,
-    after: Hook,
-    on_exception: Hook = None,
-) -> Callable[P, Awaitable[T]]: ...
+@dataclass(slots=True)
+class _CallHooks:
+    inflight: InflightMetric | None
+    latency: Histogram | None
+    on_success: list[Callable[[], None]] = field(default_factory=list)
+    on_error: list[Callable[[], None]] = field(default_factory=list)
 
+    def enter(self) -> float:
+        if self.inflight is not None:
+            self.inflight.inc()
+        return time.perf_counter() if self.latency is not None else 0.0
 
-@overload
-def _wrap_with_hooks(
-    func: Callable[P, T],
-    before: Hook,
-    after: Hook,
-    on_exception: Hook = None,
-) -> Callable[P, T]: ...
+    def exit(self, start: float) -> None:
+        if self.latency is not None:
+            self.latency.observe(time.perf_counter() - start)
+        if self.inflight is not None:
+            self.inflight.dec()
 
 
-def _wrap_with_hooks(
-    func: Callable[P, T] | Callable[P, Awaitable[T]],
-    before: Hook,
-    after: Hook,
-    on_exception: Hook = None,
-) -> Callable[P, T] | Callable[P, Awaitable[T]]:
-    """Apply the same metric hooks around sync and async callables."""
-    if inspect.iscoroutinefunction(func):
-        async_func = cast(Callable[P, Awaitable[T]], func)
+def _wrap_async(func: Callable[P, Awaitable[T]], hooks: _CallHooks) -> Callable[P, Awaitable[T]]:
+    on_success, on_error = hooks.on_success, hooks.on_error
 
-        @wraps(func)
-        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            with _hook_scope(before=before, after=after, on_exception=on_exception):
-                return await async_func(*args, **kwargs)
-
-        return async_wrapper
-
-    sync_func = cast(Callable[P, T], func)
+    @wraps(func)
+    async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        start = hooks.enter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            for hook in on_error:
+                hook()
+            raise
+        else:
+            for hook in on_success:
+                hook()
+            return result
+        finally:
+            # Also on cancellation, which is neither a success nor an error
+            hooks.exit(start)
+
+    return async_wrapper
+
+
+def _wrap_sync(func: Callable[P, T], hooks: _CallHooks) -> Callable[P, T]:
+    on_success, on_error = hooks.on_success, hooks.on_error
 
     @wraps(func)
     def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        with _hook_scope(before=before, after=after, on_exception=on_exception):
-            return sync_func(*args, **kwargs)
+        start = hooks.enter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            for hook in on_error:
+                hook()
+            raise
+        else:
+            for hook in on_success:
+                hook()
+            return result
+        finally:
+            hooks.exit(start)
 
     return sync_wrapper
 
-
-@contextmanager
-def _hook_scope(before: Hook, after: Hook, on_exception: Hook) -> Generator[None, None, None]:
-    """Run metric hooks in the correct order around a decorated function call."""
-    if before:
-        before()
-    try:
-        yield
-    except Exception:
-        if on_exception:
-            on_exception()
-        raise
-    else:
-        if after:
-            after()
-
-
-@contextmanager
-def _observe_latency(histogram: Histogram) -> Generator[None, None, None]:
-    """Record call duration even when the wrapped function raises."""
-    start = time.perf_counter()
-    try:
-        yield
-    finally:
-        histogram.observe(time.perf_counter() - start)
-
 {%- endif %}
@@ -1,5 +1,6 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
-from app.core.observability.tracing.bootstrap import create_resource, EXCLUDED_URLS_REGEX, setup
+from app.core.observability.tracing.bootstrap import create_resource, create_sampler, EXCLUDED_URLS_REGEX, setup
+from app.core.observability.tracing.sampling import TailSamplingSpanProcessor
 
-__all__ = ('EXCLUDED_URLS_REGEX', 'create_resource', 'setup')
+__all__ = ('EXCLUDED_URLS_REGEX', 'TailSamplingSpanProcessor', 'create_resource', 'create_sampler', 'setup')
 {%- endif %}
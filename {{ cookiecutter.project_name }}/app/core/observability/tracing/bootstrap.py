@@ -10,15 +10,16 @@ from opentelemetry.instrumentation.logging import LoggingInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 {%- endif %}
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, Sampler, TraceIdRatioBased
 from opentelemetry.semconv.attributes import service_attributes
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 from pydantic_ai import Agent, InstrumentationSettings
 {%- endif %}
 
 from app.core.config import Settings
+from app.core.observability.tracing.sampling import TailSamplingSpanProcessor
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,13 @@ def create_resource(settings: Settings) -> Resource:
     )
 
 
+def create_sampler(settings: Settings) -> Sampler:
+    if settings.OBSERVABILITY_TRACING_TAIL_SAMPLING_ENABLED:
+        # Every span is recorded, the tail sampling processor decides which traces are exported once they end
+        return ALWAYS_ON
+    return TraceIdRatioBased(settings.OBSERVABILITY_TRACING_SAMPLE_RATE_PERCENT / 100)
+
+
 def setup(app: FastAPI, settings: Settings) -> None:
     endpoint = settings.OBSERVABILITY_TRACING_OTLP_ENDPOINT
     if endpoint is None:
@@ -46,10 +54,17 @@ def setup(app: FastAPI, settings: Settings) -> None:
     SQLAlchemyInstrumentor().instrument()
 {%- endif %}
 
-    sampler = TraceIdRatioBased(settings.OBSERVABILITY_TRACING_SAMPLE_RATE_PERCENT / 100)
-    provider = TracerProvider(resource=create_resource(settings=settings), sampler=sampler)
+    provider = TracerProvider(resource=create_resource(settings=settings), sampler=create_sampler(settings=settings))
     span_exporter = OTLPSpanExporter(endpoint=endpoint.encoded_string(), insecure=endpoint.scheme != 'https')
-    span_processor = BatchSpanProcessor(span_exporter=span_exporter)
+    span_processor: SpanProcessor = BatchSpanProcessor(span_exporter=span_exporter)
+    if settings.OBSERVABILITY_TRACING_TAIL_SAMPLING_ENABLED:
+        span_processor = TailSamplingSpanProcessor(
+            span_processor,
+            sample_ratio=settings.OBSERVABILITY_TRACING_SAMPLE_RATE_PERCENT / 100,
+            slow_seconds=settings.OBSERVABILITY_TRACING_TAIL_SAMPLING_SLOW_SECONDS,
+            slow_route_seconds=settings.OBSERVABILITY_TRACING_TAIL_SAMPLING_SLOW_ROUTE_SECONDS,
+            max_buffered_spans=settings.OBSERVABILITY_TRACING_TAIL_SAMPLING_MAX_BUFFERED_SPANS,
+        )
     provider.add_span_processor(span_processor=span_processor)
     trace.set_tracer_provider(tracer_provider=provider)
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
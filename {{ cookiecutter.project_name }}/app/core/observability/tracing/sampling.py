@@ -0,0 +1,101 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from collections import OrderedDict
+from collections.abc import Sequence
+import threading
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+from opentelemetry.semconv.attributes import http_attributes
+from opentelemetry.trace import StatusCode
+
+_NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Buffers the spans of each trace until its local root span ends, then passes the whole trace on to
+    `span_processor` only if a span failed, the root was slow for its route, or the trace id falls within
+    `sample_ratio`.
+
+    Pair it with an always-on sampler, so every span is recorded for the decision. Slow thresholds are matched by
+    `http.route` prefix, the first match wins. Once `max_buffered_spans` is exceeded the oldest unfinished traces are
+    dropped, and spans ending after their trace was decided follow that decision.
+    """
+
+    def __init__(
+        self,
+        span_processor: SpanProcessor,
+        sample_ratio: float,
+        slow_seconds: float,
+        slow_route_seconds: Sequence[tuple[str, float]] = (),
+        max_buffered_spans: int = 10_000,
+    ) -> None:
+        self._span_processor = span_processor
+        # Same bound as TraceIdRatioBased, so traces it would have sampled are kept as well
+        self._sample_bound = TraceIdRatioBased.get_bound_for_rate(sample_ratio)
+        self._slow_seconds = slow_seconds
+        self._slow_route_seconds = tuple(slow_route_seconds)
+        self._max_buffered_spans = max_buffered_spans
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._buffered_spans = 0
+        self._decisions: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._span_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        with self._lock:
+            exported = self._collect(span)
+        for exported_span in exported:
+            self._span_processor.on_end(exported_span)
+
+    def shutdown(self) -> None:
+        self._span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30_000) -> bool:
+        return self._span_processor.force_flush(timeout_millis)
+
+    def _collect(self, span: ReadableSpan) -> list[ReadableSpan]:
+        trace_id = span.context.trace_id
+        decision = self._decisions.get(trace_id)
+        if decision is not None:
+            return [span] if decision else []
+
+        spans = self._traces.setdefault(trace_id, [])
+        spans.append(span)
+        self._buffered_spans += 1
+        if span.parent is not None and not span.parent.is_remote:
+            self._drop_oldest_traces()
+            return []
+
+        del self._traces[trace_id]
+        self._buffered_spans -= len(spans)
+        decision = self._should_keep(trace_id, span, spans)
+        self._decisions[trace_id] = decision
+        if len(self._decisions) > self._max_buffered_spans:
+            self._decisions.popitem(last=False)
+        return spans if decision else []
+
+    def _should_keep(self, trace_id: int, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if any(span.status.status_code is StatusCode.ERROR for span in spans):
+            return True
+        if root.start_time is not None and root.end_time is not None:
+            duration_seconds = (root.end_time - root.start_time) / _NANOSECONDS_PER_SECOND
+            if duration_seconds >= self._get_slow_seconds(root):
+                return True
+        return trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < self._sample_bound
+
+    def _get_slow_seconds(self, root: ReadableSpan) -> float:
+        route = (root.attributes or {}).get(http_attributes.HTTP_ROUTE)
+        if isinstance(route, str):
+            for prefix, slow_seconds in self._slow_route_seconds:
+                if route.startswith(prefix):
+                    return slow_seconds
+        return self._slow_seconds
+
+    def _drop_oldest_traces(self) -> None:
+        while self._buffered_spans > self._max_buffered_spans:
+            _, dropped = self._traces.popitem(last=False)
+            self._buffered_spans -= len(dropped)
+{%- endif %}
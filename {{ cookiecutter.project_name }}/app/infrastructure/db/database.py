@@ -1,15 +1,22 @@
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
-from contextlib import asynccontextmanager
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from functools import lru_cache
-from typing import Any, AsyncGenerator, AsyncIterable
+import time
+from typing import Any, AsyncGenerator, AsyncIterable, TypeAlias
 
 from alembic.config import Config
 from pydantic import PostgresDsn
-from sqlalchemy import MetaData
+from sqlalchemy import event, MetaData
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.circuit_breaker import CircuitBreaker, get_circuit_breaker
 from app.core.config import get_settings
+from app.core.dependency_health import DependencyHealthTracker, get_dependency_health_tracker
+from app.core.logging.context import record_dependency_time
 
 POSTGRES_INDEXES_NAMING_CONVENTION = {
     'ix': '%(column_0_label)s_idx',
@@ -19,6 +26,10 @@ POSTGRES_INDEXES_NAMING_CONVENTION = {
     'pk': '%(table_name)s_pkey',
 }
 
+QUERY_STARTED_AT_KEY = 'query_started_at'
+
+SessionFactory: TypeAlias = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
 
 class Base(DeclarativeBase):
     __abstract__ = True
@@ -28,10 +39,40 @@ class Base(DeclarativeBase):
 @lru_cache
 def async_engine() -> AsyncEngine:
     settings = get_settings()
-    return create_async_engine(
+    engine = create_async_engine(
         settings.DATABASE_URL.unicode_string(),
         pool_pre_ping=True,
     )
+    event.listen(engine.sync_engine, 'before_cursor_execute', _start_query_timer)
+    event.listen(engine.sync_engine, 'after_cursor_execute', _record_database_success)
+    event.listen(engine.sync_engine, 'handle_error', _record_database_error)
+    return engine
+
+
+def get_database_health_tracker() -> DependencyHealthTracker:
+    return get_dependency_health_tracker('database')
+
+
+def get_database_circuit_breaker() -> CircuitBreaker:
+    return get_circuit_breaker('database')
+
+
+def _start_query_timer(connection: Connection, *_: Any) -> None:
+    connection.info[QUERY_STARTED_AT_KEY] = time.perf_counter()
+
+
+def _record_database_success(connection: Connection, *_: Any) -> None:
+    now = time.perf_counter()
+    record_dependency_time('database', now - connection.info.pop(QUERY_STARTED_AT_KEY, now))
+    get_database_health_tracker().record_success()
+    get_database_circuit_breaker().record_success()
+
+
+def _record_database_error(context: ExceptionContext) -> None:
+    """Only connectivity and server-side failures count against the database, not e.g. constraint violations."""
+    if context.is_disconnect or isinstance(context.sqlalchemy_exception, OperationalError | InterfaceError):
+        get_database_health_tracker().record_failure()
+        get_database_circuit_breaker().record_failure()
 
 
 @lru_cache
@@ -49,9 +90,27 @@ async def get_session() -> AsyncIterable[AsyncSession]:
         yield session
 
 
+def get_session_factory() -> SessionFactory:
+    """FastAPI Dependency for code that needs its own sessions, e.g. agent tools running concurrently."""
+    return open_db_session
+
+
+async def get_unguarded_session() -> AsyncIterable[AsyncSession]:
+    """Session not gated by the database circuit breaker, for readiness checks that report the circuit instead."""
+    async with _open_session() as session:
+        yield session
+
+
 @asynccontextmanager
 async def open_db_session() -> AsyncGenerator[AsyncSession, Any]:
     """For usage as a context manager outside FastAPI Depends."""
+    get_database_circuit_breaker().check()
+    async with _open_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def _open_session() -> AsyncGenerator[AsyncSession, Any]:
     factory: async_sessionmaker = async_session_factory()
     session: AsyncSession = factory()
     try:
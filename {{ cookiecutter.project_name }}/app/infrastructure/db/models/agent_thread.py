@@ -0,0 +1,23 @@
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, func, Integer, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.database import Base
+
+
+class AgentThreadModel(Base):
+    __tablename__ = 'agent_threads'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # pydantic-ai message history, serialized with ModelMessagesTypeAdapter
+    messages: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
+    # Bumped on every saved turn, so a turn only saves over the history it was answered from
+    version: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+{%- endif %}
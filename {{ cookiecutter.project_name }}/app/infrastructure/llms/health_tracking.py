@@ -0,0 +1,66 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from pydantic_ai import RunContext
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from app.core.dependency_health import DependencyHealthTracker
+
+
+class HealthTrackingModel(WrapperModel):
+    """Reports the outcome of every model request and stream to the provider's health tracker.
+
+    Errors the caller caused (bad request, content filtered, ...) count as successes: the provider did answer.
+    """
+
+    def __init__(
+        self, wrapped: Model, tracker: DependencyHealthTracker, is_provider_failure: Callable[[Exception], bool]
+    ) -> None:
+        super().__init__(wrapped)
+        self._tracker = tracker
+        self._is_provider_failure = is_provider_failure
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        try:
+            response = await super().request(messages, model_settings, model_request_parameters)
+        except Exception as exc:
+            self._record_error(exc)
+            raise
+        self._tracker.record_success()
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: RunContext[Any] | None = None,
+    ) -> AsyncGenerator[StreamedResponse, Any]:
+        # Errors raised while the stream is consumed surface at the yield as well
+        try:
+            async with super().request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                yield response_stream
+        except Exception as exc:
+            self._record_error(exc)
+            raise
+        self._tracker.record_success()
+
+    def _record_error(self, exc: Exception) -> None:
+        if self._is_provider_failure(exc):
+            self._tracker.record_failure()
+        else:
+            self._tracker.record_success()
+{%- endif %}
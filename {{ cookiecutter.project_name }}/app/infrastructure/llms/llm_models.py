@@ -1,20 +1,38 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Annotated, TypeAlias
 
+from botocore.exceptions import ClientError
 from fastapi import Depends
+from openai import APIConnectionError, APITimeoutError, RateLimitError
+from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
 from pydantic_ai.models import Model
 from pydantic_ai.models.bedrock import BedrockConverseModel
+from pydantic_ai.models.fallback import FallbackModel
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.bedrock import BedrockProvider
 from pydantic_ai.providers.openai import OpenAIProvider
 
+from app.core.circuit_breaker import get_circuit_breaker
 from app.core.config import get_settings, Settings
+from app.core.dependency_health import get_dependency_health_tracker
 from app.core.enums import AIModelName
+from app.core.exceptions import ServiceUnavailableError
+from app.infrastructure.llms.circuit_breaker import CircuitBreakerModel
+from app.infrastructure.llms.health_tracking import HealthTrackingModel
 from app.infrastructure.llms.provider_bedrock import get_bedrock_provider
 from app.infrastructure.llms.provider_openai import get_openai_provider
+from app.infrastructure.llms.record_replay import RecordReplayModel, ReplayLatencySampler
+from app.infrastructure.llms.timing import RequestTimingModel
 
 ModelRegistry: TypeAlias = dict[AIModelName, Model]
 
+RETRYABLE_HTTP_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+RETRYABLE_BEDROCK_ERROR_CODES = frozenset(
+    {'ThrottlingException', 'ServiceUnavailableException', 'TooManyRequestsException', 'ModelNotReadyException'}
+)
+
 
 def get_llm_models_registry(
     settings: Annotated[Settings, Depends(get_settings)],
@@ -38,5 +56,56 @@ def get_llm_models_registry(
         ),
         AIModelName.GPT_5_4: OpenAIChatModel(provider=openai_provider, model_name=settings.OPENAI_GPT_5_4_MODEL_NAME),
     }
-    return registry
+    registry = {name: _guard_provider_model(model) for name, model in registry.items()}
+    if settings.LLM_RECORD_REPLAY_MODE != 'off':
+        latency = ReplayLatencySampler(
+            kind=settings.LLM_REPLAY_LATENCY,
+            median_seconds=settings.LLM_REPLAY_LATENCY_MEDIAN_SECONDS,
+            sigma=settings.LLM_REPLAY_LATENCY_SIGMA,
+        )
+        recordings_dir = Path(settings.LLM_RECORDINGS_DIR)
+        registry = {
+            name: RecordReplayModel(model, settings.LLM_RECORD_REPLAY_MODE, recordings_dir, latency)
+            for name, model in registry.items()
+        }
+    # Outermost, so the time of replayed responses counts too
+    return {name: RequestTimingModel(model) for name, model in registry.items()}
+
+
+def _guard_provider_model(model: Model) -> Model:
+    """Track provider health from real requests, and fail fast per model while its circuit is open."""
+    tracked_model = HealthTrackingModel(model, get_dependency_health_tracker(model.system), is_retryable_provider_error)
+    breaker = get_circuit_breaker(f'{model.system}:{model.model_name}')
+    return CircuitBreakerModel(tracked_model, breaker, is_retryable_provider_error)
+
+
+def build_model_with_fallbacks(
+    registry: ModelRegistry, model_name: AIModelName, fallback_model_names: Sequence[AIModelName]
+) -> Model:
+    """Chain the requested model with fallbacks that take over when its provider is throttled or down."""
+    fallback_models = [registry[name] for name in dict.fromkeys(fallback_model_names) if name != model_name]
+    if not fallback_models:
+        return registry[model_name]
+    return FallbackModel(registry[model_name], *fallback_models, fallback_on=is_retryable_provider_error)
+
+
+def resolve_model_name(registry: ModelRegistry, response_model_name: str | None) -> AIModelName | None:
+    """Registry name of the model that produced a response, e.g. a fallback that took over from the requested one.
+
+    Providers may answer with a dated snapshot of the requested model name, so the longest matching prefix wins.
+    """
+    if response_model_name is None:
+        return None
+    matches = [name for name, model in registry.items() if response_model_name.startswith(model.model_name)]
+    return max(matches, key=lambda name: len(registry[name].model_name), default=None)
+
+
+def is_retryable_provider_error(exc: Exception) -> bool:
+    if isinstance(exc, ModelHTTPError):
+        return exc.status_code in RETRYABLE_HTTP_STATUS_CODES
+    if isinstance(exc, ClientError):
+        return exc.response.get('Error', {}).get('Code') in RETRYABLE_BEDROCK_ERROR_CODES
+    return isinstance(
+        exc, ModelAPIError | RateLimitError | APIConnectionError | APITimeoutError | ServiceUnavailableError
+    )
 {%- endif %}
@@ -25,6 +25,7 @@ def get_bedrock_client(settings: Annotated[Settings, Depends(get_settings)]) ->
             connect_timeout=settings.BEDROCK_CONNECT_TIMEOUT,
             read_timeout=settings.BEDROCK_READ_TIMEOUT,
             max_pool_connections=settings.BEDROCK_CONNECTIONS_POOL_SIZE,
+            retries={'max_attempts': settings.BEDROCK_MAX_ATTEMPTS, 'mode': settings.BEDROCK_RETRY_MODE},
         ),
     )
 
@@ -1,20 +1,92 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from collections.abc import AsyncIterator
+{%- endif %}
 from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
+import httpx2
 from openai import AsyncOpenAI
 from pydantic_ai.providers.openai import OpenAIProvider
 
 from app.core.config import get_settings, Settings
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from app.core.observability.metrics import gauges
+
+
+class _InflightTrackingStream(httpx2.AsyncByteStream):
+    def __init__(self, stream: httpx2.AsyncByteStream) -> None:
+        self._stream = stream
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            gauges.openai_http_requests_inflight.dec()
+        await self._stream.aclose()
+
+
+class InflightTrackingTransport(httpx2.AsyncBaseTransport):
+    """Counts requests from sending until their (possibly streamed) response body is closed."""
+
+    def __init__(self, transport: httpx2.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx2.Request) -> httpx2.Response:
+        gauges.openai_http_requests_inflight.inc()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            gauges.openai_http_requests_inflight.dec()
+            raise
+        if isinstance(response.stream, httpx2.AsyncByteStream) and not response.is_closed:
+            response.stream = _InflightTrackingStream(response.stream)
+        else:
+            gauges.openai_http_requests_inflight.dec()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+{%- endif %}
+
+
+@lru_cache
+def get_openai_http_client(settings: Annotated[Settings, Depends(get_settings)]) -> httpx2.AsyncClient:
+    """One pooled client shared by every OpenAI model, so warm (HTTP/2 multiplexed) connections are reused."""
+    limits = httpx2.Limits(
+        max_connections=settings.OPENAI_CONNECTIONS_POOL_SIZE,
+        max_keepalive_connections=settings.OPENAI_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+    )
+    transport: httpx2.AsyncBaseTransport = httpx2.AsyncHTTPTransport(http2=settings.OPENAI_HTTP2, limits=limits)
+{%- if cookiecutter.use_otel_observability == "yes" %}
+    transport = InflightTrackingTransport(transport)
+    gauges.openai_http_pool_max_connections.set(settings.OPENAI_CONNECTIONS_POOL_SIZE)
+{%- endif %}
+    return httpx2.AsyncClient(
+        transport=transport,
+        timeout=httpx2.Timeout(
+            settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT, read=settings.OPENAI_READ_TIMEOUT
+        ),
+        follow_redirects=True,
+    )
 
 
 @lru_cache
-def get_openai_client(settings: Annotated[Settings, Depends(get_settings)]) -> AsyncOpenAI:
+def get_openai_client(
+    settings: Annotated[Settings, Depends(get_settings)],
+    http_client: Annotated[httpx2.AsyncClient, Depends(get_openai_http_client)],
+) -> AsyncOpenAI:
     return AsyncOpenAI(
         api_key=settings.OPENAI_API_KEY.get_secret_value(),
-        timeout=settings.OPENAI_TIMEOUT,
+        max_retries=settings.OPENAI_MAX_RETRIES,
         base_url=settings.OPENAI_BASE_URL or None,
+        http_client=http_client,
     )
 
 
@@ -0,0 +1,113 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+import hashlib
+import json
+from logging import getLogger
+from pathlib import Path
+import random
+import time
+from typing import Any, cast, Literal, TypeAlias
+
+from pydantic import BaseModel
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+_logger = getLogger(__name__)
+
+RecordReplayMode: TypeAlias = Literal['off', 'record', 'replay']
+ReplayLatency: TypeAlias = Literal['none', 'recorded', 'lognormal']
+
+# Only what the model actually sees takes part in the fingerprint: timestamps, run ids and usage change every run
+FINGERPRINT_PART_KEYS = frozenset({'part_kind', 'content', 'tool_name', 'args'})
+
+
+class RecordingNotFoundError(LookupError):
+    pass
+
+
+class ReplayLatencySampler(BaseModel):
+    """Simulated provider latency of replayed responses."""
+
+    kind: ReplayLatency = 'recorded'
+    median_seconds: float = 2.0
+    sigma: float = 0.5
+
+    def sample(self, recorded_seconds: float) -> float:
+        if self.kind == 'recorded':
+            return recorded_seconds
+        if self.kind == 'lognormal':
+            return self.median_seconds * random.lognormvariate(0, self.sigma)
+        return 0.0
+
+
+class Recording(BaseModel):
+    model_name: str
+    duration_seconds: float
+    response: list[dict[str, Any]]
+
+
+class RecordReplayModel(WrapperModel):
+    """Records responses of the wrapped model to disk, or replays them offline without calling the provider."""
+
+    def __init__(
+        self,
+        wrapped: Model,
+        mode: Literal['record', 'replay'],
+        recordings_dir: Path,
+        latency: ReplayLatencySampler,
+    ) -> None:
+        super().__init__(wrapped)
+        self._mode = mode
+        self._recordings_dir = recordings_dir
+        self._latency = latency
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        path = self._recordings_dir / self.model_name / f'{self._fingerprint(messages, model_request_parameters)}.json'
+        if self._mode == 'replay':
+            return await self._replay(path)
+
+        started_at = time.perf_counter()
+        response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        recording = Recording(
+            model_name=self.model_name,
+            duration_seconds=time.perf_counter() - started_at,
+            response=ModelMessagesTypeAdapter.dump_python([response], mode='json'),
+        )
+        await asyncio.to_thread(_write_recording, path, recording)
+        return response
+
+    async def _replay(self, path: Path) -> ModelResponse:
+        try:
+            raw = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            raise RecordingNotFoundError(f'No recorded response for {self.model_name} at {path}') from None
+        recording = Recording.model_validate_json(raw)
+        await asyncio.sleep(self._latency.sample(recording.duration_seconds))
+        return cast(ModelResponse, ModelMessagesTypeAdapter.validate_python(recording.response)[0])
+
+    def _fingerprint(self, messages: list[ModelMessage], model_request_parameters: ModelRequestParameters) -> str:
+        canonical = {
+            'tools': sorted(tool.name for tool in model_request_parameters.function_tools),
+            'messages': [
+                [
+                    {key: value for key, value in part.items() if key in FINGERPRINT_PART_KEYS}
+                    for part in message['parts']
+                ]
+                for message in ModelMessagesTypeAdapter.dump_python(messages, mode='json')
+            ],
+        }
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+def _write_recording(path: Path, recording: Recording) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(recording.model_dump_json(indent=2))
+    _logger.debug('Recorded %s response to %s', recording.model_name, path)
+{%- endif %}
@@ -0,0 +1,26 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import time
+
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from app.core.logging.context import record_dependency_time
+
+
+class RequestTimingModel(WrapperModel):
+    """Adds the time of every model request to the HTTP request being served, for its access log line."""
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        started_at = time.perf_counter()
+        try:
+            return await super().request(messages, model_settings, model_request_parameters)
+        finally:
+            record_dependency_time('llm', time.perf_counter() - started_at)
+{%- endif %}
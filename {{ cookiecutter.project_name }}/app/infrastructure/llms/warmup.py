@@ -0,0 +1,57 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from logging import getLogger
+import time
+
+from mypy_boto3_bedrock_runtime.type_defs import CountTokensInputTypeDef
+
+from app.core.config import Settings
+from app.infrastructure.llms.provider_bedrock import get_bedrock_client
+from app.infrastructure.llms.provider_openai import get_openai_client, get_openai_http_client
+
+_logger = getLogger(__name__)
+
+_BEDROCK_WARMUP_INPUT: CountTokensInputTypeDef = {
+    'converse': {'messages': [{'role': 'user', 'content': [{'text': 'ping'}]}]}
+}
+
+
+async def warm_up_llm_clients(settings: Settings) -> None:
+    """Create the cached provider clients and open their first pooled connections.
+
+    The factories are called with keyword arguments, as FastAPI calls them, so requests get the warmed clients.
+
+    Never fails startup: a provider that errors or misses `LLM_WARMUP_TIMEOUT_SECONDS` is logged and left cold.
+    """
+    started_at = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(_warm_up_bedrock(settings), _warm_up_openai(settings)),
+            timeout=settings.LLM_WARMUP_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        _logger.warning(
+            'LLM client warm-up timed out after %ss, continuing startup', settings.LLM_WARMUP_TIMEOUT_SECONDS
+        )
+        return
+    _logger.info('LLM clients warmed up in %.2fs', time.perf_counter() - started_at)
+
+
+async def _warm_up_bedrock(settings: Settings) -> None:
+    try:
+        # Client creation and the first signed request resolve AWS credentials, both block
+        bedrock_client = await asyncio.to_thread(get_bedrock_client, settings=settings)
+        await asyncio.to_thread(
+            bedrock_client.count_tokens, modelId=settings.BEDROCK_MODEL_HAIKU_4_5, input=_BEDROCK_WARMUP_INPUT
+        )
+    except Exception as exc:
+        _logger.warning('Bedrock client warm-up failed', exc_info=exc)
+
+
+async def _warm_up_openai(settings: Settings) -> None:
+    try:
+        openai_client = get_openai_client(settings=settings, http_client=get_openai_http_client(settings=settings))
+        await openai_client.models.list()
+    except Exception as exc:
+        _logger.warning('OpenAI client warm-up failed', exc_info=exc)
+{%- endif %}
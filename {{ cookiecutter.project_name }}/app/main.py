@@ -5,31 +5,47 @@ from fastapi_pagination import add_pagination
 import uvicorn
 
 from app.core.config import get_settings
-from app.core.logging import build_logging_config, configure_logging
+from app.core.logging import AccessLogMiddleware, build_logging_config, configure_logging, RequestContextMiddleware
 {%- if cookiecutter.project_type != "fastapi_slim" %}
 from app.core.exception_handlers import include_exception_handlers
 {%- endif %}
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type != "fastapi_slim" %}
 from app.core.lifespan import lifespan
 {%- endif %}
 {%- if cookiecutter.use_otel_observability == "yes" %}
 from app.core import observability
+from app.core.observability.metrics import reset_multiprocess_dir, start_metrics_server
 {%- endif %}
 from app.router import create_router
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+    configure_logging(
+        settings.LOG_LEVEL,
+        settings.LOG_FORMAT,
+        queue_enabled=settings.LOG_QUEUE_ENABLED,
+        queue_size=settings.LOG_QUEUE_SIZE,
+        queue_overflow_policy=settings.LOG_QUEUE_OVERFLOW_POLICY,
+        rate_limit_enabled=settings.LOG_RATE_LIMIT_ENABLED,
+        rate_limit_per_second=settings.LOG_RATE_LIMIT_PER_SECOND,
+        rate_limit_burst=settings.LOG_RATE_LIMIT_BURST,
+        rate_limit_report_interval_seconds=settings.LOG_RATE_LIMIT_REPORT_INTERVAL_SECONDS,
+        uvicorn_access_enabled=settings.LOG_UVICORN_ACCESS_ENABLED,
+    )
 
     _app = FastAPI(
         title=settings.PROJECT_NAME,
         version=settings.PROJECT_VERSION,
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type != "fastapi_slim" %}
         lifespan=lifespan,
 {%- endif %}
         root_path=settings.ROOT_PATH,
     )
+    if settings.LOG_ACCESS_ENABLED:
+        _app.add_middleware(AccessLogMiddleware)
+    # Added last so it runs first: the access log reads the request context it binds
+    _app.add_middleware(RequestContextMiddleware)
 {%- if cookiecutter.use_otel_observability == "yes" %}
     observability.setup(app=_app, settings=settings)
 {%- endif %}
@@ -47,11 +63,28 @@ def create_app() -> FastAPI:
 
 if __name__ == '__main__':
     _settings = get_settings()
+{%- if cookiecutter.use_otel_observability == "yes" %}
+    reset_multiprocess_dir()
+    start_metrics_server(_settings)
+{%- endif %}
     uvicorn.run(
         'app.main:create_app',
         factory=True,
         host='0.0.0.0',  # noqa: S104
         port=8000,
+        workers=_settings.WORKERS,
         log_level=_settings.LOG_LEVEL.lower(),
-        log_config=build_logging_config(_settings.LOG_LEVEL, _settings.LOG_FORMAT),
+        log_config=build_logging_config(
+            _settings.LOG_LEVEL,
+            _settings.LOG_FORMAT,
+            queue_enabled=_settings.LOG_QUEUE_ENABLED,
+            queue_size=_settings.LOG_QUEUE_SIZE,
+            queue_overflow_policy=_settings.LOG_QUEUE_OVERFLOW_POLICY,
+            rate_limit_enabled=_settings.LOG_RATE_LIMIT_ENABLED,
+            rate_limit_per_second=_settings.LOG_RATE_LIMIT_PER_SECOND,
+            rate_limit_burst=_settings.LOG_RATE_LIMIT_BURST,
+            rate_limit_report_interval_seconds=_settings.LOG_RATE_LIMIT_REPORT_INTERVAL_SECONDS,
+            uvicorn_access_enabled=_settings.LOG_UVICORN_ACCESS_ENABLED,
+        ),
+        access_log=_settings.LOG_UVICORN_ACCESS_ENABLED,
     )
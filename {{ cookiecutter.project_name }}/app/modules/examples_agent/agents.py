@@ -1,22 +1,32 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] -%}
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from functools import partial, wraps
 {%- endif %}
 from typing import Annotated
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from typing import Any, TypeVar
+{%- endif %}
 
 from fastapi import Depends
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
 from fastapi_pagination import Params
+from pydantic import BaseModel
 {%- endif %}
 from pydantic_ai import Agent, ModelSettings, RunContext
 from pydantic_ai.models import Model
 from pydantic_ai.models.bedrock import BedrockConverseModel, BedrockModelSettings
+from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models.openai import OpenAIChatModel, OpenAIChatModelSettings
+from pydantic_ai.models.wrapper import WrapperModel
 
-from app.infrastructure.llms.llm_models import get_llm_models_registry, ModelRegistry
+from app.core.config import get_settings, Settings
+from app.infrastructure.llms.llm_models import build_model_with_fallbacks, get_llm_models_registry, ModelRegistry
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
 from app.modules.examples.schemas import Example, ExampleListSorting
 {%- endif %}
-from app.modules.examples_agent.prompts import EXAMPLE_AGENT_SYSTEM_PROMPT
+from app.modules.examples_agent.prompts import EXAMPLE_AGENT_PROMPT_CACHE_KEY, EXAMPLE_AGENT_SYSTEM_PROMPT
 from app.modules.examples_agent.schemas import (
     ExampleAgentDeps,
     ExampleAgentRequest,
@@ -27,14 +37,24 @@ from app.modules.examples_agent.schemas import (
     ListExamplesToolInput,
 {%- endif %}
 )
+{%- if cookiecutter.project_type == "fastapi_db_agent" and cookiecutter.use_otel_observability == "yes" %}
+from app.core.observability.metrics import counters
+{%- endif %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+ToolInputT = TypeVar('ToolInputT', bound=BaseModel)
+ToolOutputT = TypeVar('ToolOutputT')
+{%- endif %}
 
 
 def get_examples_agent(
     payload: ExampleAgentRequest,
     model_registry: Annotated[ModelRegistry, Depends(get_llm_models_registry)],
+    settings: Annotated[Settings, Depends(get_settings)],
 ) -> Agent[ExampleAgentDeps, ExampleAgentResponse]:
     """The FastAPI Dependency for getting examples agent"""
-    return build_examples_agent(model_registry[payload.model])
+    model = build_model_with_fallbacks(model_registry, payload.model, settings.LLM_FALLBACK_MODELS)
+    return build_examples_agent(model)
 
 
 def build_examples_agent(model: Model) -> Agent[ExampleAgentDeps, ExampleAgentResponse]:
@@ -44,38 +64,87 @@ def build_examples_agent(model: Model) -> Agent[ExampleAgentDeps, ExampleAgentRe
         deps_type=ExampleAgentDeps,
         system_prompt=EXAMPLE_AGENT_SYSTEM_PROMPT,
         retries=0,
-        model_settings=_get_examples_agent_model_settings(model),
+        model_settings=get_examples_agent_model_settings(model),
     )
     # Add agent tools here
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
 
     @agent.tool
+    @memoize_per_run
     async def count_examples(ctx: RunContext[ExampleAgentDeps], payload: CountExamplesToolInput) -> int:
-        return await ctx.deps.example_service.count_examples(payload.filters)
+        async with ctx.deps.example_service() as example_service:
+            return await example_service.count_examples(payload.filters)
 
     @agent.tool
+    @memoize_per_run
     async def list_examples(
         ctx: RunContext[ExampleAgentDeps], payload: ListExamplesToolInput
     ) -> list[ExampleAgentToolExample]:
-        examples_page = await ctx.deps.example_service.list_examples(
-            payload.filters,
-            ExampleListSorting(sort_by='name', sort_order='asc'),
-            pagination_params=Params(page=1, size=payload.limit),
-        )
+        async with ctx.deps.example_service() as example_service:
+            examples_page = await example_service.list_examples(
+                payload.filters,
+                ExampleListSorting(sort_by='name', sort_order='asc'),
+                pagination_params=Params(page=1, size=payload.limit),
+            )
         return _build_tool_examples(examples_page.items)
 {%- endif %}
 
     return agent
 
 
-def _get_examples_agent_model_settings(model: Model) -> ModelSettings:
-    settings = ModelSettings(max_tokens=2048, temperature=0.7)
-    if isinstance(model, BedrockConverseModel):
-        return BedrockModelSettings(**settings, bedrock_cache_instructions=True, bedrock_cache_tool_definitions=True)
+class _ExamplesAgentModelSettings(BedrockModelSettings, OpenAIChatModelSettings, total=False):
+    pass
+
+
+def get_examples_agent_model_settings(model: Model) -> ModelSettings:
+    settings = _ExamplesAgentModelSettings(max_tokens=2048, temperature=0.7)
+    # Provider-prefixed settings are ignored by other providers, so a mixed fallback chain can share them
+    models = model.models if isinstance(model, FallbackModel) else [model]
+    # Health tracking and record/replay wrap provider models, the caching hints still have to match the real provider
+    models = [_unwrap_model(chained_model) for chained_model in models]
+    if any(isinstance(chained_model, BedrockConverseModel) for chained_model in models):
+        settings['bedrock_cache_instructions'] = True
+        settings['bedrock_cache_tool_definitions'] = True
+    if any(isinstance(chained_model, OpenAIChatModel) for chained_model in models):
+        settings['openai_prompt_cache_key'] = EXAMPLE_AGENT_PROMPT_CACHE_KEY
     return settings
+
+
+def _unwrap_model(model: Model) -> Model:
+    while isinstance(model, WrapperModel):
+        model = model.wrapped
+    return model
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
 
 
+def memoize_per_run(
+    tool: Callable[[RunContext[ExampleAgentDeps], ToolInputT], Coroutine[Any, Any, ToolOutputT]],
+) -> Callable[[RunContext[ExampleAgentDeps], ToolInputT], Awaitable[ToolOutputT]]:
+    """Reuse the result of an identical earlier tool call of the run, even while that call is still in flight."""
+
+    @wraps(tool)
+    async def wrapper(ctx: RunContext[ExampleAgentDeps], payload: ToolInputT) -> ToolOutputT:
+        key = f'{ctx.tool_name}:{payload.model_dump_json()}'
+        result = ctx.deps.tool_results.get(key)
+        if result is None:
+            result = ctx.deps.tool_results[key] = asyncio.ensure_future(tool(ctx, payload))
+            result.add_done_callback(partial(_forget_failed_tool_call, ctx.deps.tool_results, key))
+{%- if cookiecutter.use_otel_observability == "yes" %}
+        else:
+            counters.agent_tool_memo_hits_total.labels(tool=str(ctx.tool_name)).inc()
+{%- endif %}
+        # Shielded so a cancelled caller, e.g. a losing hedged run, does not cancel the call for the others
+        return await asyncio.shield(result)
+
+    return wrapper
+
+
+def _forget_failed_tool_call(tool_results: dict[str, asyncio.Task[Any]], key: str, task: asyncio.Task[Any]) -> None:
+    """A failed or cancelled call is not reused, so an identical later call of the run tries again."""
+    if (task.cancelled() or task.exception() is not None) and tool_results.get(key) is task:
+        del tool_results[key]
+
+
 def _build_tool_examples(examples: Sequence[Example]) -> list[ExampleAgentToolExample]:
     return [
         ExampleAgentToolExample(
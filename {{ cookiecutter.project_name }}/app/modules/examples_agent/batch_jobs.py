@@ -0,0 +1,70 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from collections import defaultdict, OrderedDict
+from functools import lru_cache
+from uuid import UUID, uuid4
+
+from app.core.config import get_settings
+from app.core.enums import AIModelName
+from app.core.exceptions import ServiceUnavailableError
+from app.modules.examples_agent.schemas import ExampleAgentBatchJob
+
+
+class ExampleAgentBatchJobs:
+    """In-memory batch jobs of this process: they do not survive a restart and are not shared between workers.
+
+    At most `max_running_jobs` run at once and the items of all of them share `concurrency_per_model` calls per model.
+    """
+
+    def __init__(self, max_stored_jobs: int, max_running_jobs: int, concurrency_per_model: int) -> None:
+        self._max_stored_jobs = max_stored_jobs
+        self._max_running_jobs = max_running_jobs
+        self._jobs: OrderedDict[UUID, ExampleAgentBatchJob] = OrderedDict()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._model_semaphores: defaultdict[AIModelName, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(concurrency_per_model)
+        )
+
+    def create(self, total: int) -> ExampleAgentBatchJob:
+        running = sum(job.status == 'running' for job in self._jobs.values())
+        if running >= self._max_running_jobs:
+            raise ServiceUnavailableError('Too many batch jobs are running. Please retry later.')
+        job = ExampleAgentBatchJob(id=uuid4(), status='running', total=total)
+        self._jobs[job.id] = job
+        self._evict_completed()
+        return job
+
+    def get(self, job_id: UUID) -> ExampleAgentBatchJob | None:
+        return self._jobs.get(job_id)
+
+    def track(self, task: asyncio.Task[None]) -> None:
+        """Keep a strong reference to the job task, the event loop only holds weak ones."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def model_semaphore(self, model: AIModelName) -> asyncio.Semaphore:
+        """Bounds the calls all batch jobs of this process make to `model` at the same time."""
+        return self._model_semaphores[model]
+
+    async def stop(self) -> None:
+        """Cancel the running jobs and wait for them to finish, so none is left behind on shutdown."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _evict_completed(self) -> None:
+        completed = [job_id for job_id, job in self._jobs.items() if job.status == 'completed']
+        for job_id in completed[: max(len(self._jobs) - self._max_stored_jobs, 0)]:
+            del self._jobs[job_id]
+
+
+@lru_cache
+def get_example_agent_batch_jobs() -> ExampleAgentBatchJobs:
+    settings = get_settings()
+    return ExampleAgentBatchJobs(
+        max_stored_jobs=settings.AGENT_BATCH_MAX_STORED_JOBS,
+        max_running_jobs=settings.AGENT_BATCH_MAX_RUNNING_JOBS,
+        concurrency_per_model=settings.AGENT_BATCH_CONCURRENCY_PER_MODEL,
+    )
+{%- endif %}
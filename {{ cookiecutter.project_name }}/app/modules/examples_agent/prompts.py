@@ -1,5 +1,9 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+# Providers cache the longest identical request prefix (system prompt, then tool definitions), so keep the
+# system prompt static: anything request-specific belongs in the user prompt.
+EXAMPLE_AGENT_PROMPT_CACHE_KEY = 'examples-agent'
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
 EXAMPLE_AGENT_SYSTEM_PROMPT = """
 You are a read-only assistant for an examples inventory API.
 
@@ -19,6 +23,7 @@ Filter normalization rules:
 - "before 2020" means created_to=2019-12-31
 """.strip()
 {%- else %}
+
 EXAMPLE_AGENT_SYSTEM_PROMPT = """
 You are a helpful assistant. Answer user questions concisely and factually.
 If you don't know the answer, say so. Do not make up information.
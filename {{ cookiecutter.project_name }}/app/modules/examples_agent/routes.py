@@ -1,12 +1,25 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic_ai import Agent
 
 from app.modules.examples_agent.agents import get_examples_agent
-from app.modules.examples_agent.schemas import ExampleAgentDeps, ExampleAgentRequest, ExampleAgentResponse
+from app.modules.examples_agent.schemas import (
+    ExampleAgentBatchJob,
+    ExampleAgentBatchRequest,
+    ExampleAgentDeps,
+    ExampleAgentRequest,
+    ExampleAgentResponse,
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+    ExampleAgentThread,
+{%- endif %}
+)
 from app.modules.examples_agent.service import ExampleAgentService
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from app.modules.examples_agent.service import ExampleAgentThreadService
+{%- endif %}
 
 router = APIRouter(tags=['Examples Agent'])
 
@@ -19,4 +32,42 @@ async def create_agent_response(
 ) -> ExampleAgentResponse:
     answer = await service.answer(payload, agent)
     return answer
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+@router.post('/agents/examples/threads', status_code=201)
+async def create_agent_thread(service: Annotated[ExampleAgentThreadService, Depends()]) -> ExampleAgentThread:
+    thread = await service.create_thread()
+    return thread
+
+
+@router.post('/agents/examples/threads/{thread_id}/messages')
+async def create_agent_thread_response(
+    thread_id: int,
+    payload: ExampleAgentRequest,
+    service: Annotated[ExampleAgentService, Depends()],
+    agent: Annotated[Agent[ExampleAgentDeps, ExampleAgentResponse], Depends(get_examples_agent)],
+) -> ExampleAgentResponse:
+    answer = await service.answer_in_thread(thread_id, payload, agent)
+    return answer
+{%- endif %}
+
+
+@router.post('/agents/examples/conversations/batches', status_code=status.HTTP_202_ACCEPTED)
+async def create_agent_batch(
+    payload: ExampleAgentBatchRequest,
+    service: Annotated[ExampleAgentService, Depends()],
+) -> ExampleAgentBatchJob:
+    return service.submit_batch(payload)
+
+
+@router.get('/agents/examples/conversations/batches/{job_id}')
+async def get_agent_batch(
+    job_id: UUID,
+    service: Annotated[ExampleAgentService, Depends()],
+) -> ExampleAgentBatchJob:
+    job = service.get_batch(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Batch(id={job_id}) not found')
+    return job
 {%- endif %}
@@ -7,16 +7,29 @@ from app.modules.examples_agent.schemas.schemas_agent import (
     ListExamplesToolInput,
 {%- endif %}
 )
-from app.modules.examples_agent.schemas.schemas_api import ExampleAgentRequest, ExampleAgentResponse
+from app.modules.examples_agent.schemas.schemas_api import (
+    ExampleAgentBatchItemResult,
+    ExampleAgentBatchJob,
+    ExampleAgentBatchRequest,
+    ExampleAgentRequest,
+    ExampleAgentResponse,
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+    ExampleAgentThread,
+{%- endif %}
+)
 
 __all__ = [
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
     'CountExamplesToolInput',
 {%- endif %}
+    'ExampleAgentBatchItemResult',
+    'ExampleAgentBatchJob',
+    'ExampleAgentBatchRequest',
     'ExampleAgentDeps',
     'ExampleAgentRequest',
     'ExampleAgentResponse',
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
+    'ExampleAgentThread',
     'ExampleAgentToolExample',
     'ListExamplesToolInput',
 {%- endif %}
@@ -1,9 +1,19 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+{%- endif %}
 from dataclasses import dataclass
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from dataclasses import field
+from typing import Any
+{%- endif %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
 
 from pydantic import BaseModel, Field
 
+from app.infrastructure.db.database import SessionFactory
 from app.modules.examples.schemas import ExampleListFilters
 from app.modules.examples.service import ExampleService
 {%- endif %}
@@ -12,7 +22,15 @@ from app.modules.examples.service import ExampleService
 @dataclass(frozen=True, slots=True)
 class ExampleAgentDeps:
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
-    example_service: ExampleService
+    session_factory: SessionFactory
+    # Tool results of the run keyed by tool name and canonical input JSON, see `memoize_per_run`
+    tool_results: dict[str, asyncio.Task[Any]] = field(default_factory=dict)
+
+    @asynccontextmanager
+    async def example_service(self) -> AsyncGenerator[ExampleService, None]:
+        """Tools of one model turn run concurrently, so each tool call gets its own session."""
+        async with self.session_factory() as session:
+            yield ExampleService(session)
 {%- else %}
     pass
 {%- endif %}
@@ -1,5 +1,14 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from datetime import datetime
+{%- endif %}
+from typing import Literal
+from uuid import UUID
+
 from pydantic import BaseModel, Field
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from pydantic import ConfigDict
+{%- endif %}
 
 from app.core.enums import AIModelName
 
@@ -11,4 +20,30 @@ class ExampleAgentRequest(BaseModel):
 
 class ExampleAgentResponse(BaseModel):
     answer: str = Field(min_length=1)
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+class ExampleAgentThread(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    created_at: datetime
+{%- endif %}
+
+
+class ExampleAgentBatchRequest(BaseModel):
+    items: list[ExampleAgentRequest] = Field(min_length=1, max_length=1_000)
+
+
+class ExampleAgentBatchItemResult(BaseModel):
+    index: int
+    answer: str | None = None
+    error: str | None = None
+
+
+class ExampleAgentBatchJob(BaseModel):
+    id: UUID
+    status: Literal['running', 'completed']
+    total: int
+    results: list[ExampleAgentBatchItemResult] = Field(default_factory=list)
 {%- endif %}
@@ -1,44 +1,311 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from collections.abc import Sequence
+from logging import getLogger
+import time
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
-from typing import Annotated
+from dataclasses import replace
+from itertools import accumulate
+{%- endif %}
+from typing import Annotated, Literal, TypeAlias
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from typing import cast
+{%- endif %}
+from uuid import UUID
 
 from fastapi import Depends
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 {%- endif %}
 from pydantic_ai import Agent
+from pydantic_ai.agent import AgentRunResult
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from pydantic_ai.messages import (
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    ModelRequestPart,
+    SystemPromptPart,
+    UserPromptPart,
+)
+{%- endif %}
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.usage import RunUsage
 
-from app.modules.examples_agent.schemas import ExampleAgentDeps, ExampleAgentRequest, ExampleAgentResponse
+from app.core.config import get_settings, Settings
+from app.core.enums import AIModelName
+from app.infrastructure.llms.llm_models import (
+    build_model_with_fallbacks,
+    get_llm_models_registry,
+    ModelRegistry,
+    resolve_model_name,
+)
+from app.modules.examples_agent.agents import build_examples_agent, get_examples_agent_model_settings
+from app.modules.examples_agent.batch_jobs import ExampleAgentBatchJobs, get_example_agent_batch_jobs
+from app.modules.examples_agent.schemas import (
+    ExampleAgentBatchItemResult,
+    ExampleAgentBatchJob,
+    ExampleAgentBatchRequest,
+    ExampleAgentDeps,
+    ExampleAgentRequest,
+    ExampleAgentResponse,
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+    ExampleAgentThread,
+{%- endif %}
+)
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
-from app.modules.examples.service import ExampleService
+from app.core.exceptions import ConflictError, NotFoundError
+from app.infrastructure.db.database import get_session, get_session_factory, SessionFactory
+from app.infrastructure.db.models.agent_thread import AgentThreadModel
 {%- endif %}
 {%- if cookiecutter.use_otel_observability == "yes" %}
-from app.core.observability.metrics import counters, gauges
-from app.core.observability.metrics.primitives import increment_after, track_inflight
+from app.core.observability.metrics import counters, gauges, histograms
+from app.core.observability.metrics.primitives import track_call
 {%- endif %}
 
+_logger = getLogger(__name__)
 
-class ExampleAgentService:
+HedgedRun: TypeAlias = Literal['primary', 'hedge']
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+# Rough token estimate for serialized messages, good enough for bounding the stored history
+CHARS_PER_TOKEN = 4
+{%- endif %}
+
+
+class ExampleAgentService:
     def __init__(
         self,
-        example_service: Annotated[ExampleService, Depends()],
+        settings: Annotated[Settings, Depends(get_settings)],
+        model_registry: Annotated[ModelRegistry, Depends(get_llm_models_registry)],
+        batch_jobs: Annotated[ExampleAgentBatchJobs, Depends(get_example_agent_batch_jobs)],
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+        session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
+{%- endif %}
     ) -> None:
-        self._example_service = example_service
+        self._settings = settings
+        self._model_registry = model_registry
+        self._batch_jobs = batch_jobs
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+        self._session_factory = session_factory
 {%- endif %}
 
-{%- if cookiecutter.use_otel_observability == "yes" %}
-    @track_inflight(gauges.agent_inflight_requests)
-    @increment_after(counters.agent_requests_total, success_only=False)
-{%- endif %}
     async def answer(
         self,
         payload: ExampleAgentRequest,
         agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
     ) -> ExampleAgentResponse:
+        result = await self._run(payload, agent)
+        return result.output
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+    async def answer_in_thread(
+        self,
+        thread_id: int,
+        payload: ExampleAgentRequest,
+        agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> ExampleAgentResponse:
+        # Short-lived sessions, so no connection is held while the model is thinking
+        async with self._session_factory() as session:
+            history, version = await ExampleAgentThreadService(session).get_messages(thread_id)
+        result = await self._run(payload, agent, message_history=history)
+        messages = compact_message_history(result.all_messages(), self._settings.AGENT_THREAD_HISTORY_TOKEN_BUDGET)
+        async with self._session_factory() as session:
+            await ExampleAgentThreadService(session).save_messages(thread_id, messages, version)
+        return result.output
+{%- endif %}
+
+    def submit_batch(self, payload: ExampleAgentBatchRequest) -> ExampleAgentBatchJob:
+        job = self._batch_jobs.create(total=len(payload.items))
+        self._batch_jobs.track(asyncio.create_task(self._run_batch(job, payload.items)))
+        return job
+
+    def get_batch(self, job_id: UUID) -> ExampleAgentBatchJob | None:
+        return self._batch_jobs.get(job_id)
+{% if cookiecutter.use_otel_observability == "yes" %}
+    @track_call(inflight=gauges.agent_inflight_requests, completed=counters.agent_requests_total, success_only=False)
+{%- endif %}
+    async def _run(
+        self,
+        payload: ExampleAgentRequest,
+        agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+        message_history: Sequence[ModelMessage] | None = None,
+    ) -> AgentRunResult[ExampleAgentResponse]:
 {%- if cookiecutter.project_type == "fastapi_db_agent" %}
-        deps = ExampleAgentDeps(example_service=self._example_service)
+        deps = ExampleAgentDeps(session_factory=self._session_factory)
 {%- else %}
         deps = ExampleAgentDeps()
 {%- endif %}
-        result = await agent.run(payload.question, deps=deps)
-        return result.output
+        started_at = time.perf_counter()
+        if self._settings.AGENT_HEDGING_ENABLED:
+            requested_model_name, result = await self._run_hedged(payload, agent, deps, message_history)
+        else:
+            result = await agent.run(payload.question, deps=deps, message_history=message_history)
+            requested_model_name = payload.model
+        # A fallback model may have answered instead of the requested one
+        model_name = resolve_model_name(self._model_registry, result.response.model_name) or requested_model_name
+        self._record_usage(model_name, result.usage, time.perf_counter() - started_at)
+        return result
+
+    async def _run_batch(self, job: ExampleAgentBatchJob, items: list[ExampleAgentRequest]) -> None:
+        """Answer all batch items, sharing AGENT_BATCH_CONCURRENCY_PER_MODEL calls per model with the other jobs."""
+        agents: dict[AIModelName, Agent[ExampleAgentDeps, ExampleAgentResponse]] = {}
+        for item in items:
+            if item.model not in agents:
+                model = build_model_with_fallbacks(self._model_registry, item.model, self._settings.LLM_FALLBACK_MODELS)
+                agents[item.model] = build_examples_agent(model)
+
+        async def answer_item(index: int, item: ExampleAgentRequest) -> None:
+            async with self._batch_jobs.model_semaphore(item.model):
+                try:
+                    response = await self.answer(item, agents[item.model])
+                except Exception as exc:
+                    _logger.exception('Batch %s item %s failed', job.id, index)
+                    job.results.append(ExampleAgentBatchItemResult(index=index, error=type(exc).__name__))
+                else:
+                    job.results.append(ExampleAgentBatchItemResult(index=index, answer=response.answer))
+
+        try:
+            await asyncio.gather(*(answer_item(index, item) for index, item in enumerate(items)))
+        finally:
+            job.status = 'completed'
+
+    async def _run_hedged(
+        self,
+        payload: ExampleAgentRequest,
+        agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+        deps: ExampleAgentDeps,
+        message_history: Sequence[ModelMessage] | None,
+    ) -> tuple[AIModelName, AgentRunResult[ExampleAgentResponse]]:
+        """Race a second model against a slow primary run and return whichever succeeds first."""
+        primary = asyncio.create_task(agent.run(payload.question, deps=deps, message_history=message_history))
+        runs: dict[asyncio.Task[AgentRunResult[ExampleAgentResponse]], HedgedRun] = {primary: 'primary'}
+        try:
+            done, _ = await asyncio.wait(runs, timeout=self._settings.AGENT_HEDGING_DELAY_SECONDS)
+            if not done:
+                hedge = self._run_hedge(payload.question, agent, deps, message_history)
+                runs[asyncio.create_task(hedge)] = 'hedge'
+
+            pending = set(runs)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None:
+                    continue
+                if len(runs) > 1:
+                    self._record_hedge_winner(runs[winner])
+                model_name = payload.model if runs[winner] == 'primary' else self._settings.AGENT_HEDGING_MODEL
+                return model_name, winner.result()
+            return payload.model, primary.result()
+        finally:
+            for task in runs:
+                task.cancel()
+
+    async def _run_hedge(
+        self,
+        question: str,
+        agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+        deps: ExampleAgentDeps,
+        message_history: Sequence[ModelMessage] | None,
+    ) -> AgentRunResult[ExampleAgentResponse]:
+        # Tools open their own sessions, so the hedge can safely share deps with the primary run
+        model = self._model_registry[self._settings.AGENT_HEDGING_MODEL]
+        # The agent settings only carry the caching hints of the primary model
+        model_settings = get_examples_agent_model_settings(model)
+        return await agent.run(
+            question, deps=deps, model=model, model_settings=model_settings, message_history=message_history
+        )
+
+    def _record_hedge_winner(self, winner: HedgedRun) -> None:
+        _logger.debug('Hedged agent request won by %s run', winner)
+{%- if cookiecutter.use_otel_observability == "yes" %}
+        counters.agent_hedged_requests_total.labels(winner=winner).inc()
+{%- endif %}
+
+    @staticmethod
+    def _record_usage(model_name: AIModelName, usage: RunUsage, duration: float) -> None:
+        _logger.debug(
+            'Agent run on %s took %.2fs: requests=%s tool_calls=%s input=%s output=%s cache_read=%s tokens',
+            model_name,
+            duration,
+            usage.requests,
+            usage.tool_calls,
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.cache_read_tokens,
+        )
+{%- if cookiecutter.use_otel_observability == "yes" %}
+        counters.agent_tokens_total.labels(model=model_name, kind='input').inc(usage.input_tokens)
+        counters.agent_tokens_total.labels(model=model_name, kind='output').inc(usage.output_tokens)
+        counters.agent_tokens_total.labels(model=model_name, kind='cache_read').inc(usage.cache_read_tokens)
+        counters.agent_tokens_total.labels(model=model_name, kind='cache_write').inc(usage.cache_write_tokens)
+        counters.agent_model_requests_total.labels(model=model_name).inc(usage.requests)
+        counters.agent_tool_calls_total.labels(model=model_name).inc(usage.tool_calls)
+        histograms.agent_run_duration_seconds.labels(model=model_name).observe(duration)
+{%- endif %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+class ExampleAgentThreadService:
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_session)]) -> None:
+        self._session = session
+
+    async def create_thread(self) -> ExampleAgentThread:
+        thread = await self._session.scalar(insert(AgentThreadModel).returning(AgentThreadModel))
+        return ExampleAgentThread.model_validate(thread)
+
+    async def get_messages(self, thread_id: int) -> tuple[list[ModelMessage], int]:
+        """Message history of the thread, with the version to pass back when saving the next turn."""
+        row = (
+            await self._session.execute(
+                select(AgentThreadModel.messages, AgentThreadModel.version).filter(AgentThreadModel.id == thread_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise NotFoundError(f'AgentThread(id={thread_id}) not found')
+        return ModelMessagesTypeAdapter.validate_python(row.messages), row.version
+
+    async def save_messages(self, thread_id: int, messages: Sequence[ModelMessage], version: int) -> None:
+        """Save the history of a turn, unless another turn was saved since `version` was read."""
+        query = (
+            update(AgentThreadModel)
+            .filter(AgentThreadModel.id == thread_id, AgentThreadModel.version == version)
+            .values(
+                messages=ModelMessagesTypeAdapter.dump_python(list(messages), mode='json'),
+                version=AgentThreadModel.version + 1,
+            )
+            .returning(AgentThreadModel.id)
+        )
+        if await self._session.scalar(query) is not None:
+            return
+        if await self._session.scalar(select(AgentThreadModel.id).filter(AgentThreadModel.id == thread_id)) is None:
+            raise NotFoundError(f'AgentThread(id={thread_id}) not found')
+        raise ConflictError(f'AgentThread(id={thread_id}) was updated by another message. Please retry.')
+
+
+def compact_message_history(messages: list[ModelMessage], token_budget: int) -> list[ModelMessage]:
+    """Drop the oldest turns until the history fits the token budget, always keeping the system prompt and last turn."""
+    turn_starts = [index for index, message in enumerate(messages) if _is_turn_start(message)]
+    if not turn_starts:
+        return messages
+
+    sizes = [len(ModelMessagesTypeAdapter.dump_json([message])) // CHARS_PER_TOKEN for message in messages]
+    tokens_from = list(accumulate(reversed(sizes)))[::-1]
+    start = next((index for index in turn_starts if tokens_from[index] <= token_budget), turn_starts[-1])
+    if start == 0:
+        return messages
+
+    # pydantic-ai only adds the system prompt to a run without history, so it has to survive compaction
+    system_parts = [part for part in _request_parts(messages[0]) if isinstance(part, SystemPromptPart)]
+    first_kept = cast(ModelRequest, messages[start])
+    return [replace(first_kept, parts=[*system_parts, *first_kept.parts]), *messages[start + 1 :]]
+
+
+def _is_turn_start(message: ModelMessage) -> bool:
+    return any(isinstance(part, UserPromptPart) for part in _request_parts(message))
+
+
+def _request_parts(message: ModelMessage) -> Sequence[ModelRequestPart]:
+    return message.parts if isinstance(message, ModelRequest) else []
+{%- endif %}
 {%- endif %}
@@ -0,0 +1,104 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import suppress
+from functools import lru_cache
+from logging import getLogger
+import time
+from typing import TypeAlias
+
+from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
+from openai import AsyncOpenAI
+
+from app.core.config import get_settings, Settings
+from app.core.dependency_health import get_dependency_health_tracker
+from app.infrastructure.llms.provider_bedrock import get_bedrock_client
+from app.infrastructure.llms.provider_openai import get_openai_client, get_openai_http_client
+from app.modules.health_checks.schemas import LivenessStatus
+from app.modules.health_checks.service import check_bedrock_status, check_openai_status, resolve_dependency_status
+
+_logger = getLogger(__name__)
+
+DependencyCheck: TypeAlias = Callable[[], Awaitable[LivenessStatus]]
+
+
+class ReadinessProber:
+    """Runs dependency checks on an interval so readiness probes are answered from the last result.
+
+    A result older than `max_staleness_seconds` (the background loop is not running or is stuck) is refreshed inline,
+    with concurrent probes sharing a single refresh.
+    """
+
+    def __init__(
+        self, checks: Mapping[str, DependencyCheck], interval_seconds: float, max_staleness_seconds: float
+    ) -> None:
+        self._checks = checks
+        self._interval_seconds = interval_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._statuses: dict[str, LivenessStatus] = {}
+        self._refreshed_at: float | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def get_statuses(self) -> dict[str, LivenessStatus]:
+        if self._is_stale():
+            async with self._refresh_lock:
+                if self._is_stale():
+                    await self.refresh()
+        return self._statuses
+
+    async def refresh(self) -> None:
+        statuses = await asyncio.gather(*(check() for check in self._checks.values()))
+        self._statuses = dict(zip(self._checks, statuses, strict=True))
+        self._refreshed_at = time.monotonic()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _is_stale(self) -> bool:
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at > self._max_staleness_seconds
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            try:
+                async with self._refresh_lock:
+                    await self.refresh()
+            except Exception as exc:
+                _logger.error('Readiness probe refresh failed', exc_info=exc)
+            await asyncio.sleep(self._interval_seconds)
+
+
+def build_llm_readiness_prober(
+    bedrock_client: BedrockRuntimeClient, openai_client: AsyncOpenAI, settings: Settings
+) -> ReadinessProber:
+    return ReadinessProber(
+        checks={
+            'bedrock': lambda: resolve_dependency_status(
+                get_dependency_health_tracker('bedrock'),
+                lambda: check_bedrock_status(bedrock_client, settings.BEDROCK_MODEL_HAIKU_4_5),
+            ),
+            'openai': lambda: resolve_dependency_status(
+                get_dependency_health_tracker('openai'), lambda: check_openai_status(openai_client)
+            ),
+        },
+        interval_seconds=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+        max_staleness_seconds=settings.HEALTH_PROBE_MAX_STALENESS_SECONDS,
+    )
+
+
+@lru_cache
+def get_llm_readiness_prober() -> ReadinessProber:
+    settings = get_settings()
+    # Keyword arguments, as FastAPI passes them, so the probes go through the cached clients requests use
+    bedrock_client = get_bedrock_client(settings=settings)
+    openai_client = get_openai_client(settings=settings, http_client=get_openai_http_client(settings=settings))
+    return build_llm_readiness_prober(bedrock_client, openai_client, settings)
+{%- endif %}
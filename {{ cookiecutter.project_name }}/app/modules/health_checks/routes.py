@@ -1,17 +1,16 @@
-{%- if cookiecutter.project_type != "fastapi_slim" %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
 import asyncio
 {%- endif %}
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Response, status
-{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
-from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
-from openai import AsyncOpenAI
-{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 from sqlalchemy.ext.asyncio import AsyncSession
 {%- endif %}
 
+{% if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] -%}
+from app.modules.health_checks.prober import get_llm_readiness_prober, ReadinessProber
+{% endif -%}
 from app.modules.health_checks.schemas import (
     HealthCheckLiveResponse,
     HealthCheckReadyDependencies,
@@ -19,23 +18,22 @@ from app.modules.health_checks.schemas import (
 )
 {%- if cookiecutter.project_type != "fastapi_slim" %}
 from app.modules.health_checks.service import (
-{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
-    check_bedrock_status,
-    check_openai_status,
-{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
     check_database_status,
 {%- endif %}
+    resolve_dependency_status,
     resolve_readiness_status,
 )
 {%- endif %}
 from app.core.config import get_settings, Settings
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
-from app.infrastructure.db.database import get_session
-{%- endif %}
-{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
-from app.infrastructure.llms.provider_bedrock import get_bedrock_client
-from app.infrastructure.llms.provider_openai import get_openai_client
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.dependency_health import DependencyHealthTracker
+from app.infrastructure.db.database import (
+    get_database_circuit_breaker,
+    get_database_health_tracker,
+    get_unguarded_session,
+)
 {%- endif %}
 
 router = APIRouter(tags=['Health check'])
@@ -60,10 +58,14 @@ async def health_check_readiness(
 @router.get('/health/ready')
 async def health_check_readiness(
     response: Response,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_unguarded_session)],
+    database_health: Annotated[DependencyHealthTracker, Depends(get_database_health_tracker)],
+    database_breaker: Annotated[CircuitBreaker, Depends(get_database_circuit_breaker)],
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> HealthCheckReadyResponse:
-    db_status = await check_database_status(session)
+    db_status = await resolve_dependency_status(
+        database_health, lambda: check_database_status(session), database_breaker
+    )
 
     ready_response = HealthCheckReadyResponse(
         version=settings.PROJECT_VERSION,
@@ -78,19 +80,15 @@ async def health_check_readiness(
 @router.get('/health/ready')
 async def health_check_readiness(
     response: Response,
-    bedrock_client: Annotated[BedrockRuntimeClient, Depends(get_bedrock_client)],
-    openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
+    llm_prober: Annotated[ReadinessProber, Depends(get_llm_readiness_prober)],
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> HealthCheckReadyResponse:
-    bedrock_status, openai_status = await asyncio.gather(
-        check_bedrock_status(bedrock_client, settings.BEDROCK_MODEL_HAIKU_4_5),
-        check_openai_status(openai_client),
-    )
+    llm_statuses = await llm_prober.get_statuses()
 
     ready_response = HealthCheckReadyResponse(
         version=settings.PROJECT_VERSION,
-        status=resolve_readiness_status(bedrock_status, openai_status),
-        dependencies=HealthCheckReadyDependencies(bedrock=bedrock_status, openai=openai_status),
+        status=resolve_readiness_status(*llm_statuses.values()),
+        dependencies=HealthCheckReadyDependencies.model_validate(llm_statuses),
     )
     if ready_response.status == 'NOT_READY':
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -100,21 +98,21 @@ async def health_check_readiness(
 @router.get('/health/ready')
 async def health_check_readiness(
     response: Response,
-    session: Annotated[AsyncSession, Depends(get_session)],
-    bedrock_client: Annotated[BedrockRuntimeClient, Depends(get_bedrock_client)],
-    openai_client: Annotated[AsyncOpenAI, Depends(get_openai_client)],
+    session: Annotated[AsyncSession, Depends(get_unguarded_session)],
+    database_health: Annotated[DependencyHealthTracker, Depends(get_database_health_tracker)],
+    database_breaker: Annotated[CircuitBreaker, Depends(get_database_circuit_breaker)],
+    llm_prober: Annotated[ReadinessProber, Depends(get_llm_readiness_prober)],
     settings: Annotated[Settings, Depends(get_settings)],
 ) -> HealthCheckReadyResponse:
-    db_status, bedrock_status, openai_status = await asyncio.gather(
-        check_database_status(session),
-        check_bedrock_status(bedrock_client, settings.BEDROCK_MODEL_HAIKU_4_5),
-        check_openai_status(openai_client),
+    db_status, llm_statuses = await asyncio.gather(
+        resolve_dependency_status(database_health, lambda: check_database_status(session), database_breaker),
+        llm_prober.get_statuses(),
     )
 
     ready_response = HealthCheckReadyResponse(
         version=settings.PROJECT_VERSION,
-        status=resolve_readiness_status(db_status, bedrock_status, openai_status),
-        dependencies=HealthCheckReadyDependencies(database=db_status, bedrock=bedrock_status, openai=openai_status),
+        status=resolve_readiness_status(db_status, *llm_statuses.values()),
+        dependencies=HealthCheckReadyDependencies.model_validate({'database': db_status, **llm_statuses}),
     )
     if ready_response.status == 'NOT_READY':
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -2,6 +2,7 @@
 {%- if cookiecutter.project_type != "fastapi_slim" %}
 import asyncio
 {%- endif %}
+from collections.abc import Awaitable, Callable
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 from contextlib import suppress
 {%- endif %}
@@ -18,6 +19,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 {%- endif %}
 
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.dependency_health import DependencyHealthTracker
 from app.modules.health_checks.schemas import LivenessStatus, ReadinessStatus
 
 _logger = logging.getLogger(__name__)
@@ -57,6 +60,23 @@ async def check_openai_status(openai_client: AsyncOpenAI) -> LivenessStatus:
 {%- endif %}
 
 
+async def resolve_dependency_status(
+    tracker: DependencyHealthTracker,
+    probe: Callable[[], Awaitable[LivenessStatus]],
+    breaker: CircuitBreaker | None = None,
+) -> LivenessStatus:
+    """Status from the error rate of real calls, or from an active probe while traffic is too low to judge.
+
+    Always DOWN while the dependency's circuit breaker rejects calls.
+    """
+    if breaker is not None and breaker.is_rejecting:
+        return 'DOWN'
+    is_healthy = tracker.is_healthy()
+    if is_healthy is None:
+        return await probe()
+    return 'UP' if is_healthy else 'DOWN'
+
+
 def resolve_readiness_status(*statuses: LivenessStatus) -> ReadinessStatus:
     if 'DOWN' in statuses:
         return 'NOT_READY'
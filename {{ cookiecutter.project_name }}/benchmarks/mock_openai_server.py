@@ -0,0 +1,159 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+"""OpenAI-compatible stand-in for benchmarking the agent stack without network access or provider costs.
+
+Point the app at it with `OPENAI_BASE_URL=http://127.0.0.1:8100/v1`. Chat completions call every function tool
+once, then answer through the output tool (or plain text), with configurable latency and token rate.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+import json
+import time
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import JsonValue
+import uvicorn
+
+# pydantic-ai names the tools it uses for structured output `final_result`, `final_result_<type>`, ...
+OUTPUT_TOOL_PREFIX = 'final_result'
+CHARS_PER_TOKEN = 4
+FILLER_WORD = 'lorem '
+
+
+def create_mock_openai_app(
+    latency_seconds: float = 0.2, tokens_per_second: float = 200.0, output_tokens: int = 40
+) -> FastAPI:
+    """Build the mock app; `latency_seconds` is the time to first token, the rest streams at `tokens_per_second`."""
+    app = FastAPI(title='Mock OpenAI')
+
+    @app.post('/v1/chat/completions', response_model=None)
+    async def create_chat_completion(request: Request) -> JSONResponse | StreamingResponse:
+        body = await request.json()
+        message = _build_assistant_message(body, output_tokens)
+        usage = _build_usage(body, message)
+        generation_seconds = usage['completion_tokens'] / tokens_per_second
+        if body.get('stream'):
+            return StreamingResponse(
+                _stream_chunks(body['model'], message, usage, latency_seconds, generation_seconds),
+                media_type='text/event-stream',
+            )
+
+        await asyncio.sleep(latency_seconds + generation_seconds)
+        finish_reason = 'tool_calls' if message.get('tool_calls') else 'stop'
+        choice = {'index': 0, 'message': message, 'finish_reason': finish_reason, 'logprobs': None}
+        return JSONResponse(_build_completion(body['model'], 'chat.completion', [choice], usage))
+
+    return app
+
+
+def _build_assistant_message(body: dict[str, Any], output_tokens: int) -> dict[str, Any]:
+    tools = [tool['function'] for tool in body.get('tools', []) if tool.get('type') == 'function']
+    function_tools = [tool for tool in tools if not tool['name'].startswith(OUTPUT_TOOL_PREFIX)]
+    output_tools = [tool for tool in tools if tool['name'].startswith(OUTPUT_TOOL_PREFIX)]
+    tools_already_called = any(message.get('role') == 'tool' for message in body.get('messages', []))
+
+    if function_tools and not tools_already_called:
+        return {'role': 'assistant', 'content': None, 'tool_calls': [_build_tool_call(tool) for tool in function_tools]}
+    if output_tools:
+        return {'role': 'assistant', 'content': None, 'tool_calls': [_build_tool_call(output_tools[0], output_tokens)]}
+    return {'role': 'assistant', 'content': (FILLER_WORD * output_tokens).strip()}
+
+
+def _build_tool_call(tool: dict[str, Any], output_tokens: int = 1) -> dict[str, Any]:
+    arguments = _sample_from_schema(tool.get('parameters') or {}, output_tokens)
+    return {
+        'id': f'call_{uuid4().hex[:24]}',
+        'type': 'function',
+        'function': {'name': tool['name'], 'arguments': json.dumps(arguments)},
+    }
+
+
+def _sample_from_schema(schema: dict[str, Any], output_tokens: int) -> JsonValue:
+    """Smallest value satisfying a JSON schema: required properties only, strings padded to `output_tokens`."""
+    match schema.get('type'):
+        case 'object':
+            properties = schema.get('properties', {})
+            return {name: _sample_from_schema(properties[name], output_tokens) for name in schema.get('required', [])}
+        case 'string':
+            return (FILLER_WORD * output_tokens).strip()
+        case 'integer' | 'number':
+            return schema.get('minimum', 1)
+        case 'boolean':
+            return False
+        case 'array':
+            return []
+        case _:
+            return {}
+
+
+def _build_usage(body: dict[str, Any], message: dict[str, Any]) -> dict[str, int]:
+    prompt_tokens = len(json.dumps(body.get('messages', []))) // CHARS_PER_TOKEN
+    completion_tokens = max(len(json.dumps(message)) // CHARS_PER_TOKEN, 1)
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+    }
+
+
+def _build_completion(model: str, obj: str, choices: list[dict[str, Any]], usage: dict[str, int] | None) -> dict:
+    return {
+        'id': f'chatcmpl-{uuid4().hex}',
+        'object': obj,
+        'created': int(time.time()),
+        'model': model,
+        'choices': choices,
+        'usage': usage,
+    }
+
+
+async def _stream_chunks(
+    model: str,
+    message: dict[str, Any],
+    usage: dict[str, int],
+    latency_seconds: float,
+    generation_seconds: float,
+) -> AsyncIterator[str]:
+    await asyncio.sleep(latency_seconds)
+    if message.get('tool_calls'):
+        tool_calls = [{'index': index, **tool_call} for index, tool_call in enumerate(message['tool_calls'])]
+        deltas = [{'role': 'assistant', 'tool_calls': tool_calls}]
+        finish_reason = 'tool_calls'
+    else:
+        words = message['content'].split(' ')
+        deltas = [{'role': 'assistant', 'content': f'{word} '} for word in words]
+        finish_reason = 'stop'
+
+    delay = generation_seconds / len(deltas)
+    for delta in deltas:
+        await asyncio.sleep(delay)
+        choice = {'index': 0, 'delta': delta, 'finish_reason': None, 'logprobs': None}
+        yield _sse(_build_completion(model, 'chat.completion.chunk', [choice], None))
+    choice = {'index': 0, 'delta': {}, 'finish_reason': finish_reason, 'logprobs': None}
+    yield _sse(_build_completion(model, 'chat.completion.chunk', [choice], usage))
+    yield 'data: [DONE]\n\n'
+
+
+def _sse(payload: dict[str, Any]) -> str:
+    return f'data: {json.dumps(payload)}\n\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds until the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0)
+    parser.add_argument('--output-tokens', type=int, default=40, help='Length of generated answers')
+    args = parser.parse_args()
+    uvicorn.run(
+        create_mock_openai_app(args.latency, args.tokens_per_second, args.output_tokens),
+        host=args.host,
+        port=args.port,
+        log_level='warning',
+    )
+{%- endif %}
@@ -0,0 +1,122 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+"""Benchmark `/v1/agents/examples/conversations` against the mock OpenAI server, with no network access needed.
+
+By default the full FastAPI app runs in-process, lifespan included; pass `--app-url` to drive an already running app
+instead (start it with `OPENAI_BASE_URL=http://127.0.0.1:<mock-port>/v1`). Only OpenAI models are served by the mock.
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+The mock calls every tool of the agent and the tools query the database, so `DATABASE_URL` must point to a running
+Postgres (e.g. `make up-dependencies`); the in-process app migrates it on startup like the real one.
+{%- endif %}
+"""
+
+import argparse
+import asyncio
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
+import os
+import statistics
+import sys
+import time
+
+from httpx import ASGITransport, AsyncClient
+import uvicorn
+
+from app.core.config import get_settings
+from app.main import create_app
+from benchmarks.mock_openai_server import create_mock_openai_app
+
+CONVERSATIONS_PATH = '/v1/agents/examples/conversations'
+REQUEST_TIMEOUT_SECONDS = 300
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    latencies: list[float]
+    errors: int
+    duration_seconds: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.duration_seconds
+
+    def percentile(self, percent: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100, method='inclusive')[percent - 1]
+
+    def report(self) -> str:
+        return (
+            f'requests: {len(self.latencies)} ok, {self.errors} failed in {self.duration_seconds:.2f}s\n'
+            f'throughput: {self.requests_per_second:.1f} req/s\n'
+            f'latency: p50 {self.percentile(50) * 1000:.0f}ms, p99 {self.percentile(99) * 1000:.0f}ms\n'
+        )
+
+
+async def run_benchmark(client: AsyncClient, requests: int, concurrency: int, model: str) -> BenchmarkResult:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def send(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.post(
+                CONVERSATIONS_PATH, json={'model': model, 'question': f'How many examples do we have? ({index})'}
+            )
+            if response.is_success:
+                latencies.append(time.perf_counter() - started_at)
+            else:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send(index) for index in range(requests)))
+    return BenchmarkResult(latencies=latencies, errors=errors, duration_seconds=time.perf_counter() - started_at)
+
+
+async def main(args: argparse.Namespace) -> None:
+    mock_app = create_mock_openai_app(args.latency, args.tokens_per_second, args.output_tokens)
+    mock_server = uvicorn.Server(uvicorn.Config(mock_app, host='127.0.0.1', port=args.mock_port, log_level='warning'))
+    mock_task = asyncio.create_task(mock_server.serve())
+    while not mock_server.started:  # noqa: ASYNC110 - uvicorn exposes no startup event
+        await asyncio.sleep(0.01)
+
+    app_lifespan: AbstractAsyncContextManager[object] = nullcontext()
+    if args.app_url:
+        client = AsyncClient(base_url=args.app_url, timeout=REQUEST_TIMEOUT_SECONDS)
+    else:
+        os.environ['OPENAI_BASE_URL'] = f'http://127.0.0.1:{args.mock_port}/v1'
+        os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+        # Bedrock is not served by the mock, warming it up would only wait for its timeout
+        os.environ.setdefault('LLM_WARMUP_ON_STARTUP', 'False')
+        get_settings.cache_clear()
+        app = create_app()
+        # ASGITransport does not send lifespan events, so the app's startup and shutdown are run around the benchmark
+        app_lifespan = app.router.lifespan_context(app)
+        transport = ASGITransport(app=app)
+        client = AsyncClient(transport=transport, base_url='http://benchmark', timeout=REQUEST_TIMEOUT_SECONDS)
+
+    try:
+        async with app_lifespan, client:
+            await run_benchmark(client, requests=args.concurrency, concurrency=args.concurrency, model=args.model)
+            result = await run_benchmark(client, args.requests, args.concurrency, args.model)
+    finally:
+        mock_server.should_exit = True
+        await mock_task
+
+    sys.stdout.write(result.report())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--model', default='gpt-5.4-mini')
+    parser.add_argument('--app-url', help='Benchmark a running app instead of an in-process one')
+    parser.add_argument('--mock-port', type=int, default=8100)
+    parser.add_argument('--latency', type=float, default=0.2, help='Mock seconds until the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0)
+    parser.add_argument('--output-tokens', type=int, default=40)
+    asyncio.run(main(parser.parse_args()))
+{%- endif %}
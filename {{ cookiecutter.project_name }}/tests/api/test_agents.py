@@ -1,15 +1,51 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+{%- endif %}
 from typing import Any, cast
+from uuid import uuid4
 
 from botocore.exceptions import ClientError
+from fastapi import FastAPI
 from httpx import AsyncClient, Request, Response
 from openai import APIConnectionError, RateLimitError
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from prometheus_client import REGISTRY
+{%- endif %}
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.models.fallback import FallbackModel
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from pydantic_ai.models.test import TestModel
+{%- endif %}
 import pytest
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncConnection, AsyncSession
+{%- endif %}
 
+from app.core.config import get_settings
 from app.core.enums import AIModelName
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from app.infrastructure.db.database import get_session_factory
+from app.infrastructure.db.models.agent_thread import AgentThreadModel
+{%- endif %}
+from app.infrastructure.llms.llm_models import get_llm_models_registry, is_retryable_provider_error
+from app.modules.examples_agent.agents import build_examples_agent, get_examples_agent
+from app.modules.examples_agent.batch_jobs import ExampleAgentBatchJobs, get_example_agent_batch_jobs
 from app.modules.examples_agent.schemas import ExampleAgentDeps, ExampleAgentResponse
-from tests.mocks.agent_mocks import build_mock_model, build_raising_model
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from tests.api.test_examples import create_test_example
+{%- endif %}
+from tests.dependencies import DepOverride, temporary_overrides
+from tests.mocks.agent_mocks import (
+    build_delayed_mock_model,
+    build_mock_model,
+    build_raising_model,
+    ConcurrencyProbe,
+)
 
 
 class TestCreateExampleAgentResponse:
@@ -88,4 +124,359 @@ class TestCreateExampleAgentResponse:
 
         assert response.status_code == 503
         assert response.json()['detail'] == 'AI provider temporarily unavailable. Please retry shortly.'
+
+    async def test_throttled_model_falls_back_to_next_model(
+        self,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        answer = 'Answered by the fallback model.'
+        model = FallbackModel(
+            build_raising_model(ModelHTTPError(status_code=429, model_name='sonnet-4.6')),
+            build_mock_model(ExampleAgentResponse(answer=answer)),
+            fallback_on=is_retryable_provider_error,
+        )
+        with test_examples_agent.override(model=model):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {'answer': answer}
+
+    async def test_exhausted_fallback_chain_maps_to_503(
+        self,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        model = FallbackModel(
+            build_raising_model(ModelHTTPError(status_code=429, model_name='sonnet-4.6')),
+            build_raising_model(ModelHTTPError(status_code=503, model_name='haiku-4.5')),
+            fallback_on=is_retryable_provider_error,
+        )
+        with test_examples_agent.override(model=model):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 503
+        assert response.json()['detail'] == 'AI provider temporarily unavailable. Please retry shortly.'
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+    async def test_tools_called_in_one_turn_succeed(
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        await create_test_example(session)
+        with test_examples_agent.override(model=TestModel(call_tools=['count_examples', 'list_examples'])):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have and what are they?'},
+            )
+
+        assert response.status_code == 200
+        assert response.json()['answer']
+
+    async def test_tools_called_in_one_turn_run_concurrently_in_own_sessions(
+        self,
+        app: FastAPI,
+        session: AsyncSession,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        """Each tool call opens a session of its own, and the tool calls of one turn are executed at the same time."""
+        # The session fixture hands its session out one caller at a time, so the tools get their own connections here
+        sessionmaker = async_sessionmaker(cast(AsyncConnection, session.bind).engine, expire_on_commit=False)
+        opened_sessions: list[AsyncSession] = []
+        probe = ConcurrencyProbe()
+
+        @asynccontextmanager
+        async def open_tool_session() -> AsyncGenerator[AsyncSession, Any]:
+            async with sessionmaker() as tool_session:
+                opened_sessions.append(tool_session)
+                probe.running += 1
+                probe.peak = max(probe.peak, probe.running)
+                try:
+                    yield tool_session
+                finally:
+                    probe.running -= 1
+
+        overrides = [DepOverride(dependency=get_session_factory, override=lambda: open_tool_session)]
+        with (
+            temporary_overrides(app, overrides),
+            test_examples_agent.override(model=TestModel(call_tools=['count_examples', 'list_examples'])),
+        ):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have and what are they?'},
+            )
+
+        assert response.status_code == 200
+        assert len(opened_sessions) == 2
+        assert opened_sessions[0] is not opened_sessions[1]
+        assert probe.peak == 2
+{%- endif %}
+{%- if cookiecutter.use_otel_observability == "yes" %}
+
+    async def test_success_records_token_usage_per_model(
+        self,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        labels = {'model': 'haiku-4.5', 'kind': 'input'}
+        tokens_before = REGISTRY.get_sample_value('agent_tokens_total', labels) or 0.0
+        runs_before = REGISTRY.get_sample_value('agent_run_duration_seconds_count', {'model': 'haiku-4.5'}) or 0.0
+        with test_examples_agent.override(model=build_mock_model(ExampleAgentResponse(answer='We have 3 examples.'))):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'haiku-4.5', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 200
+        assert (REGISTRY.get_sample_value('agent_tokens_total', labels) or 0.0) > tokens_before
+        assert REGISTRY.get_sample_value('agent_run_duration_seconds_count', {'model': 'haiku-4.5'}) == runs_before + 1
+
+    async def test_fallback_answer_records_usage_of_fallback_model(self, app: FastAPI, client: AsyncClient) -> None:
+        registry = {
+            AIModelName.SONNET_4_6: build_raising_model(
+                ModelHTTPError(status_code=429, model_name='sonnet'), model_name='sonnet'
+            ),
+            AIModelName.OPUS_4_6: build_mock_model(ExampleAgentResponse(answer='fallback'), model_name='opus'),
+        }
+        settings = get_settings().model_copy(update={'LLM_FALLBACK_MODELS': (AIModelName.OPUS_4_6,)})
+        runs_before = {
+            model: REGISTRY.get_sample_value('agent_run_duration_seconds_count', {'model': model}) or 0.0
+            for model in ('sonnet-4.6', 'opus-4.6')
+        }
+        overrides = [
+            DepOverride(dependency=get_settings, override=lambda: settings),
+            DepOverride(dependency=get_llm_models_registry, override=lambda: registry),
+        ]
+        with temporary_overrides(app, overrides):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.json() == {'answer': 'fallback'}
+        runs_after = {
+            model: REGISTRY.get_sample_value('agent_run_duration_seconds_count', {'model': model}) or 0.0
+            for model in ('sonnet-4.6', 'opus-4.6')
+        }
+        assert runs_after == {'sonnet-4.6': runs_before['sonnet-4.6'], 'opus-4.6': runs_before['opus-4.6'] + 1}
+{%- endif %}
+
+
+class TestCreateExampleAgentResponseHedging:
+    async def test_slow_primary_is_answered_by_hedge_model(self, app: FastAPI, client: AsyncClient) -> None:
+        primary = build_examples_agent(build_delayed_mock_model(ExampleAgentResponse(answer='primary'), delay=10))
+        hedge_model = build_mock_model(ExampleAgentResponse(answer='hedge'))
+        with temporary_overrides(app, build_hedging_overrides(primary, {AIModelName.GPT_5_4_MINI: hedge_model})):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {'answer': 'hedge'}
+
+    async def test_fast_primary_does_not_fire_hedge(self, app: FastAPI, client: AsyncClient) -> None:
+        primary = build_examples_agent(build_mock_model(ExampleAgentResponse(answer='primary')))
+        hedge_model = build_raising_model(AssertionError('hedge must not run'))
+        with temporary_overrides(
+            app, build_hedging_overrides(primary, {AIModelName.GPT_5_4_MINI: hedge_model}, delay=10)
+        ):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {'answer': 'primary'}
+
+    async def test_failed_primary_waits_for_hedge(self, app: FastAPI, client: AsyncClient) -> None:
+        primary = build_examples_agent(build_raising_model(ValueError('primary failed')))
+        hedge_model = build_delayed_mock_model(ExampleAgentResponse(answer='hedge'), delay=0.05)
+        with temporary_overrides(app, build_hedging_overrides(primary, {AIModelName.GPT_5_4_MINI: hedge_model})):
+            response = await client.post(
+                '/v1/agents/examples/conversations',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {'answer': 'hedge'}
+
+
+class TestExampleAgentBatches:
+    async def test_batch_answers_every_item(self, app: FastAPI, client: AsyncClient) -> None:
+        registry = {
+            AIModelName.SONNET_4_6: build_mock_model(ExampleAgentResponse(answer='sonnet')),
+            AIModelName.GPT_5_4: build_raising_model(ValueError('gpt failed')),
+        }
+        with temporary_overrides(app, [DepOverride(dependency=get_llm_models_registry, override=lambda: registry)]):
+            response = await client.post(
+                '/v1/agents/examples/conversations/batches',
+                json={
+                    'items': [
+                        {'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+                        {'model': 'gpt-5.4', 'question': 'How many examples do we have?'},
+                        {'model': 'sonnet-4.6', 'question': 'List the examples.'},
+                    ]
+                },
+            )
+            assert response.status_code == 202
+            assert response.json()['total'] == 3
+
+            job = await wait_for_batch(client, response.json()['id'])
+
+        assert job['status'] == 'completed'
+        assert sorted(job['results'], key=lambda result: result['index']) == [
+            {'index': 0, 'answer': 'sonnet', 'error': None},
+            {'index': 1, 'answer': None, 'error': 'ValueError'},
+            {'index': 2, 'answer': 'sonnet', 'error': None},
+        ]
+
+    async def test_batch_bounds_concurrency_per_model(self, app: FastAPI, client: AsyncClient) -> None:
+        probe = ConcurrencyProbe()
+        model = build_delayed_mock_model(ExampleAgentResponse(answer='done'), delay=0.01, probe=probe)
+        batch_jobs = ExampleAgentBatchJobs(max_stored_jobs=10, max_running_jobs=10, concurrency_per_model=2)
+        overrides = [
+            DepOverride(dependency=get_example_agent_batch_jobs, override=lambda: batch_jobs),
+            DepOverride(dependency=get_llm_models_registry, override=lambda: {AIModelName.HAIKU_4_5: model}),
+        ]
+        with temporary_overrides(app, overrides):
+            responses = [
+                await client.post(
+                    '/v1/agents/examples/conversations/batches',
+                    json={'items': [{'model': 'haiku-4.5', 'question': f'Question {index}'} for index in range(3)]},
+                )
+                for _ in range(2)
+            ]
+            jobs = [await wait_for_batch(client, response.json()['id']) for response in responses]
+
+        assert [len(job['results']) for job in jobs] == [3, 3]
+        # The limit is shared by all jobs of the process, not applied to each job on its own
+        assert probe.peak == 2
+
+    async def test_batch_rejected_while_running_job_limit_is_reached(self, app: FastAPI, client: AsyncClient) -> None:
+        batch_jobs = ExampleAgentBatchJobs(max_stored_jobs=10, max_running_jobs=1, concurrency_per_model=2)
+        batch_jobs.create(total=1)
+        overrides = [DepOverride(dependency=get_example_agent_batch_jobs, override=lambda: batch_jobs)]
+        with temporary_overrides(app, overrides):
+            response = await client.post(
+                '/v1/agents/examples/conversations/batches',
+                json={'items': [{'model': 'haiku-4.5', 'question': 'How many examples do we have?'}]},
+            )
+
+        assert response.status_code == 503
+
+    async def test_unknown_batch_returns_404(self, client: AsyncClient) -> None:
+        response = await client.get(f'/v1/agents/examples/conversations/batches/{uuid4()}')
+
+        assert response.status_code == 404
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+class TestExampleAgentThreads:
+    async def test_follow_up_turns_extend_thread_history(
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        response = await client.post('/v1/agents/examples/threads')
+        assert response.status_code == 201
+        thread_id = response.json()['id']
+
+        with test_examples_agent.override(model=build_mock_model(ExampleAgentResponse(answer='We have 3 examples.'))):
+            for question in ('How many examples do we have?', 'And how many of them were created today?'):
+                response = await client.post(
+                    f'/v1/agents/examples/threads/{thread_id}/messages',
+                    json={'model': 'sonnet-4.6', 'question': question},
+                )
+                assert response.status_code == 200
+                assert response.json() == {'answer': 'We have 3 examples.'}
+
+        messages = await session.scalar(select(AgentThreadModel.messages).filter(AgentThreadModel.id == thread_id))
+        assert messages is not None
+        user_prompts = [
+            part['content'] for message in messages for part in message['parts'] if part['part_kind'] == 'user-prompt'
+        ]
+        assert user_prompts == ['How many examples do we have?', 'And how many of them were created today?']
+
+    async def test_concurrent_turns_on_one_thread_conflict(
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        """Of two turns answered from the same history only the first one is saved, the other one gets a 409."""
+        response = await client.post('/v1/agents/examples/threads')
+        thread_id = response.json()['id']
+
+        model = build_delayed_mock_model(ExampleAgentResponse(answer='We have 3 examples.'), delay=0.05)
+        with test_examples_agent.override(model=model):
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        f'/v1/agents/examples/threads/{thread_id}/messages',
+                        json={'model': 'sonnet-4.6', 'question': question},
+                    )
+                    for question in ('How many examples do we have?', 'What are they?')
+                )
+            )
+
+        assert sorted(response.status_code for response in responses) == [200, 409]
+        messages = await session.scalar(select(AgentThreadModel.messages).filter(AgentThreadModel.id == thread_id))
+        assert messages is not None
+        user_prompts = [
+            part['content'] for message in messages for part in message['parts'] if part['part_kind'] == 'user-prompt'
+        ]
+        assert len(user_prompts) == 1
+
+    async def test_unknown_thread_returns_404(
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        test_examples_agent: Agent[ExampleAgentDeps, ExampleAgentResponse],
+    ) -> None:
+        with test_examples_agent.override(model=build_mock_model(ExampleAgentResponse(answer='We have 3 examples.'))):
+            response = await client.post(
+                '/v1/agents/examples/threads/999999/messages',
+                json={'model': 'sonnet-4.6', 'question': 'How many examples do we have?'},
+            )
+
+        assert response.status_code == 404
+{%- endif %}
+
+
+async def wait_for_batch(client: AsyncClient, job_id: str) -> dict[str, Any]:
+    for _ in range(200):
+        response = await client.get(f'/v1/agents/examples/conversations/batches/{job_id}')
+        assert response.status_code == 200
+        if response.json()['status'] == 'completed':
+            return response.json()
+        await asyncio.sleep(0.01)
+    raise AssertionError(f'Batch {job_id} did not complete')
+
+
+def build_hedging_overrides(
+    agent: Agent[ExampleAgentDeps, ExampleAgentResponse], registry: dict[AIModelName, Any], delay: float = 0
+) -> list[DepOverride]:
+    settings = get_settings().model_copy(
+        update={
+            'AGENT_HEDGING_ENABLED': True,
+            'AGENT_HEDGING_DELAY_SECONDS': delay,
+            'AGENT_HEDGING_MODEL': AIModelName.GPT_5_4_MINI,
+        }
+    )
+    return [
+        DepOverride(dependency=get_settings, override=lambda: settings),
+        DepOverride(dependency=get_examples_agent, override=lambda: agent),
+        DepOverride(dependency=get_llm_models_registry, override=lambda: registry),
+    ]
 {%- endif %}
@@ -2,7 +2,9 @@ from datetime import datetime, UTC
 {%- if cookiecutter.project_type != "fastapi_slim" %}
 from types import SimpleNamespace
 {%- endif %}
-{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type == "fastapi_agent" %}
+from typing import Any
+{%- elif cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 from typing import Any, Never
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
@@ -24,13 +26,39 @@ from app.modules.health_checks.schemas import (
 )
 from app.core.config import get_settings
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
-from app.infrastructure.db.database import get_session
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.dependency_health import DependencyHealthTracker
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+from app.infrastructure.db.database import (
+    get_database_circuit_breaker,
+    get_database_health_tracker,
+    get_unguarded_session,
+)
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
-from app.infrastructure.llms.provider_bedrock import get_bedrock_client
-from app.infrastructure.llms.provider_openai import get_openai_client
+from app.modules.health_checks.prober import build_llm_readiness_prober, get_llm_readiness_prober, ReadinessProber
 {%- endif %}
 from tests.dependencies import DepOverride, temporary_overrides
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+
+
+def build_idle_health_tracker() -> DependencyHealthTracker:
+    """No recent traffic, so readiness falls back to the active probe."""
+    return DependencyHealthTracker(name='database', window_seconds=60, min_calls=10, max_error_rate=0.5)
+
+
+def build_open_circuit_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(name='database', failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure()
+    return breaker
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+
+
+def build_prober(bedrock_client: Any, openai_client: Any) -> ReadinessProber:
+    return build_llm_readiness_prober(bedrock_client, openai_client, get_settings())
+{%- endif %}
 
 
 @freeze_time('2024-01-02T03:04:05Z')
@@ -88,7 +116,35 @@ async def test_health_ready_database_down(app: FastAPI, client: AsyncClient) ->
 
     with temporary_overrides(
         app,
-        [DepOverride(dependency=get_session, override=lambda: FailingSession())],
+        [
+            DepOverride(dependency=get_unguarded_session, override=lambda: FailingSession()),
+            DepOverride(dependency=get_database_health_tracker, override=build_idle_health_tracker),
+        ],
+    ):
+        response = await client.get('/health/ready')
+
+    assert response.status_code == 503
+
+    actual = response.json()
+    assert HealthCheckReadyResponse.model_validate(actual)
+    expected = HealthCheckReadyResponse(
+        version=get_settings().PROJECT_VERSION,
+        status='NOT_READY',
+        dependencies=HealthCheckReadyDependencies(database='DOWN'),
+        timestamp=datetime.now(UTC),
+    ).model_dump(mode='json')
+    assert actual == expected
+
+
+@freeze_time('2024-01-02T03:04:05Z')
+async def test_health_ready_database_circuit_open(app: FastAPI, client: AsyncClient, session: AsyncSession) -> None:
+    """An open database circuit is reported as the database status instead of failing the readiness request."""
+    # Opened here rather than in a sync override, freezegun does not reach the threadpool those run in
+    breaker = build_open_circuit_breaker()
+
+    with temporary_overrides(
+        app,
+        [DepOverride(dependency=get_database_circuit_breaker, override=lambda: breaker)],
     ):
         response = await client.get('/health/ready')
 
@@ -112,8 +168,9 @@ async def test_health_ready_success(app: FastAPI, client: AsyncClient) -> None:
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
@@ -139,8 +196,9 @@ async def test_health_ready_bedrock_down(app: FastAPI, client: AsyncClient) -> N
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
@@ -166,8 +224,9 @@ async def test_health_ready_openai_down(app: FastAPI, client: AsyncClient) -> No
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
@@ -192,8 +251,9 @@ async def test_health_ready_success(app: FastAPI, client: AsyncClient, session:
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
@@ -223,9 +283,43 @@ async def test_health_ready_database_down(app: FastAPI, client: AsyncClient) ->
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
-            DepOverride(dependency=get_session, override=lambda: FailingSession()),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
+            DepOverride(dependency=get_unguarded_session, override=lambda: FailingSession()),
+            DepOverride(dependency=get_database_health_tracker, override=build_idle_health_tracker),
+        ],
+    ):
+        response = await client.get('/health/ready')
+
+    assert response.status_code == 503
+
+    actual = response.json()
+    assert HealthCheckReadyResponse.model_validate(actual)
+    expected = HealthCheckReadyResponse(
+        version=get_settings().PROJECT_VERSION,
+        status='NOT_READY',
+        dependencies=HealthCheckReadyDependencies(database='DOWN', bedrock='UP', openai='UP'),
+        timestamp=datetime.now(UTC),
+    ).model_dump(mode='json')
+    assert actual == expected
+
+
+@freeze_time('2024-01-02T03:04:05Z')
+async def test_health_ready_database_circuit_open(app: FastAPI, client: AsyncClient, session: AsyncSession) -> None:
+    """An open database circuit is reported as the database status instead of failing the readiness request."""
+    bedrock_client = SimpleNamespace(count_tokens=lambda **kwargs: {'inputTokens': 1})
+    openai_client = SimpleNamespace(models=SimpleNamespace(list=AsyncMock(return_value=None)))
+    # Opened here rather than in a sync override, freezegun does not reach the threadpool those run in
+    breaker = build_open_circuit_breaker()
+
+    with temporary_overrides(
+        app,
+        [
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
+            DepOverride(dependency=get_database_circuit_breaker, override=lambda: breaker),
         ],
     ):
         response = await client.get('/health/ready')
@@ -251,8 +345,9 @@ async def test_health_ready_bedrock_down(app: FastAPI, client: AsyncClient, sess
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
@@ -278,8 +373,9 @@ async def test_health_ready_openai_down(app: FastAPI, client: AsyncClient, sessi
     with temporary_overrides(
         app,
         [
-            DepOverride(dependency=get_bedrock_client, override=lambda: bedrock_client),
-            DepOverride(dependency=get_openai_client, override=lambda: openai_client),
+            DepOverride(
+                dependency=get_llm_readiness_prober, override=lambda: build_prober(bedrock_client, openai_client)
+            ),
         ],
     ):
         response = await client.get('/health/ready')
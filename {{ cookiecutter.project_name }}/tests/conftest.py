@@ -1,6 +1,12 @@
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+import asyncio
+{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 from collections.abc import Iterator
 {%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+from contextlib import asynccontextmanager
+{%- endif %}
 import os
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 import pathlib
@@ -32,6 +38,9 @@ from app.modules.examples_agent.agents import build_examples_agent, get_examples
 from app.modules.examples_agent.schemas import ExampleAgentDeps, ExampleAgentResponse
 {%- endif %}
 from app.core.config import get_settings
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+from app.infrastructure.db.database import SessionFactory
+{%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
 from tests.mocks.agent_mocks import generate_test_agent
 {%- endif %}
@@ -54,6 +63,7 @@ def pytest_configure(config: pytest.Config) -> None:  # noqa: ARG001
 {%- endif %}
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
     os.environ['OPENAI_API_KEY'] = 'test-openai-key'
+    os.environ['LLM_WARMUP_ON_STARTUP'] = 'False'
     cast(Any, pydantic_ai_models).ALLOW_MODEL_REQUESTS = False
 {%- endif %}
     os.environ['LOG_FORMAT'] = 'stdout'
@@ -99,9 +109,11 @@ async def session(app: FastAPI, _engine: AsyncEngine) -> AsyncIterable[AsyncSess
     session_factory = async_sessionmaker(connection, expire_on_commit=False)
     session = session_factory()
 
-    from app.infrastructure.db.database import get_session
+    from app.infrastructure.db.database import get_session, get_session_factory, get_unguarded_session
 
     override_dependency(app, get_session, lambda: session)
+    override_dependency(app, get_unguarded_session, lambda: session)
+    override_dependency(app, get_session_factory, lambda: build_shared_session_factory(session))
 
     try:
         yield session
@@ -156,6 +168,18 @@ def _postgres_container() -> Generator[PostgresContainer, Any, None]:
         yield postgres
 
 
+def build_shared_session_factory(session: AsyncSession) -> SessionFactory:
+    """Hand the test session out one caller at a time, since code asking for a factory may use it concurrently."""
+    lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def open_shared_session() -> AsyncGenerator[AsyncSession, Any]:
+        async with lock:
+            yield session
+
+    return open_shared_session
+
+
 def find_migrations_script_location() -> str:
     """Help find a script location if tests were run by debugger or any other way except writing 'pytest' in cli"""
     return os.path.join(pathlib.Path(os.path.dirname(os.path.realpath(__file__))).parent, 'migrations')
@@ -1,12 +1,14 @@
 from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager, ExitStack
 from dataclasses import dataclass
+from typing import Annotated, Any
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
 from starlette.routing import Mount
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
-from app.infrastructure.db.database import get_session
+from app.infrastructure.db.database import get_session, get_session_factory, get_unguarded_session
 {%- endif %}
 
 
@@ -20,6 +22,8 @@ def override_app_test_dependencies(app: FastAPI) -> None:
     deps: list[DepOverride] = [
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
         DepOverride(dependency=get_session, override=lambda: SessionFixtureDoesNotSetExplicitly),
+        DepOverride(dependency=get_session_factory, override=lambda: SessionFixtureDoesNotSetExplicitly),
+        DepOverride(dependency=get_unguarded_session, override=lambda: SessionFixtureDoesNotSetExplicitly),
 {%- endif %}
     ]
     for dep in deps:
@@ -63,6 +67,21 @@ def temporary_overrides(app: FastAPI, overrides: Sequence[DepOverride]) -> Gener
         for dep in overrides:
             stack.enter_context(temporary_override(app, dep.dependency, dep.override))
         yield
+
+
+async def resolve_dependency(dependency: Callable) -> Any:
+    """Resolve a dependency through a request, i.e. exactly as FastAPI calls it for route handlers."""
+    resolved = []
+    app = FastAPI()
+
+    @app.get('/')
+    async def handler(value: Annotated[Any, Depends(dependency)]) -> None:
+        resolved.append(value)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        response = await client.get('/')
+    response.raise_for_status()
+    return resolved[0]
 {%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
 
 
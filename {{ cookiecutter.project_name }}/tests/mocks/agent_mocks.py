@@ -1,11 +1,13 @@
 {%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
-from collections.abc import Callable, Iterator
+import asyncio
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import FastAPI
 from pydantic import BaseModel
 from pydantic_ai import Agent
-from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.messages import ModelRequest, ModelResponse, ToolCallPart
 from pydantic_ai.models.function import AgentInfo, FunctionModel
 from pydantic_ai.models.test import TestModel
 
@@ -22,20 +24,56 @@ def generate_test_agent(
         yield agent
 
 
-def build_mock_model(response: BaseModel) -> FunctionModel:
+def build_mock_model(response: BaseModel, model_name: str | None = None) -> FunctionModel:
     def _cb(messages: list, info: AgentInfo) -> ModelResponse:
         return _build_output_model_response(info, response)
 
+    return FunctionModel(_cb, model_name=model_name)
+
+
+@dataclass(slots=True)
+class ConcurrencyProbe:
+    """Tracks how many mock model requests run at the same time."""
+
+    running: int = 0
+    peak: int = 0
+
+
+def build_delayed_mock_model(response: BaseModel, delay: float, probe: ConcurrencyProbe | None = None) -> FunctionModel:
+    probe = probe or ConcurrencyProbe()
+
+    async def _cb(messages: list, info: AgentInfo) -> ModelResponse:
+        probe.running += 1
+        probe.peak = max(probe.peak, probe.running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            probe.running -= 1
+        return _build_output_model_response(info, response)
+
     return FunctionModel(_cb)
 
 
-def build_raising_model(exc: Exception) -> FunctionModel:
+def build_tool_calling_mock_model(
+    tool_calls: Sequence[tuple[str, dict[str, Any]]], response: BaseModel
+) -> FunctionModel:
+    """Call the given tools in one turn, then answer with the response."""
+
     def _cb(messages: list, info: AgentInfo) -> ModelResponse:
-        raise exc
+        if sum(isinstance(message, ModelRequest) for message in messages) == 1:
+            return ModelResponse(parts=[ToolCallPart(tool_name=name, args=args) for name, args in tool_calls])
+        return _build_output_model_response(info, response)
 
     return FunctionModel(_cb)
 
 
+def build_raising_model(exc: Exception, model_name: str | None = None) -> FunctionModel:
+    def _cb(messages: list, info: AgentInfo) -> ModelResponse:
+        raise exc
+
+    return FunctionModel(_cb, model_name=model_name)
+
+
 def _build_output_model_response(info: AgentInfo, response: BaseModel) -> ModelResponse:
     payload = response.model_dump(mode='json')
     payload_keys = set(payload.keys())
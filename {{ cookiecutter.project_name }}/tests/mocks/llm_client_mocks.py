@@ -0,0 +1,23 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from typing import Any
+
+from botocore.client import BaseClient
+from openai.resources.models import AsyncModels
+from pytest import MonkeyPatch
+
+
+def record_llm_client_calls(monkeypatch: MonkeyPatch) -> list[Any]:
+    """Stub out every Bedrock and OpenAI models call, collecting the provider client each one was made on."""
+    clients: list[Any] = []
+
+    def make_api_call(client: BaseClient, *_: Any) -> dict[str, Any]:
+        clients.append(client)
+        return {'inputTokens': 1}
+
+    async def list_models(models: AsyncModels) -> None:
+        clients.append(models._client)
+
+    monkeypatch.setattr(BaseClient, '_make_api_call', make_api_call)
+    monkeypatch.setattr(AsyncModels, 'list', list_models)
+    return clients
+{%- endif %}
@@ -0,0 +1,97 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import json
+from typing import Any
+
+from httpx import ASGITransport, AsyncClient
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from benchmarks.mock_openai_server import create_mock_openai_app
+
+FUNCTION_TOOL = {
+    'type': 'function',
+    'function': {'name': 'count_examples', 'parameters': {'type': 'object', 'properties': {}}},
+}
+OUTPUT_TOOL = {
+    'type': 'function',
+    'function': {
+        'name': 'final_result',
+        'parameters': {
+            'type': 'object',
+            'properties': {'answer': {'type': 'string'}, 'confidence': {'type': 'number'}},
+            'required': ['answer'],
+        },
+    },
+}
+
+
+async def create_chat_completion(body: dict[str, Any]) -> dict[str, Any]:
+    transport = ASGITransport(app=create_mock_openai_app(latency_seconds=0, tokens_per_second=1e9, output_tokens=3))
+    async with AsyncClient(transport=transport, base_url='http://mock') as client:
+        response = await client.post('/v1/chat/completions', json={'model': 'gpt-5.4-mini', **body})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def stream_chat_completion(body: dict[str, Any]) -> list[str]:
+    transport = ASGITransport(app=create_mock_openai_app(latency_seconds=0, tokens_per_second=1e9, output_tokens=3))
+    async with AsyncClient(transport=transport, base_url='http://mock') as client:
+        response = await client.post('/v1/chat/completions', json={'model': 'gpt-5.4-mini', 'stream': True, **body})
+    assert response.headers['content-type'].startswith('text/event-stream')
+    return [line.removeprefix('data: ') for line in response.text.split('\n\n') if line]
+
+
+async def test_first_turn_calls_every_function_tool() -> None:
+    body = await create_chat_completion({'messages': [{'role': 'user', 'content': 'Hi'}], 'tools': [FUNCTION_TOOL]})
+    completion = ChatCompletion.model_validate(body)
+
+    (choice,) = body['choices']
+    assert choice['finish_reason'] == 'tool_calls'
+    assert [tool_call['function']['name'] for tool_call in choice['message']['tool_calls']] == ['count_examples']
+    assert completion.usage is not None
+    assert completion.usage.total_tokens == completion.usage.prompt_tokens + completion.usage.completion_tokens
+
+
+async def test_answers_through_output_tool_once_tools_returned() -> None:
+    """After the tool results the output tool is called with only the required properties of its schema."""
+    messages = [
+        {'role': 'user', 'content': 'Hi'},
+        {'role': 'tool', 'tool_call_id': 'call_1', 'content': '3'},
+    ]
+    body = await create_chat_completion({'messages': messages, 'tools': [FUNCTION_TOOL, OUTPUT_TOOL]})
+    ChatCompletion.model_validate(body)
+
+    (tool_call,) = body['choices'][0]['message']['tool_calls']
+    assert tool_call['function']['name'] == 'final_result'
+    assert json.loads(tool_call['function']['arguments']) == {'answer': 'lorem lorem lorem'}
+
+
+async def test_answers_with_text_without_tools() -> None:
+    completion = ChatCompletion.model_validate(
+        await create_chat_completion({'messages': [{'role': 'user', 'content': 'Hi'}]})
+    )
+
+    (choice,) = completion.choices
+    assert choice.finish_reason == 'stop'
+    assert choice.message.content == 'lorem lorem lorem'
+
+
+async def test_streamed_text_chunks_end_with_usage_and_done() -> None:
+    *events, done = await stream_chat_completion({'messages': [{'role': 'user', 'content': 'Hi'}]})
+    chunks = [ChatCompletionChunk.model_validate_json(event) for event in events]
+
+    assert done == '[DONE]'
+    assert ''.join(chunk.choices[0].delta.content or '' for chunk in chunks).strip() == 'lorem lorem lorem'
+    assert [chunk.choices[0].finish_reason for chunk in chunks] == [None, None, None, 'stop']
+    assert [chunk.usage is not None for chunk in chunks] == [False, False, False, True]
+
+
+async def test_streamed_tool_calls_are_indexed() -> None:
+    *events, done = await stream_chat_completion(
+        {'messages': [{'role': 'user', 'content': 'Hi'}], 'tools': [FUNCTION_TOOL, FUNCTION_TOOL]}
+    )
+    first, last = (ChatCompletionChunk.model_validate_json(event) for event in events)
+
+    assert done == '[DONE]'
+    assert [tool_call.index for tool_call in first.choices[0].delta.tool_calls or []] == [0, 1]
+    assert last.choices[0].finish_reason == 'tool_calls'
+{%- endif %}
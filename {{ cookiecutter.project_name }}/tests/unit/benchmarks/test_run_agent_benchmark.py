@@ -0,0 +1,28 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import pytest
+
+from benchmarks.run_agent_benchmark import BenchmarkResult
+
+
+def build_result(latencies: list[float]) -> BenchmarkResult:
+    return BenchmarkResult(latencies=latencies, errors=0, duration_seconds=2.0)
+
+
+@pytest.mark.parametrize(
+    ('percent', 'expected'),
+    [(1, 1.99), (50, 50.5), (99, 99.01)],
+)
+def test_percentile_interpolates_between_latencies(percent: int, expected: float) -> None:
+    result = build_result([float(latency) for latency in range(100, 0, -1)])
+
+    assert result.percentile(percent) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(('latencies', 'expected'), [([], 0.0), ([0.25], 0.25)])
+def test_percentile_of_too_few_latencies(latencies: list[float], expected: float) -> None:
+    assert build_result(latencies).percentile(99) == expected
+
+
+def test_requests_per_second_counts_successful_requests() -> None:
+    assert build_result([0.1] * 10).requests_per_second == 5.0
+{%- endif %}
@@ -1,5 +1,5 @@
 from app.core.logging import LogFormatType, build_logging_config
-from app.core.logging.config import DEFAULT_HANDLER_NAME
+from app.core.logging.config import DEFAULT_HANDLER_NAME, RATE_LIMIT_FILTER_NAME, REQUEST_CONTEXT_FILTER_NAME
 
 
 def test_build_logging_config_routes_uvicorn_loggers_to_console() -> None:
@@ -21,3 +21,36 @@ def test_build_logging_config_applies_log_level_to_uvicorn_loggers() -> None:
     config = build_logging_config('DEBUG', LogFormatType.JSON)
 
     assert {logger['level'] for logger in config['loggers'].values()} == {'DEBUG'}
+
+
+def test_build_logging_config_routes_console_through_bounded_queue_when_enabled() -> None:
+    """Queued logging config swaps the console handler for the bounded queue handler."""
+    config = build_logging_config(
+        'DEBUG', LogFormatType.JSON, queue_enabled=True, queue_size=10, queue_overflow_policy='block'
+    )
+
+    assert config['handlers'][DEFAULT_HANDLER_NAME] == {
+        '()': 'app.core.logging.handlers.BoundedQueueHandler',
+        'formatter': LogFormatType.JSON,
+        'stream': 'ext://sys.stdout',
+        'queue_size': 10,
+        'overflow_policy': 'block',
+        'filters': [REQUEST_CONTEXT_FILTER_NAME],
+    }
+
+
+def test_build_logging_config_rate_limits_console_when_enabled() -> None:
+    """Rate limited logging config drops records before they are stamped with the request context."""
+    config = build_logging_config('DEBUG', LogFormatType.JSON, rate_limit_enabled=True)
+
+    assert config['handlers'][DEFAULT_HANDLER_NAME]['filters'] == [RATE_LIMIT_FILTER_NAME, REQUEST_CONTEXT_FILTER_NAME]
+
+
+def test_build_logging_config_silences_uvicorn_access_log_when_disabled() -> None:
+    """Logging config leaves the Uvicorn access logger without handlers, so Uvicorn skips access logging."""
+    config = build_logging_config('DEBUG', LogFormatType.JSON, uvicorn_access_enabled=False)
+
+    assert (config['loggers']['uvicorn.access']['handlers'], config['loggers']['uvicorn.access']['propagate']) == (
+        [],
+        False,
+    )
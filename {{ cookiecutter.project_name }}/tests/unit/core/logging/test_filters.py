@@ -0,0 +1,107 @@
+import logging
+
+from freezegun import freeze_time
+import pytest
+
+from app.core.logging.context import request_context, REQUEST_CONTEXT_RECORD_ATTRIBUTE, RequestContext
+from app.core.logging.filters import RateLimitingFilter, RequestContextFilter
+
+NOT_FOUND_TEMPLATE = 'Example with id=%s not found but was requested for deletion'
+
+
+def build_log_record(
+    level: int = logging.INFO, message: str = NOT_FOUND_TEMPLATE, name: str = 'app.test'
+) -> logging.LogRecord:
+    return logging.LogRecord(
+        name=name, level=level, pathname=__file__, lineno=1, msg=message, args=('42',), exc_info=None
+    )
+
+
+def build_filter() -> RateLimitingFilter:
+    return RateLimitingFilter(rate_per_second=1.0, burst=2, report_interval_seconds=60.0)
+
+
+def test_rate_limiting_filter_drops_template_repeats_over_burst() -> None:
+    """Filter lets a message template burst through, then drops its repeats."""
+    with freeze_time():
+        rate_limiting_filter = build_filter()
+
+        passed = [rate_limiting_filter.filter(build_log_record()) for _ in range(4)]
+
+    assert passed == [True, True, False, False]
+
+
+def test_rate_limiting_filter_refills_tokens_over_time() -> None:
+    """Filter lets a suppressed template through again once its bucket refills."""
+    with freeze_time() as frozen_time:
+        rate_limiting_filter = build_filter()
+        for _ in range(3):
+            rate_limiting_filter.filter(build_log_record())
+
+        frozen_time.tick(1)
+
+        assert rate_limiting_filter.filter(build_log_record())
+
+
+def test_rate_limiting_filter_limits_templates_and_loggers_separately() -> None:
+    """Filter keeps a separate bucket per logger and message template."""
+    with freeze_time():
+        rate_limiting_filter = build_filter()
+        for _ in range(2):
+            rate_limiting_filter.filter(build_log_record())
+
+        passed = [
+            rate_limiting_filter.filter(build_log_record(message='Another message %s')),
+            rate_limiting_filter.filter(build_log_record(name='app.other')),
+        ]
+
+    assert passed == [True, True]
+
+
+@pytest.mark.parametrize('level', [logging.WARNING, logging.ERROR])
+def test_rate_limiting_filter_always_keeps_warnings_and_above(level: int) -> None:
+    """Filter never drops records at WARNING or above."""
+    with freeze_time():
+        rate_limiting_filter = build_filter()
+
+        passed = [rate_limiting_filter.filter(build_log_record(level=level)) for _ in range(4)]
+
+    assert all(passed)
+
+
+def test_rate_limiting_filter_reports_suppressed_records(caplog: pytest.LogCaptureFixture) -> None:
+    """Filter logs how many records it suppressed once the report interval has passed."""
+    with freeze_time() as frozen_time:
+        rate_limiting_filter = build_filter()
+        for _ in range(5):
+            rate_limiting_filter.filter(build_log_record())
+
+        frozen_time.tick(60)
+        rate_limiting_filter.filter(build_log_record())
+
+    assert caplog.messages == ['Rate limited 3 log records from 1 message templates in the last 60s']
+
+
+def test_request_context_filter_stamps_current_request_context() -> None:
+    """Filter stamps records with the request context of the caller."""
+    context = RequestContext(request_id='req-1', method='GET', user_agent=None, scope={})
+    record = build_log_record()
+    token = request_context.set(context)
+    try:
+        RequestContextFilter().filter(record)
+    finally:
+        request_context.reset(token)
+
+    assert record.__dict__[REQUEST_CONTEXT_RECORD_ATTRIBUTE] is context
+
+
+def test_rate_limiting_filter_never_limits_exempt_loggers() -> None:
+    """Filter lets every record of an exempt logger through, e.g. the access log."""
+    with freeze_time():
+        rate_limiting_filter = RateLimitingFilter(
+            rate_per_second=1.0, burst=2, report_interval_seconds=60.0, exempt_loggers=('app.access',)
+        )
+
+        passed = [rate_limiting_filter.filter(build_log_record(name='app.access')) for _ in range(4)]
+
+    assert all(passed)
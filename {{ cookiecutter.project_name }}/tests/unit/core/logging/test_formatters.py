@@ -1,13 +1,19 @@
 import json
 import logging
-from types import TracebackType
-from typing import TypeAlias
+import timeit
+from types import SimpleNamespace, TracebackType
+from typing import Any, TypeAlias
 
+import pytest
 from pytest import MonkeyPatch
 
+from app.core.logging import StructuredLogRecord
+from app.core.logging.context import REQUEST_CONTEXT_RECORD_ATTRIBUTE, RequestContext
 from app.core.logging.formatters import ColorizedStdoutFormatter, StructuredJsonFormatter
+from app.core.logging.models import LOG_TIMESTAMP_FORMAT
 
 TraceContextValue: TypeAlias = str | int | None
+EXTRA_FIELD_NAMES = ('example_id', 'tags', 'cached')
 
 
 def build_log_record(
@@ -16,6 +22,8 @@ def build_log_record(
     exc_info: tuple[type[BaseException], BaseException, TracebackType | None] | None = None,
     otel_trace_id: TraceContextValue = None,
     otel_span_id: TraceContextValue = None,
+    context: RequestContext | None = None,
+    extra: dict[str, Any] | None = None,
 ) -> logging.LogRecord:
     record = logging.LogRecord(
         name='app.test', level=level, pathname=__file__, lineno=1, msg=message, args=(), exc_info=exc_info
@@ -24,9 +32,16 @@ def build_log_record(
         record.otelTraceID = otel_trace_id
     if otel_span_id is not None:
         record.otelSpanID = otel_span_id
+    setattr(record, REQUEST_CONTEXT_RECORD_ATTRIBUTE, context)
+    record.__dict__.update(extra or {})
     return record
 
 
+def build_request_context(route_path: str | None = '/v1/examples/{example_id}') -> RequestContext:
+    scope: dict[str, Any] = {'route': SimpleNamespace(path=route_path)} if route_path else {}
+    return RequestContext(request_id='req-1', method='GET', user_agent='curl/8.0', scope=scope)
+
+
 def capture_exc_info() -> tuple[type[BaseException], BaseException, TracebackType | None]:
     try:
         raise RuntimeError('boom')
@@ -34,6 +49,30 @@ def capture_exc_info() -> tuple[type[BaseException], BaseException, TracebackTyp
         return (RuntimeError, exc, exc.__traceback__)
 
 
+def format_with_model(formatter: logging.Formatter, record: logging.LogRecord) -> str:
+    """Reference rendering through the `StructuredLogRecord` model."""
+    structured = StructuredLogRecord(
+        timestamp=formatter.formatTime(record, LOG_TIMESTAMP_FORMAT),
+        logger_name=record.name,
+        level=record.levelname,
+        message=record.getMessage(),
+    )
+    structured.trace_id = record.__dict__.get('otelTraceID')
+    structured.span_id = record.__dict__.get('otelSpanID')
+    if record.exc_info:
+        exc_type = record.exc_info[0]
+        structured.stack_trace = formatter.formatException(record.exc_info)
+        structured.exception_type = exc_type.__name__ if exc_type else None
+    context = record.__dict__.get(REQUEST_CONTEXT_RECORD_ATTRIBUTE)
+    if context is not None:
+        structured.request_id = context.request_id
+        structured.method = context.method
+        structured.route = context.route
+        structured.user_agent = context.user_agent
+    structured.extra = {key: record.__dict__[key] for key in EXTRA_FIELD_NAMES if key in record.__dict__} or None
+    return structured.model_dump_json(exclude_none=True)
+
+
 def test_structured_json_formatter_serializes_base_fields() -> None:
     """Structured formatter emits the stable fields every log record needs."""
     formatter = StructuredJsonFormatter()
@@ -62,6 +101,31 @@ def test_structured_json_formatter_adds_trace_context() -> None:
     }
 
 
+def test_structured_json_formatter_adds_request_context() -> None:
+    """Structured formatter includes the metadata of the request the record was logged for."""
+    formatter = StructuredJsonFormatter()
+    record = build_log_record(context=build_request_context())
+
+    payload = json.loads(formatter.format(record))
+
+    assert {key: payload[key] for key in ('request_id', 'method', 'route', 'user_agent')} == {
+        'request_id': 'req-1',
+        'method': 'GET',
+        'route': '/v1/examples/{example_id}',
+        'user_agent': 'curl/8.0',
+    }
+
+
+def test_structured_json_formatter_adds_extra_fields() -> None:
+    """Structured formatter keeps fields passed with `extra=`, rendering values JSON can't encode as strings."""
+    formatter = StructuredJsonFormatter()
+    record = build_log_record(extra={'example_id': 42, 'elapsed': SimpleNamespace()})
+
+    payload = json.loads(formatter.format(record))
+
+    assert payload['extra'] == {'example_id': 42, 'elapsed': 'namespace()'}
+
+
 def test_structured_json_formatter_ignores_empty_trace_context() -> None:
     """Structured formatter does not emit placeholder trace identifiers."""
     formatter = StructuredJsonFormatter()
@@ -135,3 +199,48 @@ def test_colorized_stdout_formatter_leaves_plain_output_without_tty(monkeypatch:
     monkeypatch.setattr('sys.stdout.isatty', lambda: False)
 
     assert formatter.format(record) == 'INFO hello'
+
+
+@pytest.mark.parametrize(
+    'record',
+    [
+        build_log_record(),
+        build_log_record(message='quotes " and \\ backslashes\n\ttabs \x00 control, é 😀 中 \u2028'),
+        build_log_record(level=logging.ERROR, exc_info=capture_exc_info()),
+        build_log_record(otel_trace_id='abc123', otel_span_id='def456'),
+        build_log_record(context=build_request_context()),
+        build_log_record(context=build_request_context(route_path=None)),
+        build_log_record(extra={'example_id': 42, 'tags': ['a', 'b'], 'cached': None}),
+    ],
+)
+def test_structured_json_formatter_matches_model_output(record: logging.LogRecord) -> None:
+    """Structured formatter output is byte-identical to dumping the `StructuredLogRecord` model."""
+    formatter = StructuredJsonFormatter()
+
+    assert formatter.format(record) == format_with_model(formatter, record)
+
+
+def test_structured_json_formatter_renders_timestamp_per_second() -> None:
+    """Structured formatter refreshes the cached timestamp once records move to the next second."""
+    formatter = StructuredJsonFormatter()
+    records = [build_log_record() for _ in range(3)]
+    for record, created in zip(records, (1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.2), strict=True):
+        record.created = created
+
+    timestamps = [json.loads(formatter.format(record))['timestamp'] for record in records]
+
+    assert timestamps == [formatter.formatTime(record, LOG_TIMESTAMP_FORMAT) for record in records]
+
+
+def test_structured_json_formatter_outperforms_model_rendering() -> None:
+    """Microbenchmark: the structured formatter is faster than building and dumping the model per record."""
+    formatter = StructuredJsonFormatter()
+    record = build_log_record(otel_trace_id='abc123', otel_span_id='def456')
+
+    # Interleaved, so a burst of load on the machine slows down both sides instead of only one
+    formatter_seconds, model_seconds = float('inf'), float('inf')
+    for _ in range(10):
+        formatter_seconds = min(formatter_seconds, timeit.timeit(lambda: formatter.format(record), number=2_000))
+        model_seconds = min(model_seconds, timeit.timeit(lambda: format_with_model(formatter, record), number=2_000))
+
+    assert formatter_seconds < model_seconds
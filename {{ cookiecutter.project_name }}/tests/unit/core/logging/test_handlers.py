@@ -0,0 +1,59 @@
+import io
+import logging
+
+from app.core.logging import LogQueueOverflowPolicy
+from app.core.logging.handlers import BoundedQueueHandler
+
+
+def build_handler(
+    stream: io.StringIO, queue_size: int = 10, overflow_policy: LogQueueOverflowPolicy = 'drop'
+) -> BoundedQueueHandler:
+    handler = BoundedQueueHandler(stream=stream, queue_size=queue_size, overflow_policy=overflow_policy)
+    handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+    return handler
+
+
+def build_log_record(message: str = 'hello %s', args: tuple[object, ...] = ('world',)) -> logging.LogRecord:
+    return logging.LogRecord(
+        name='app.test', level=logging.INFO, pathname=__file__, lineno=1, msg=message, args=args, exc_info=None
+    )
+
+
+def test_bounded_queue_handler_writes_formatted_records_on_close() -> None:
+    """Queue handler formats and writes every queued record before it closes."""
+    stream = io.StringIO()
+    handler = build_handler(stream)
+
+    handler.handle(build_log_record())
+    handler.close()
+
+    assert stream.getvalue() == 'INFO hello world\n'
+
+
+def test_bounded_queue_handler_freezes_message_arguments() -> None:
+    """Queue handler renders the message when logged, not when the listener gets to it."""
+    stream = io.StringIO()
+    handler = build_handler(stream)
+    handler.queue_listener.stop()
+    labels = ['before']
+
+    handler.handle(build_log_record(args=(labels,)))
+    labels[0] = 'after'
+    handler.queue_listener.start()
+    handler.close()
+
+    assert stream.getvalue() == "INFO hello ['before']\n"
+
+
+def test_bounded_queue_handler_counts_records_dropped_when_full() -> None:
+    """Queue handler drops and counts records that do not fit the queue under the drop policy."""
+    stream = io.StringIO()
+    handler = build_handler(stream, queue_size=1)
+    handler.queue_listener.stop()
+
+    for _ in range(3):
+        handler.handle(build_log_record())
+    handler.queue_listener.start()
+    handler.close()
+
+    assert (handler.dropped_records, stream.getvalue()) == (2, 'INFO hello world\n')
@@ -0,0 +1,138 @@
+import logging
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+import pytest
+from starlette.routing import Match
+from starlette.types import Scope
+
+from app.core.logging import AccessLogMiddleware, RequestContextMiddleware
+from app.core.logging.config import ACCESS_LOGGER_NAME
+from app.core.logging.context import record_dependency_time, request_context
+from app.core.logging.middleware import MAX_REQUEST_ID_LENGTH, REQUEST_ID_HEADER
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware)
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get('/items/{item_id}')
+    async def read_item(item_id: int) -> dict[str, str | None]:
+        record_dependency_time('database', 0.25)
+        context = request_context.get()
+        assert context is not None
+        return {
+            'request_id': context.request_id,
+            'method': context.method,
+            'route': context.route,
+            'user_agent': context.user_agent,
+        }
+
+    agents_router = APIRouter()
+
+    @agents_router.get('/agents/{agent_id}')
+    async def read_agent(agent_id: int) -> dict[str, str | None]:
+        context = request_context.get()
+        assert context is not None
+        return {'route': context.route}
+
+    router_v1 = APIRouter(prefix='/v1')
+    router_v1.include_router(agents_router)
+    app.include_router(router_v1)
+
+    return TestClient(app)
+
+
+def test_request_context_middleware_binds_request_metadata() -> None:
+    """Middleware exposes the request id, method, matched route and user agent to code serving the request."""
+    response = build_client().get('/items/1', headers={REQUEST_ID_HEADER: 'req-1', 'user-agent': 'curl/8.0'})
+
+    assert response.json() == {
+        'request_id': 'req-1',
+        'method': 'GET',
+        'route': '/items/{item_id}',
+        'user_agent': 'curl/8.0',
+    }
+
+
+def test_request_context_route_includes_router_prefixes() -> None:
+    """Route of a request served by an included router carries the prefixes it was included under."""
+    response = build_client().get('/v1/agents/1')
+
+    assert response.json() == {'route': '/v1/agents/{agent_id}'}
+
+
+def test_request_context_route_is_resolved_once_per_path() -> None:
+    """Repeated requests reuse the resolved route template instead of matching them against the routes again."""
+    matched_paths: list[str] = []
+
+    class CountingRoute(APIRoute):
+        def matches(self, scope: Scope) -> tuple[Match, Scope]:
+            matched_paths.append(scope['path'])
+            return super().matches(scope)
+
+    app = FastAPI()
+    app.router.route_class = CountingRoute
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get('/agents/{agent_id}')
+    async def read_agent(agent_id: int) -> dict[str, str | None]:
+        context = request_context.get()
+        assert context is not None
+        return {'route': context.route}
+
+    client = TestClient(app)
+    client.get('/agents/1')
+    matched_before = len(matched_paths)
+    response = client.get('/agents/1')
+
+    assert response.json() == {'route': '/agents/{agent_id}'}
+    # Only the router matched the second request
+    assert len(matched_paths) == matched_before + 1
+
+
+def test_request_context_middleware_returns_request_id_header() -> None:
+    """Middleware returns the request id it bound in the response headers."""
+    response = build_client().get('/items/1')
+
+    assert response.headers[REQUEST_ID_HEADER] == response.json()['request_id']
+
+
+def test_request_context_middleware_replaces_oversized_request_id() -> None:
+    """Middleware generates a new request id instead of logging an oversized client one."""
+    response = build_client().get('/items/1', headers={REQUEST_ID_HEADER: 'x' * (MAX_REQUEST_ID_LENGTH + 1)})
+
+    assert len(response.headers[REQUEST_ID_HEADER]) == 32
+
+
+def find_access_records(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+    return [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME]
+
+
+def test_access_log_middleware_logs_request_summary(caplog: pytest.LogCaptureFixture) -> None:
+    """Access log line carries the route template, status, response size and the time spent on dependencies."""
+    with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+        response = build_client().get('/items/1')
+
+    (record,) = find_access_records(caplog)
+    assert {key: record.__dict__[key] for key in ('status_code', 'response_bytes', 'database_ms')} == {
+        'status_code': 200,
+        'response_bytes': len(response.content),
+        'database_ms': 250.0,
+    }
+
+
+def test_access_log_middleware_logs_route_template(caplog: pytest.LogCaptureFixture) -> None:
+    """Access log message names the matched route template, or the raw path when no route matched."""
+    with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+        build_client().get('/items/1')
+        build_client().get('/v1/agents/1')
+        build_client().get('/missing')
+
+    assert [record.getMessage().rsplit(' ', 1)[0] for record in find_access_records(caplog)] == [
+        'GET /items/{item_id} 200',
+        'GET /v1/agents/{agent_id} 200',
+        'GET /missing 404',
+    ]
@@ -1,16 +1,94 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
+from pytest import MonkeyPatch
 
+from app.core.config import get_settings, Settings
 import app.core.observability.metrics.bootstrap as metrics_bootstrap
+from app.core.observability.metrics.multiprocess import MULTIPROCESS_DIR_ENV
+
+
+def build_settings(metrics_port: int | None = None, workers: int = 1) -> Settings:
+    data = get_settings().model_dump()
+    data.update(OBSERVABILITY_METRICS_ENABLED=True, OBSERVABILITY_METRICS_PORT=metrics_port, WORKERS=workers)
+    return Settings.model_validate(data)
+
+
+def build_app(registry: CollectorRegistry, settings: Settings | None = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/health/live')
+    async def health_check_liveness() -> dict[str, str]:
+        return {'status': 'UP'}
+
+    metrics_bootstrap.setup(app=app, settings=settings or build_settings(), registry=registry)
+    return app
 
 
 def test_setup_exposes_prometheus_metrics_endpoint() -> None:
     """Metrics setup exposes a Prometheus scrape endpoint."""
-    app = FastAPI()
+    app = build_app(CollectorRegistry())
+
+    response = TestClient(app).get('/metrics/')
+
+    assert response.status_code == 200
+
+
+def test_setup_observes_request_latency_with_section_buckets() -> None:
+    """Metrics setup observes request latency in the histogram and buckets of the route section."""
+    registry = CollectorRegistry()
+    client = TestClient(build_app(registry))
+
+    client.get('/health/live')
+
+    labels = {'method': 'GET', 'status': '2xx', 'handler': '/health/live', 'le': '0.0005'}
+    assert registry.get_sample_value('http_health_request_duration_seconds_bucket', labels) is not None
+
+
+def test_setup_leaves_metrics_endpoint_out_of_the_app_with_a_metrics_port() -> None:
+    """Metrics setup does not mount the scrape endpoint when metrics get their own port."""
+    app = build_app(CollectorRegistry(), settings=build_settings(metrics_port=9000))
 
-    metrics_bootstrap.setup(app=app)
     response = TestClient(app).get('/metrics/')
 
+    assert response.status_code == 404
+
+
+def test_start_metrics_server_serves_registry_on_metrics_port(monkeypatch: MonkeyPatch) -> None:
+    """Metrics server serves the registry on the configured port."""
+    registry = CollectorRegistry()
+    started: list[tuple[int, CollectorRegistry]] = []
+    monkeypatch.setattr(
+        metrics_bootstrap, 'start_http_server', lambda port, registry: started.append((port, registry))
+    )
+
+    metrics_bootstrap.start_metrics_server(build_settings(metrics_port=9000), registry=registry)
+
+    assert started == [(9000, registry)]
+
+
+def test_start_metrics_server_is_skipped_without_metrics_port(monkeypatch: MonkeyPatch) -> None:
+    """Metrics server is not started when metrics stay mounted on the application."""
+    started: list[int] = []
+    monkeypatch.setattr(metrics_bootstrap, 'start_http_server', lambda port, registry: started.append(port))
+
+    metrics_bootstrap.start_metrics_server(build_settings(), registry=CollectorRegistry())
+
+    assert started == []
+
+
+def test_metrics_port_without_multiprocess_dir_falls_back_to_app_mount(monkeypatch: MonkeyPatch) -> None:
+    """With several workers and no shared multiprocess dir the launching process would serve none of their metrics,
+    so the port is ignored and every worker keeps serving its own."""
+    monkeypatch.delenv(MULTIPROCESS_DIR_ENV, raising=False)
+    started: list[int] = []
+    monkeypatch.setattr(metrics_bootstrap, 'start_http_server', lambda port, registry: started.append(port))
+    settings = build_settings(metrics_port=9000, workers=4)
+
+    metrics_bootstrap.start_metrics_server(settings, registry=CollectorRegistry())
+    response = TestClient(build_app(CollectorRegistry(), settings=settings)).get('/metrics/')
+
+    assert started == []
     assert response.status_code == 200
 {%- endif %}
@@ -1,4 +1,7 @@
 {%- if cookiecutter.use_otel_observability == "yes" %}
+import asyncio
+import timeit
+
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 import pytest
 from pytest import MonkeyPatch
@@ -235,4 +238,89 @@ async def test_track_latency_records_async_duration(monkeypatch: MonkeyPatch) ->
     await sample()
 
     assert get_metric_value(histogram, 'test_track_latency_async_sum_sum') == 0.5
+
+
+def test_track_call_tracks_every_metric_of_a_successful_call() -> None:
+    """Fused tracking counts completions and releases the inflight gauge after a successful call."""
+    gauge = build_gauge('test_track_call_success_inflight')
+    counter = build_counter('test_track_call_success_completed')
+    errors = build_counter('test_track_call_success_errors')
+
+    @metrics_decorators.track_call(inflight=gauge, completed=counter, errors=errors)
+    def sample() -> None:
+        return None
+
+    sample()
+
+    assert (
+        get_metric_value(gauge, 'test_track_call_success_inflight'),
+        get_metric_value(counter, 'test_track_call_success_completed_total'),
+        get_metric_value(errors, 'test_track_call_success_errors_total'),
+    ) == (0.0, 1.0, 0.0)
+
+
+async def test_track_call_tracks_every_metric_of_a_failed_call() -> None:
+    """Fused tracking counts errors, and completions when success-only mode is disabled, after a failed call."""
+    gauge = build_gauge('test_track_call_error_inflight')
+    counter = build_counter('test_track_call_error_completed')
+    errors = build_counter('test_track_call_error_errors')
+
+    @metrics_decorators.track_call(inflight=gauge, completed=counter, success_only=False, errors=errors)
+    async def sample() -> None:
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        await sample()
+
+    assert (
+        get_metric_value(gauge, 'test_track_call_error_inflight'),
+        get_metric_value(counter, 'test_track_call_error_completed_total'),
+        get_metric_value(errors, 'test_track_call_error_errors_total'),
+    ) == (0.0, 1.0, 1.0)
+
+
+async def test_track_call_decrements_inflight_gauge_after_cancellation() -> None:
+    """Fused tracking releases the inflight gauge when the call is cancelled."""
+    gauge = build_gauge('test_track_call_cancelled_inflight')
+    errors = build_counter('test_track_call_cancelled_errors')
+
+    @metrics_decorators.track_call(inflight=gauge, errors=errors)
+    async def sample() -> None:
+        await asyncio.Event().wait()
+
+    task = asyncio.create_task(sample())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert (
+        get_metric_value(gauge, 'test_track_call_cancelled_inflight'),
+        get_metric_value(errors, 'test_track_call_cancelled_errors_total'),
+    ) == (0.0, 0.0)
+
+
+def test_track_call_is_cheaper_than_stacked_decorators() -> None:
+    """Fused tracking adds less overhead per call than stacking one decorator per metric."""
+    gauge = build_gauge('test_track_call_benchmark_inflight')
+    counter = build_counter('test_track_call_benchmark_completed')
+    errors = build_counter('test_track_call_benchmark_errors')
+
+    @metrics_decorators.track_inflight(gauge)
+    @metrics_decorators.increment_after(counter)
+    @metrics_decorators.increment_on_error(errors)
+    def stacked() -> None:
+        return None
+
+    @metrics_decorators.track_call(inflight=gauge, completed=counter, errors=errors)
+    def fused() -> None:
+        return None
+
+    # Interleaved, so a burst of load on the machine slows down both sides instead of only one
+    stacked_seconds, fused_seconds = float('inf'), float('inf')
+    for _ in range(10):
+        stacked_seconds = min(stacked_seconds, timeit.timeit(stacked, number=2_000))
+        fused_seconds = min(fused_seconds, timeit.timeit(fused, number=2_000))
+
+    assert fused_seconds < stacked_seconds
 {%- endif %}
@@ -0,0 +1,89 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from fastapi import Request, Response
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace import format_trace_id
+from prometheus_client import CollectorRegistry
+from prometheus_client.samples import Exemplar
+from prometheus_fastapi_instrumentator.metrics import Info
+import pytest
+
+from app.core.observability.metrics.latency import request_latency, resolve_section
+from app.core.observability.metrics.primitives import Section
+
+BUCKETS = {section: (0.1, 1.0) for section in Section}
+
+
+def build_info(handler: str = '/health/live', duration: float = 0.05) -> Info:
+    return Info(
+        request=Request({'type': 'http', 'method': 'GET', 'path': handler, 'headers': []}),
+        response=Response(),
+        method='GET',
+        modified_handler=handler,
+        modified_status='2xx',
+        modified_duration=duration,
+    )
+
+
+def get_bucket_exemplar(registry: CollectorRegistry, name: str, le: str) -> Exemplar | None:
+    for metric_family in registry.collect():
+        for sample in metric_family.samples:
+            if sample.name == f'{name}_bucket' and sample.labels['le'] == le:
+                return sample.exemplar
+    raise AssertionError(f'Bucket {le} of {name!r} not found')
+
+
+@pytest.mark.parametrize(
+    ('handler', 'section'),
+    [
+        ('/health/ready', Section.HEALTH),
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+        ('/v1/agents/examples/conversations', Section.AGENT),
+{%- endif %}
+{%- if cookiecutter.project_type in ["fastapi_db", "fastapi_db_agent"] %}
+        ('/v1/examples/{example_id}', Section.EXAMPLES),
+{%- endif %}
+        ('/docs', Section.GENERAL),
+    ],
+)
+def test_resolve_section_matches_route_prefix(handler: str, section: Section) -> None:
+    """Route templates resolve to the section of their prefix, or GENERAL."""
+    assert resolve_section(handler) is section
+
+
+def test_request_latency_observes_in_section_histogram() -> None:
+    """Latency instrumentation observes each request in the histogram of its section only."""
+    registry = CollectorRegistry()
+    instrumentation = request_latency(BUCKETS, registry=registry)
+
+    instrumentation(build_info(duration=0.05))
+
+    labels = {'method': 'GET', 'status': '2xx', 'handler': '/health/live'}
+    assert (
+        registry.get_sample_value('http_health_request_duration_seconds_bucket', {**labels, 'le': '0.1'}),
+        registry.get_sample_value('http_general_request_duration_seconds_count', labels),
+    ) == (1.0, None)
+
+
+def test_request_latency_attaches_sampled_trace_id_as_exemplar() -> None:
+    """Latency instrumentation links observations made inside a sampled trace to it with an exemplar."""
+    registry = CollectorRegistry()
+    instrumentation = request_latency(BUCKETS, registry=registry)
+    tracer = TracerProvider().get_tracer(__name__)
+
+    with tracer.start_as_current_span('request') as span:
+        instrumentation(build_info(duration=0.05))
+
+    exemplar = get_bucket_exemplar(registry, 'http_health_request_duration_seconds', '0.1')
+    assert exemplar is not None
+    assert exemplar.labels == {'trace_id': format_trace_id(span.get_span_context().trace_id)}
+
+
+def test_request_latency_skips_exemplar_outside_trace() -> None:
+    """Latency instrumentation observes without an exemplar when no trace is active."""
+    registry = CollectorRegistry()
+    instrumentation = request_latency(BUCKETS, registry=registry)
+
+    instrumentation(build_info(duration=0.05))
+
+    assert get_bucket_exemplar(registry, 'http_health_request_duration_seconds', '0.1') is None
+{%- endif %}
@@ -0,0 +1,62 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from prometheus_client.mmap_dict import mmap_key, MmapedDict
+from pytest import MonkeyPatch
+
+from app.core.observability.metrics.multiprocess import (
+    create_multiprocess_registry,
+    mark_dead_workers,
+    MULTIPROCESS_DIR_ENV,
+    reset_multiprocess_dir,
+)
+
+
+def write_metric_file(path: Path, name: str, value: float) -> None:
+    metric_file = MmapedDict(str(path))
+    metric_file.write_value(mmap_key(name, name, [], [], 'Test metric'), value, 0.0)
+    metric_file.close()
+
+
+def get_dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, '-c', ''])  # noqa: S603
+    process.wait()
+    return process.pid
+
+
+def test_reset_multiprocess_dir_removes_metric_files_of_previous_run(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Resetting the multiprocess directory removes the metric files left by a previous run."""
+    monkeypatch.setenv(MULTIPROCESS_DIR_ENV, str(tmp_path))
+    write_metric_file(tmp_path / 'counter_123.db', 'test_requests_total', 1.0)
+
+    reset_multiprocess_dir()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_mark_dead_workers_drops_only_live_gauges_of_dead_workers(tmp_path: Path) -> None:
+    """Live gauges of dead workers are dropped, their counters and the gauges of running workers are kept."""
+    dead_pid, running_pid = get_dead_pid(), os.getpid()
+    for file_name in (f'gauge_livesum_{dead_pid}.db', f'counter_{dead_pid}.db', f'gauge_livesum_{running_pid}.db'):
+        write_metric_file(tmp_path / file_name, 'test_metric', 1.0)
+
+    mark_dead_workers(tmp_path)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f'counter_{dead_pid}.db',
+        f'gauge_livesum_{running_pid}.db',
+    ]
+
+
+def test_create_multiprocess_registry_sums_counters_of_every_worker(tmp_path: Path) -> None:
+    """The multiprocess registry collects the metrics written by every worker process."""
+    write_metric_file(tmp_path / 'counter_1.db', 'test_requests_total', 2.0)
+    write_metric_file(tmp_path / 'counter_2.db', 'test_requests_total', 3.0)
+
+    registry = create_multiprocess_registry(tmp_path)
+
+    assert registry.get_sample_value('test_requests_total') == 5.0
+{%- endif %}
@@ -38,7 +38,7 @@ class ObservabilitySetupSpy:
     def setup_tracing(self, *, app: FastAPI, settings: Settings) -> None:
         self.tracing_settings = settings
 
-    def setup_metrics(self, *, app: FastAPI) -> None:
+    def setup_metrics(self, *, app: FastAPI, settings: Settings) -> None:
         self.metrics_app = app
 
 
@@ -2,12 +2,14 @@
 from typing import TypedDict, Unpack
 
 from fastapi import FastAPI
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON
 from opentelemetry.semconv.attributes import service_attributes
 import pytest
 from pytest import MonkeyPatch
 
 from app.core.config import get_settings, Settings
 import app.core.observability.tracing.bootstrap as tracing_bootstrap
+from app.core.observability.tracing.sampling import TailSamplingSpanProcessor
 from tests.unit.core.observability.mocks import SpanExporterSpy, TracingBootstrapSpy
 
 
@@ -18,6 +20,7 @@ class SettingsOverrides(TypedDict, total=False):
     OBSERVABILITY_METRICS_ENABLED: bool
     OBSERVABILITY_TRACING_SAMPLE_RATE_PERCENT: float
     OBSERVABILITY_TRACING_OTLP_ENDPOINT: str | None
+    OBSERVABILITY_TRACING_TAIL_SAMPLING_ENABLED: bool
 
 
 def build_settings(**overrides: Unpack[SettingsOverrides]) -> Settings:
@@ -84,6 +87,14 @@ def test_setup_converts_sampling_percent_to_ratio(monkeypatch: MonkeyPatch) -> N
     assert spy.sampler is not None and spy.sampler.ratio == 0.25
 
 
+def test_setup_records_every_span_when_tail_sampling_is_enabled(monkeypatch: MonkeyPatch) -> None:
+    """Tracing setup records every span and leaves the sampling decision to the tail sampling processor."""
+    spy = setup_tracing(monkeypatch, OBSERVABILITY_TRACING_TAIL_SAMPLING_ENABLED=True)
+
+    assert spy.tracer_provider is not None and spy.tracer_provider.sampler is ALWAYS_ON
+    assert isinstance(spy.tracer_provider.span_processor, TailSamplingSpanProcessor)
+
+
 def test_setup_uses_secure_exporter_for_https_endpoint(monkeypatch: MonkeyPatch) -> None:
     """Tracing setup keeps the OTLP exporter secure for HTTPS endpoints."""
     spy = setup_tracing(monkeypatch, OBSERVABILITY_TRACING_OTLP_ENDPOINT='https://collector.internal:4317')
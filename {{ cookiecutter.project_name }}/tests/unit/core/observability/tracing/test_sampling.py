@@ -0,0 +1,102 @@
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.semconv.attributes import http_attributes
+from opentelemetry.trace import set_span_in_context, Status, StatusCode, Tracer
+
+from app.core.observability.tracing.sampling import TailSamplingSpanProcessor
+
+SECOND = 1_000_000_000
+
+
+def build_tracer(exporter: InMemorySpanExporter, sample_ratio: float = 0.0, max_buffered_spans: int = 100) -> Tracer:
+    provider = TracerProvider()
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(
+            SimpleSpanProcessor(exporter),
+            sample_ratio=sample_ratio,
+            slow_seconds=1.0,
+            slow_route_seconds=(('/v1/agents', 30.0),),
+            max_buffered_spans=max_buffered_spans,
+        )
+    )
+    return provider.get_tracer(__name__)
+
+
+def run_request(
+    tracer: Tracer, route: str = '/v1/items', duration_seconds: float = 0.1, child_status: StatusCode = StatusCode.OK
+) -> None:
+    root = tracer.start_span('request', start_time=0, attributes={http_attributes.HTTP_ROUTE: route})
+    child = tracer.start_span('query', context=set_span_in_context(root), start_time=0)
+    child.set_status(Status(child_status))
+    child.end(end_time=1)
+    root.end(end_time=int(duration_seconds * SECOND))
+
+
+def get_exported_names(exporter: InMemorySpanExporter) -> list[str]:
+    return [span.name for span in exporter.get_finished_spans()]
+
+
+def test_tail_sampling_drops_fast_successful_traces_outside_sample_ratio() -> None:
+    """Tail sampling drops traces that neither failed nor were slow when the sample ratio excludes them."""
+    exporter = InMemorySpanExporter()
+
+    run_request(build_tracer(exporter))
+
+    assert get_exported_names(exporter) == []
+
+
+def test_tail_sampling_keeps_whole_trace_with_a_failed_span() -> None:
+    """Tail sampling exports every span of a trace in which any span failed."""
+    exporter = InMemorySpanExporter()
+
+    run_request(build_tracer(exporter), child_status=StatusCode.ERROR)
+
+    assert get_exported_names(exporter) == ['query', 'request']
+
+
+def test_tail_sampling_keeps_traces_slower_than_default_threshold() -> None:
+    """Tail sampling exports traces whose root span took longer than the default threshold."""
+    exporter = InMemorySpanExporter()
+
+    run_request(build_tracer(exporter), duration_seconds=5.0)
+
+    assert get_exported_names(exporter) == ['query', 'request']
+
+
+def test_tail_sampling_applies_route_threshold() -> None:
+    """Tail sampling judges slowness against the threshold of the matching route prefix."""
+    exporter = InMemorySpanExporter()
+    tracer = build_tracer(exporter)
+
+    run_request(tracer, route='/v1/agents/examples/conversations', duration_seconds=5.0)
+    run_request(tracer, route='/v1/agents/examples/conversations', duration_seconds=45.0)
+
+    assert len(exporter.get_finished_spans()) == 2
+
+
+def test_tail_sampling_keeps_traces_within_sample_ratio() -> None:
+    """Tail sampling exports fast successful traces picked by the sample ratio."""
+    exporter = InMemorySpanExporter()
+
+    run_request(build_tracer(exporter, sample_ratio=1.0))
+
+    assert get_exported_names(exporter) == ['query', 'request']
+
+
+def test_tail_sampling_drops_oldest_unfinished_traces_over_buffer_limit() -> None:
+    """Tail sampling drops the buffered spans of the oldest unfinished trace once the buffer is full."""
+    exporter = InMemorySpanExporter()
+    tracer = build_tracer(exporter, max_buffered_spans=1)
+    roots = [tracer.start_span('request', start_time=0) for _ in range(2)]
+    for root in roots:
+        child = tracer.start_span('query', context=set_span_in_context(root), start_time=0)
+        child.set_status(Status(StatusCode.ERROR))
+        child.end(end_time=1)
+
+    for root in roots:
+        root.end(end_time=1)
+
+    assert get_exported_names(exporter) == ['query', 'request']
+{%- endif %}
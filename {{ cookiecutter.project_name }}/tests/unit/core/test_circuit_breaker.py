@@ -0,0 +1,92 @@
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+import asyncio
+
+from freezegun import freeze_time
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.exceptions import ServiceUnavailableError
+
+
+def build_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(name='openai:gpt-5.4', failure_threshold=3, recovery_seconds=30)
+    for _ in range(3):
+        breaker.check()
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = build_open_breaker()
+
+    assert breaker.state == 'open'
+    with pytest.raises(ServiceUnavailableError):
+        breaker.check()
+
+
+def test_success_resets_failure_count() -> None:
+    breaker = CircuitBreaker(name='database', failure_threshold=3, recovery_seconds=30)
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == 'closed'
+
+
+@pytest.mark.parametrize(('succeeds', 'expected_state'), [(True, 'closed'), (False, 'open')])
+def test_half_open_call_decides_next_state(succeeds: bool, expected_state: str) -> None:
+    """After the recovery time calls go through again, the first outcome closes or re-opens the circuit."""
+    with freeze_time() as frozen_time:
+        breaker = build_open_breaker()
+        frozen_time.tick(31)
+
+        breaker.check()
+        assert breaker.state == 'half_open'
+        if succeeds:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        assert breaker.state == expected_state
+
+
+async def test_half_open_lets_a_single_trial_call_through_concurrent_callers() -> None:
+    """Once the recovery time passed only one of many concurrent callers reaches the dependency."""
+    with freeze_time() as frozen_time:
+        breaker = build_open_breaker()
+        frozen_time.tick(31)
+        release_trial = asyncio.Event()
+
+        async def call() -> str:
+            try:
+                breaker.check()
+            except ServiceUnavailableError:
+                return 'rejected'
+            await release_trial.wait()
+            breaker.record_success()
+            return 'called'
+
+        calls = [asyncio.create_task(call()) for _ in range(50)]
+        await asyncio.sleep(0)
+        release_trial.set()
+        outcomes = await asyncio.gather(*calls)
+
+        assert (outcomes.count('called'), outcomes.count('rejected'), breaker.state) == (1, 49, 'closed')
+
+
+def test_half_open_trial_is_replaced_when_it_never_reports_back() -> None:
+    """A trial call that neither succeeded nor failed does not keep the circuit rejecting forever."""
+    with freeze_time() as frozen_time:
+        breaker = build_open_breaker()
+        frozen_time.tick(31)
+        breaker.check()
+        with pytest.raises(ServiceUnavailableError):
+            breaker.check()
+
+        frozen_time.tick(31)
+
+        breaker.check()
+        assert breaker.state == 'half_open'
+{%- endif %}
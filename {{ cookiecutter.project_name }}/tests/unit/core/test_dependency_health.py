@@ -0,0 +1,42 @@
+{%- if cookiecutter.project_type != "fastapi_slim" %}
+from freezegun import freeze_time
+
+from app.core.dependency_health import DependencyHealthTracker
+
+
+def build_tracker() -> DependencyHealthTracker:
+    return DependencyHealthTracker(name='database', window_seconds=60, min_calls=4, max_error_rate=0.5)
+
+
+def record(tracker: DependencyHealthTracker, successes: int, failures: int) -> None:
+    for _ in range(successes):
+        tracker.record_success()
+    for _ in range(failures):
+        tracker.record_failure()
+
+
+def test_health_is_unknown_without_enough_traffic() -> None:
+    tracker = build_tracker()
+    record(tracker, successes=1, failures=2)
+
+    assert tracker.is_healthy() is None
+
+
+def test_health_follows_recent_error_rate() -> None:
+    healthy, unhealthy = build_tracker(), build_tracker()
+    record(healthy, successes=2, failures=2)
+    record(unhealthy, successes=1, failures=3)
+
+    assert healthy.is_healthy() is True
+    assert unhealthy.is_healthy() is False
+
+
+def test_outcomes_expire_after_window() -> None:
+    """A past outage stops counting once it leaves the window."""
+    tracker = build_tracker()
+    with freeze_time() as frozen_time:
+        record(tracker, successes=0, failures=10)
+        frozen_time.tick(61)
+
+        assert tracker.is_healthy() is None
+{%- endif %}
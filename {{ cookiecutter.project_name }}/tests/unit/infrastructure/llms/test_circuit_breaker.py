@@ -0,0 +1,68 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from collections.abc import AsyncIterator
+
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.infrastructure.llms.circuit_breaker import CircuitBreakerModel
+from app.infrastructure.llms.llm_models import is_retryable_provider_error
+
+
+def build_open_circuit_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(name='openai:gpt-5.4', failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure()
+    return breaker
+
+
+async def test_open_circuit_skips_to_fallback_model() -> None:
+    """The primary model is not called while its circuit is open, the next model in the chain answers."""
+    primary = TestModel(custom_output_text='primary')
+    model = FallbackModel(
+        CircuitBreakerModel(primary, build_open_circuit_breaker(), is_retryable_provider_error),
+        TestModel(custom_output_text='fallback'),
+        fallback_on=is_retryable_provider_error,
+    )
+
+    result = await Agent(model).run('How many examples do we have?')
+
+    assert result.output == 'fallback'
+    assert primary.last_model_request_parameters is None
+
+
+async def test_open_circuit_skips_to_fallback_model_when_streaming() -> None:
+    primary = TestModel(custom_output_text='primary')
+    model = FallbackModel(
+        CircuitBreakerModel(primary, build_open_circuit_breaker(), is_retryable_provider_error),
+        TestModel(custom_output_text='fallback'),
+        fallback_on=is_retryable_provider_error,
+    )
+
+    async with Agent(model).run_stream('How many examples do we have?') as result:
+        output = await result.get_output()
+
+    assert output == 'fallback'
+    assert primary.last_model_request_parameters is None
+
+
+async def test_streamed_provider_failure_opens_circuit() -> None:
+    """A provider failure in the middle of a stream counts like a failed request."""
+
+    async def fail_midway(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        yield 'There are'
+        raise ModelHTTPError(status_code=503, model_name='gpt-5.4')
+
+    breaker = CircuitBreaker(name='openai:gpt-5.4', failure_threshold=1, recovery_seconds=30)
+    model = CircuitBreakerModel(FunctionModel(stream_function=fail_midway), breaker, is_retryable_provider_error)
+
+    with pytest.raises(ModelHTTPError):
+        async with Agent(model).run_stream('How many examples do we have?') as result:
+            await result.get_output()
+
+    assert breaker.is_rejecting is True
+{%- endif %}
@@ -0,0 +1,62 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from collections.abc import AsyncIterator
+from typing import Never
+
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.models.test import TestModel
+import pytest
+
+from app.core.dependency_health import DependencyHealthTracker
+from app.infrastructure.llms.health_tracking import HealthTrackingModel
+from app.infrastructure.llms.llm_models import is_retryable_provider_error
+
+
+def build_tracker() -> DependencyHealthTracker:
+    return DependencyHealthTracker(name='openai', window_seconds=60, min_calls=1, max_error_rate=0.0)
+
+
+def build_failing_model(status_code: int) -> FunctionModel:
+    def fail(messages: list[ModelMessage], info: AgentInfo) -> Never:
+        raise ModelHTTPError(status_code=status_code, model_name='gpt-5.4')
+
+    async def fail_midway(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+        yield 'pong'
+        raise ModelHTTPError(status_code=status_code, model_name='gpt-5.4')
+
+    return FunctionModel(fail, stream_function=fail_midway)
+
+
+async def test_successful_requests_are_recorded() -> None:
+    tracker = build_tracker()
+
+    await Agent(HealthTrackingModel(TestModel(), tracker, is_retryable_provider_error)).run('ping')
+
+    assert tracker.is_healthy() is True
+
+
+@pytest.mark.parametrize(('status_code', 'expected'), [(503, False), (400, True)])
+async def test_only_provider_failures_count_against_health(status_code: int, expected: bool) -> None:
+    """A rejected request means the provider answered, only outages and throttling make it unhealthy."""
+    tracker = build_tracker()
+    model = HealthTrackingModel(build_failing_model(status_code), tracker, is_retryable_provider_error)
+
+    with pytest.raises(ModelHTTPError):
+        await Agent(model).run('ping')
+
+    assert tracker.is_healthy() is expected
+
+
+@pytest.mark.parametrize(('status_code', 'expected'), [(503, False), (400, True)])
+async def test_only_provider_failures_of_streams_count_against_health(status_code: int, expected: bool) -> None:
+    tracker = build_tracker()
+    model = HealthTrackingModel(build_failing_model(status_code), tracker, is_retryable_provider_error)
+
+    with pytest.raises(ModelHTTPError):
+        async with Agent(model).run_stream('ping') as result:
+            await result.get_output()
+
+    assert tracker.is_healthy() is expected
+{%- endif %}
@@ -0,0 +1,96 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from typing import Any, cast
+
+from botocore.exceptions import ClientError
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models.test import TestModel
+import pytest
+
+from app.core.enums import AIModelName
+from app.infrastructure.llms.llm_models import (
+    build_model_with_fallbacks,
+    is_retryable_provider_error,
+    ModelRegistry,
+    resolve_model_name,
+)
+
+
+def build_registry() -> ModelRegistry:
+    return {model_name: TestModel(model_name=model_name) for model_name in AIModelName}
+
+
+def build_bedrock_error(code: str) -> ClientError:
+    return ClientError(
+        error_response=cast(Any, {'Error': {'Code': code, 'Message': code}}),
+        operation_name='Converse',
+    )
+
+
+def test_build_model_with_fallbacks_returns_requested_model_without_chain() -> None:
+    """Without configured fallbacks the requested model is used as is."""
+    registry = build_registry()
+
+    model = build_model_with_fallbacks(registry, AIModelName.SONNET_4_6, [])
+
+    assert model is registry[AIModelName.SONNET_4_6]
+
+
+def test_build_model_with_fallbacks_chains_models_in_configured_order() -> None:
+    """Fallback models follow the requested model in the configured order."""
+    registry = build_registry()
+
+    model = build_model_with_fallbacks(
+        registry, AIModelName.SONNET_4_6, [AIModelName.HAIKU_4_5, AIModelName.GPT_5_4_MINI]
+    )
+
+    assert isinstance(model, FallbackModel)
+    assert model.models == [
+        registry[AIModelName.SONNET_4_6],
+        registry[AIModelName.HAIKU_4_5],
+        registry[AIModelName.GPT_5_4_MINI],
+    ]
+
+
+def test_build_model_with_fallbacks_skips_requested_and_duplicate_models() -> None:
+    """The requested model and repeated entries are not tried twice."""
+    registry = build_registry()
+
+    model = build_model_with_fallbacks(
+        registry, AIModelName.HAIKU_4_5, [AIModelName.HAIKU_4_5, AIModelName.GPT_5_4_MINI, AIModelName.GPT_5_4_MINI]
+    )
+
+    assert isinstance(model, FallbackModel)
+    assert model.models == [registry[AIModelName.HAIKU_4_5], registry[AIModelName.GPT_5_4_MINI]]
+
+
+@pytest.mark.parametrize(
+    ('response_model_name', 'expected'),
+    [
+        ('haiku-4.5', AIModelName.HAIKU_4_5),
+        ('gpt-5.4-mini-2026-03-17', AIModelName.GPT_5_4_MINI),
+        ('gpt-5.4-2026-03-05', AIModelName.GPT_5_4),
+        ('unknown-model', None),
+        (None, None),
+    ],
+)
+def test_resolve_model_name(response_model_name: str | None, expected: AIModelName | None) -> None:
+    """The registry model whose name is the longest prefix of the response model name answered."""
+    assert resolve_model_name(build_registry(), response_model_name) == expected
+
+
+@pytest.mark.parametrize(
+    ('exc', 'expected'),
+    [
+        (ModelHTTPError(status_code=429, model_name='sonnet'), True),
+        (ModelHTTPError(status_code=503, model_name='sonnet'), True),
+        (ModelHTTPError(status_code=400, model_name='sonnet'), False),
+        (build_bedrock_error('ThrottlingException'), True),
+        (build_bedrock_error('ValidationException'), False),
+        (ValueError('bad output'), False),
+    ],
+)
+def test_is_retryable_provider_error(exc: Exception, expected: bool) -> None:
+    """Only throttling and availability errors move the request to the next model."""
+    assert is_retryable_provider_error(exc) is expected
+{%- endif %}
@@ -0,0 +1,70 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from collections.abc import AsyncIterator
+
+{%- endif %}
+import httpx2
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from prometheus_client import REGISTRY
+import pytest
+{%- endif %}
+
+from app.core.config import get_settings
+from app.infrastructure.llms.provider_openai import get_openai_client, get_openai_http_client
+{%- if cookiecutter.use_otel_observability == "yes" %}
+from app.infrastructure.llms.provider_openai import InflightTrackingTransport
+{%- endif %}
+
+
+def test_openai_http_client_applies_configured_timeouts() -> None:
+    settings = get_settings().model_copy(update={'OPENAI_CONNECT_TIMEOUT': 3, 'OPENAI_READ_TIMEOUT': 90})
+
+    http_client = get_openai_http_client(settings)
+
+    assert http_client.timeout == httpx2.Timeout(settings.OPENAI_TIMEOUT, connect=3, read=90)
+
+
+def test_openai_clients_share_one_http_client() -> None:
+    settings = get_settings()
+    http_client = get_openai_http_client(settings)
+
+    assert get_openai_client(settings, http_client) is get_openai_client(settings, get_openai_http_client(settings))
+    assert get_openai_http_client(settings) is http_client
+{%- if cookiecutter.use_otel_observability == "yes" %}
+
+
+def get_inflight_requests() -> float:
+    return REGISTRY.get_sample_value('openai_http_requests_inflight') or 0.0
+
+
+async def test_inflight_requests_are_tracked_until_response_body_is_closed() -> None:
+    """Streamed responses keep their connection busy until read, so they count as in flight until closed."""
+
+    async def stream_body() -> AsyncIterator[bytes]:
+        yield b'{}'
+
+    transport = InflightTrackingTransport(httpx2.MockTransport(lambda _: httpx2.Response(200, content=stream_body())))
+    baseline = get_inflight_requests()
+
+    async with httpx2.AsyncClient(transport=transport) as client:
+        async with client.stream('GET', 'https://api.openai.test/v1/models') as response:
+            assert get_inflight_requests() == baseline + 1
+            await response.aread()
+
+    assert get_inflight_requests() == baseline
+
+
+async def test_inflight_requests_are_released_when_request_fails() -> None:
+    def fail(request: httpx2.Request) -> httpx2.Response:
+        raise httpx2.ConnectError('connection refused', request=request)
+
+    transport = InflightTrackingTransport(httpx2.MockTransport(fail))
+    baseline = get_inflight_requests()
+
+    async with httpx2.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx2.ConnectError):
+            await client.get('https://api.openai.test/v1/models')
+
+    assert get_inflight_requests() == baseline
+{%- endif %}
+{%- endif %}
@@ -0,0 +1,80 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from pathlib import Path
+
+from pydantic_ai import Agent
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.tools import ToolDefinition
+import pytest
+
+from app.infrastructure.llms.record_replay import RecordingNotFoundError, RecordReplayModel, ReplayLatencySampler
+
+NO_LATENCY = ReplayLatencySampler(kind='none')
+
+
+async def test_replay_returns_recorded_response_instead_of_calling_provider(tmp_path: Path) -> None:
+    """A recorded exchange is replayed verbatim, the wrapped model is not called."""
+    recorder = RecordReplayModel(TestModel(custom_output_text='recorded'), 'record', tmp_path, NO_LATENCY)
+    await Agent(recorder).run('How many examples do we have?')
+
+    replayer = RecordReplayModel(TestModel(custom_output_text='live'), 'replay', tmp_path, NO_LATENCY)
+    result = await Agent(replayer).run('How many examples do we have?')
+
+    assert result.output == 'recorded'
+
+
+async def test_replay_without_recording_raises(tmp_path: Path) -> None:
+    recorder = RecordReplayModel(TestModel(custom_output_text='recorded'), 'record', tmp_path, NO_LATENCY)
+    await Agent(recorder).run('How many examples do we have?')
+
+    replayer = RecordReplayModel(TestModel(), 'replay', tmp_path, NO_LATENCY)
+    with pytest.raises(RecordingNotFoundError):
+        await Agent(replayer).run('Which examples were created today?')
+
+
+async def test_replay_matches_recording_despite_other_timestamps_and_run_ids(tmp_path: Path) -> None:
+    """Two runs of the same conversation map to the same recording."""
+    first = await Agent(TestModel()).run('How many examples do we have?')
+    second = await Agent(TestModel()).run('How many examples do we have?')
+    recorder = RecordReplayModel(TestModel(custom_output_text='recorded'), 'record', tmp_path, NO_LATENCY)
+    replayer = RecordReplayModel(TestModel(custom_output_text='live'), 'replay', tmp_path, NO_LATENCY)
+    parameters = ModelRequestParameters()
+
+    # Resend the requests of each run, without the response which answered them
+    recorded = await recorder.request(first.all_messages()[:-1], None, parameters)
+    replayed = await replayer.request(second.all_messages()[:-1], None, parameters)
+
+    assert first.all_messages() != second.all_messages()
+    assert replayed.parts == recorded.parts
+
+
+async def test_replay_of_other_tools_raises(tmp_path: Path) -> None:
+    """The available tools are part of what the model sees, so a changed tool set needs a new recording."""
+    messages = (await Agent(TestModel()).run('How many examples do we have?')).all_messages()[:-1]
+    recorder = RecordReplayModel(TestModel(custom_output_text='recorded'), 'record', tmp_path, NO_LATENCY)
+    replayer = RecordReplayModel(TestModel(), 'replay', tmp_path, NO_LATENCY)
+    await recorder.request(messages, None, ModelRequestParameters())
+
+    tools = ModelRequestParameters(function_tools=[ToolDefinition(name='count_examples')])
+    with pytest.raises(RecordingNotFoundError):
+        await replayer.request(messages, None, tools)
+
+
+@pytest.mark.parametrize(
+    ('sampler', 'expected'),
+    [
+        (ReplayLatencySampler(kind='none'), 0.0),
+        (ReplayLatencySampler(kind='recorded'), 1.5),
+    ],
+)
+def test_latency_sampler(sampler: ReplayLatencySampler, expected: float) -> None:
+    assert sampler.sample(recorded_seconds=1.5) == expected
+
+
+def test_lognormal_latency_is_positive_around_median() -> None:
+    sampler = ReplayLatencySampler(kind='lognormal', median_seconds=2.0, sigma=0.1)
+
+    samples = [sampler.sample(recorded_seconds=0.0) for _ in range(100)]
+
+    assert all(1.0 < sample < 4.0 for sample in samples)
+{%- endif %}
@@ -0,0 +1,18 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from app.core.logging.context import request_context, RequestContext
+from app.infrastructure.llms.timing import RequestTimingModel
+
+
+async def test_model_request_time_is_added_to_request_context() -> None:
+    context = RequestContext(request_id='req-1', method='POST', user_agent=None, scope={})
+    token = request_context.set(context)
+    try:
+        await Agent(RequestTimingModel(TestModel())).run('ping')
+    finally:
+        request_context.reset(token)
+
+    assert context.dependency_seconds['llm'] > 0
+{%- endif %}
@@ -0,0 +1,62 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from pytest import MonkeyPatch
+
+from app.core.config import get_settings
+from app.infrastructure.llms import warmup
+from app.infrastructure.llms.provider_bedrock import get_bedrock_client
+from app.infrastructure.llms.provider_openai import get_openai_client
+from tests.dependencies import resolve_dependency
+from tests.mocks.llm_client_mocks import record_llm_client_calls
+
+
+def patch_clients(monkeypatch: MonkeyPatch, count_tokens: Mock, list_models: AsyncMock) -> None:
+    monkeypatch.setattr(warmup, 'get_bedrock_client', lambda **_: SimpleNamespace(count_tokens=count_tokens))
+    monkeypatch.setattr(warmup, 'get_openai_http_client', lambda **_: None)
+    monkeypatch.setattr(
+        warmup, 'get_openai_client', lambda **_: SimpleNamespace(models=SimpleNamespace(list=list_models))
+    )
+
+
+async def test_warm_up_sends_one_request_per_provider(monkeypatch: MonkeyPatch) -> None:
+    count_tokens, list_models = Mock(), AsyncMock()
+    patch_clients(monkeypatch, count_tokens, list_models)
+
+    await warmup.warm_up_llm_clients(get_settings())
+
+    count_tokens.assert_called_once()
+    list_models.assert_awaited_once()
+
+
+async def test_warm_up_uses_clients_resolved_for_requests(monkeypatch: MonkeyPatch) -> None:
+    """The warmed clients are the cached ones requests get, not copies with pools of their own."""
+    warmed_clients = record_llm_client_calls(monkeypatch)
+
+    await warmup.warm_up_llm_clients(get_settings())
+
+    request_clients = [await resolve_dependency(get_bedrock_client), await resolve_dependency(get_openai_client)]
+    assert sorted(map(id, warmed_clients)) == sorted(map(id, request_clients))
+
+
+async def test_warm_up_failures_do_not_fail_startup(monkeypatch: MonkeyPatch) -> None:
+    """A provider that is down at startup is left cold, the other one is still warmed up."""
+    list_models = AsyncMock()
+    patch_clients(monkeypatch, Mock(side_effect=RuntimeError('no credentials')), list_models)
+
+    await warmup.warm_up_llm_clients(get_settings())
+
+    list_models.assert_awaited_once()
+
+
+async def test_warm_up_gives_up_after_timeout(monkeypatch: MonkeyPatch) -> None:
+    async def hang() -> None:
+        await asyncio.sleep(60)
+
+    patch_clients(monkeypatch, Mock(), AsyncMock(side_effect=hang))
+    settings = get_settings().model_copy(update={'LLM_WARMUP_TIMEOUT_SECONDS': 0.01})
+
+    await asyncio.wait_for(warmup.warm_up_llm_clients(settings), timeout=1)
+{%- endif %}
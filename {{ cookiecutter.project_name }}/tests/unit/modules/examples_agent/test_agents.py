@@ -0,0 +1,136 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock
+{%- endif %}
+from unittest.mock import Mock
+
+from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
+from openai import AsyncOpenAI
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from pydantic_ai import RunContext
+{%- endif %}
+from pydantic_ai.models import Model
+from pydantic_ai.models.bedrock import BedrockConverseModel
+from pydantic_ai.models.fallback import FallbackModel
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.providers.bedrock import BedrockProvider
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.settings import ModelSettings
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+{%- endif %}
+
+from app.modules.examples_agent.agents import build_examples_agent
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from app.modules.examples_agent.agents import memoize_per_run
+{%- endif %}
+from app.modules.examples_agent.prompts import EXAMPLE_AGENT_PROMPT_CACHE_KEY
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from app.modules.examples_agent.schemas import CountExamplesToolInput, ExampleAgentDeps, ExampleAgentResponse
+from tests.mocks.agent_mocks import build_tool_calling_mock_model
+{%- endif %}
+
+
+def build_bedrock_model() -> BedrockConverseModel:
+    return BedrockConverseModel('haiku', provider=BedrockProvider(bedrock_client=Mock(spec=BedrockRuntimeClient)))
+
+
+def build_openai_model() -> OpenAIChatModel:
+    return OpenAIChatModel('gpt-5.4-mini', provider=OpenAIProvider(openai_client=AsyncOpenAI(api_key='test')))
+
+
+def get_model_settings(model: Model) -> ModelSettings:
+    settings = build_examples_agent(model).model_settings
+    assert settings is not None and not callable(settings)
+    return settings
+
+
+def test_bedrock_model_enables_bedrock_prompt_caching() -> None:
+    """Bedrock runs cache the system prompt and tool definitions."""
+    settings = get_model_settings(build_bedrock_model())
+
+    assert settings.get('bedrock_cache_instructions') is True
+    assert settings.get('bedrock_cache_tool_definitions') is True
+
+
+def test_openai_model_sets_stable_prompt_cache_key() -> None:
+    """OpenAI runs share one prompt cache key so repeated requests land on the same cached prefix."""
+    settings = get_model_settings(build_openai_model())
+
+    assert settings.get('openai_prompt_cache_key') == EXAMPLE_AGENT_PROMPT_CACHE_KEY
+
+
+def test_mixed_fallback_chain_enables_caching_for_every_provider() -> None:
+    """A fallback chain spanning providers carries the caching hints of each of them."""
+    model = FallbackModel(build_bedrock_model(), build_openai_model())
+
+    settings = get_model_settings(model)
+
+    assert settings.get('bedrock_cache_instructions') is True
+    assert settings.get('openai_prompt_cache_key') == EXAMPLE_AGENT_PROMPT_CACHE_KEY
+
+
+def test_other_models_get_no_provider_caching_hints() -> None:
+    """Models of other providers only receive the generic settings."""
+    settings = get_model_settings(TestModel())
+
+    assert settings == {'max_tokens': 2048, 'temperature': 0.7}
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+async def test_identical_tool_calls_within_run_are_memoized() -> None:
+    """Repeated tool calls with the same input hit the database once per run."""
+    session = AsyncMock(spec=AsyncSession)
+    session.scalar.return_value = 3
+
+    @asynccontextmanager
+    async def open_session() -> AsyncGenerator[AsyncSession, Any]:
+        yield session
+
+    model = build_tool_calling_mock_model(
+        [
+            ('count_examples', {'payload': {'filters': {'name': 'alpha'}}}),
+            ('count_examples', {'payload': {'filters': {'name': 'alpha'}}}),
+            ('count_examples', {'payload': {'filters': {'name': 'beta'}}}),
+        ],
+        ExampleAgentResponse(answer='We have 3 examples.'),
+    )
+
+    result = await build_examples_agent(model).run('How many?', deps=ExampleAgentDeps(session_factory=open_session))
+
+    assert result.output.answer == 'We have 3 examples.'
+    assert session.scalar.await_count == 2
+
+
+@pytest.mark.parametrize('failure', [RuntimeError('database down'), asyncio.CancelledError()])
+async def test_failed_tool_call_is_not_memoized(failure: BaseException) -> None:
+    """An identical call after a failed or cancelled one runs the tool again instead of reusing the failure."""
+    calls = 0
+
+    @memoize_per_run
+    async def count_examples(ctx: RunContext[ExampleAgentDeps], payload: CountExamplesToolInput) -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise failure
+        return 3
+
+    deps = ExampleAgentDeps(session_factory=AsyncMock())
+    ctx = cast(RunContext[ExampleAgentDeps], SimpleNamespace(tool_name='count_examples', deps=deps))
+
+    with pytest.raises(type(failure)):
+        await count_examples(ctx, CountExamplesToolInput())
+    await asyncio.sleep(0)
+
+    assert deps.tool_results == {}
+    assert await count_examples(ctx, CountExamplesToolInput()) == 3
+    assert calls == 2
+{%- endif %}
+{%- endif %}
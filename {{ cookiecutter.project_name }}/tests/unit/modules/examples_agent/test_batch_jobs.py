@@ -0,0 +1,41 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+
+import pytest
+
+from app.core.enums import AIModelName
+from app.core.exceptions import ServiceUnavailableError
+from app.modules.examples_agent.batch_jobs import ExampleAgentBatchJobs
+
+
+def build_batch_jobs(max_running_jobs: int = 2) -> ExampleAgentBatchJobs:
+    return ExampleAgentBatchJobs(max_stored_jobs=10, max_running_jobs=max_running_jobs, concurrency_per_model=2)
+
+
+def test_create_rejects_jobs_over_running_limit() -> None:
+    """Completed jobs do not count against the running limit, running ones do."""
+    batch_jobs = build_batch_jobs(max_running_jobs=2)
+    batch_jobs.create(total=1).status = 'completed'
+    batch_jobs.create(total=1)
+    batch_jobs.create(total=1)
+
+    with pytest.raises(ServiceUnavailableError):
+        batch_jobs.create(total=1)
+
+
+def test_model_semaphore_is_shared_by_jobs() -> None:
+    batch_jobs = build_batch_jobs()
+
+    assert batch_jobs.model_semaphore(AIModelName.HAIKU_4_5) is batch_jobs.model_semaphore(AIModelName.HAIKU_4_5)
+    assert batch_jobs.model_semaphore(AIModelName.HAIKU_4_5) is not batch_jobs.model_semaphore(AIModelName.GPT_5_4)
+
+
+async def test_stop_cancels_running_jobs() -> None:
+    batch_jobs = build_batch_jobs()
+    task = asyncio.create_task(asyncio.sleep(60))
+    batch_jobs.track(task)
+
+    await batch_jobs.stop()
+
+    assert task.cancelled()
+{%- endif %}
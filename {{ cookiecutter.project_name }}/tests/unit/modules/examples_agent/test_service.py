@@ -0,0 +1,113 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from openai import AsyncOpenAI
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+{%- endif %}
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.usage import RunUsage
+
+from app.core.config import get_settings
+from app.core.enums import AIModelName
+from app.modules.examples_agent.batch_jobs import ExampleAgentBatchJobs
+from app.modules.examples_agent.prompts import EXAMPLE_AGENT_PROMPT_CACHE_KEY
+from app.modules.examples_agent.schemas import ExampleAgentRequest
+from app.modules.examples_agent.service import ExampleAgentService
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+from app.modules.examples_agent.service import compact_message_history
+{%- endif %}
+
+
+async def test_hedge_run_gets_model_settings_of_hedging_model() -> None:
+    """The hedge run carries the caching hints of the hedging model, not the ones of the primary model."""
+    hedging_model = OpenAIChatModel('gpt-5.4-mini', provider=OpenAIProvider(openai_client=AsyncOpenAI(api_key='test')))
+    hedge_result = Mock(response=Mock(model_name='gpt-5.4-mini'), usage=RunUsage())
+
+    async def run(*_: Any, **kwargs: Any) -> Mock:
+        if 'model' not in kwargs:
+            await asyncio.sleep(60)
+        return hedge_result
+
+    agent = Mock(run=AsyncMock(side_effect=run))
+    settings = get_settings().model_copy(
+        update={
+            'AGENT_HEDGING_ENABLED': True,
+            'AGENT_HEDGING_DELAY_SECONDS': 0,
+            'AGENT_HEDGING_MODEL': AIModelName.GPT_5_4_MINI,
+        }
+    )
+    service = ExampleAgentService(
+        settings,
+        {AIModelName.GPT_5_4_MINI: hedging_model},
+        ExampleAgentBatchJobs(max_stored_jobs=1, max_running_jobs=1, concurrency_per_model=1),
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+        Mock(),
+{%- endif %}
+    )
+
+    await service.answer(ExampleAgentRequest(model=AIModelName.HAIKU_4_5, question='How many examples?'), agent)
+
+    (hedge_call,) = [call for call in agent.run.await_args_list if 'model' in call.kwargs]
+    assert hedge_call.kwargs['model'] is hedging_model
+    assert hedge_call.kwargs['model_settings'].get('openai_prompt_cache_key') == EXAMPLE_AGENT_PROMPT_CACHE_KEY
+{%- if cookiecutter.project_type == "fastapi_db_agent" %}
+
+
+def build_turn(question: str, answer: str, with_system_prompt: bool = False) -> list[ModelMessage]:
+    system_parts = [SystemPromptPart(content='You are a helpful assistant.')] if with_system_prompt else []
+    return [
+        ModelRequest(parts=[*system_parts, UserPromptPart(content=question)]),
+        ModelResponse(parts=[ToolCallPart(tool_name='count_examples', args={}, tool_call_id='call-1')]),
+        ModelRequest(parts=[ToolReturnPart(tool_name='count_examples', content=3, tool_call_id='call-1')]),
+        ModelResponse(parts=[TextPart(content=answer)]),
+    ]
+
+
+def test_history_within_budget_is_kept() -> None:
+    messages = build_turn('first', 'one', with_system_prompt=True) + build_turn('second', 'two')
+
+    assert compact_message_history(messages, token_budget=100_000) == messages
+
+
+def test_oldest_turns_are_dropped_and_system_prompt_is_kept() -> None:
+    """Compaction cuts at turn boundaries and moves the system prompt to the first kept turn."""
+    messages = (
+        build_turn('first' * 200, 'one', with_system_prompt=True)
+        + build_turn('second', 'two')
+        + build_turn('third', 'three')
+    )
+
+    compacted = compact_message_history(messages, token_budget=1_000)
+
+    assert len(compacted) == 8
+    first = compacted[0]
+    assert isinstance(first, ModelRequest)
+    system_part, user_part = first.parts
+    assert isinstance(system_part, SystemPromptPart)
+    assert isinstance(user_part, UserPromptPart)
+    assert user_part.content == 'second'
+    assert compacted[1:] == messages[5:]
+
+
+def test_last_turn_is_kept_even_over_budget() -> None:
+    messages = build_turn('first', 'one', with_system_prompt=True) + build_turn('second' * 500, 'two')
+
+    compacted = compact_message_history(messages, token_budget=10)
+
+    assert len(compacted) == 4
+    assert compacted[1:] == messages[5:]
+{%- endif %}
+{%- endif %}
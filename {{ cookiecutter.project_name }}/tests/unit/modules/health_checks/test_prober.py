@@ -0,0 +1,64 @@
+{%- if cookiecutter.project_type in ["fastapi_agent", "fastapi_db_agent"] %}
+import asyncio
+from unittest.mock import AsyncMock
+
+from freezegun import freeze_time
+from pytest import MonkeyPatch
+
+from app.infrastructure.llms.provider_bedrock import get_bedrock_client
+from app.infrastructure.llms.provider_openai import get_openai_client
+from app.modules.health_checks.prober import get_llm_readiness_prober, ReadinessProber
+from tests.dependencies import resolve_dependency
+from tests.mocks.llm_client_mocks import record_llm_client_calls
+
+
+def build_prober(
+    check: AsyncMock, interval_seconds: float = 60.0, max_staleness_seconds: float = 60.0
+) -> ReadinessProber:
+    return ReadinessProber({'openai': check}, interval_seconds, max_staleness_seconds)
+
+
+async def test_statuses_are_served_from_cache_while_fresh() -> None:
+    check = AsyncMock(return_value='UP')
+    prober = build_prober(check)
+
+    assert await prober.get_statuses() == {'openai': 'UP'}
+    assert await prober.get_statuses() == {'openai': 'UP'}
+
+    check.assert_awaited_once()
+
+
+async def test_stale_statuses_are_refreshed_once_for_concurrent_probes() -> None:
+    check = AsyncMock(side_effect=['DOWN', 'UP'])
+    prober = build_prober(check, max_staleness_seconds=60.0)
+    with freeze_time() as frozen_time:
+        await prober.get_statuses()
+        frozen_time.tick(61)
+
+        statuses = await asyncio.gather(*(prober.get_statuses() for _ in range(5)))
+
+    assert statuses == [{'openai': 'UP'}] * 5
+    assert check.await_count == 2
+
+
+async def test_background_refresh_updates_statuses() -> None:
+    check = AsyncMock(side_effect=['UP', 'DOWN', 'DOWN'])
+    prober = build_prober(check, interval_seconds=0.01)
+
+    prober.start()
+    await asyncio.sleep(0.015)
+    await prober.stop()
+
+    assert await prober.get_statuses() == {'openai': 'DOWN'}
+
+
+async def test_llm_prober_probes_clients_resolved_for_requests(monkeypatch: MonkeyPatch) -> None:
+    """Readiness is probed through the cached clients carrying the request traffic, not through idle copies."""
+    probed_clients = record_llm_client_calls(monkeypatch)
+    get_llm_readiness_prober.cache_clear()
+
+    await get_llm_readiness_prober().refresh()
+
+    request_clients = [await resolve_dependency(get_bedrock_client), await resolve_dependency(get_openai_client)]
+    assert sorted(map(id, probed_clients)) == sorted(map(id, request_clients))
+{%- endif %}
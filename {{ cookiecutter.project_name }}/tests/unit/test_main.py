@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from pytest import MonkeyPatch
 
 import app.main as app_main
-from app.core.logging import LogFormatType
+from app.core.logging import LogFormatType, LogQueueOverflowPolicy
 
 
 @dataclass(frozen=True, slots=True)
@@ -12,16 +12,25 @@ class AppSettings:
     PROJECT_VERSION: str = '1.2.3'
     LOG_LEVEL: str = 'DEBUG'
     LOG_FORMAT: LogFormatType = LogFormatType.JSON
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_QUEUE_SIZE: int = 100
+    LOG_QUEUE_OVERFLOW_POLICY: LogQueueOverflowPolicy = 'block'
+    LOG_RATE_LIMIT_ENABLED: bool = True
+    LOG_RATE_LIMIT_PER_SECOND: float = 5.0
+    LOG_RATE_LIMIT_BURST: int = 20
+    LOG_RATE_LIMIT_REPORT_INTERVAL_SECONDS: float = 30.0
+    LOG_ACCESS_ENABLED: bool = True
+    LOG_UVICORN_ACCESS_ENABLED: bool = False
     ROOT_PATH: str = ''
 
 
 def test_create_app_configures_logging_from_settings(monkeypatch: MonkeyPatch) -> None:
     """The app factory applies template logging for uvicorn factory launches."""
     settings = AppSettings()
-    calls: list[tuple[str, LogFormatType]] = []
+    calls: list[tuple[str, LogFormatType, dict[str, object]]] = []
 
-    def record_configure_logging(log_level: str, format_type: LogFormatType) -> None:
-        calls.append((log_level, format_type))
+    def record_configure_logging(log_level: str, format_type: LogFormatType, **options: object) -> None:
+        calls.append((log_level, format_type, options))
 
     monkeypatch.setattr(app_main, 'get_settings', lambda: settings)
     monkeypatch.setattr(app_main, 'configure_logging', record_configure_logging, raising=False)
@@ -31,4 +40,19 @@ def test_create_app_configures_logging_from_settings(monkeypatch: MonkeyPatch) -
 
     app_main.create_app()
 
-    assert calls == [(settings.LOG_LEVEL, settings.LOG_FORMAT)]
+    assert calls == [
+        (
+            settings.LOG_LEVEL,
+            settings.LOG_FORMAT,
+            {
+                'queue_enabled': settings.LOG_QUEUE_ENABLED,
+                'queue_size': settings.LOG_QUEUE_SIZE,
+                'queue_overflow_policy': settings.LOG_QUEUE_OVERFLOW_POLICY,
+                'rate_limit_enabled': settings.LOG_RATE_LIMIT_ENABLED,
+                'rate_limit_per_second': settings.LOG_RATE_LIMIT_PER_SECOND,
+                'rate_limit_burst': settings.LOG_RATE_LIMIT_BURST,
+                'rate_limit_report_interval_seconds': settings.LOG_RATE_LIMIT_REPORT_INTERVAL_SECONDS,
+                'uvicorn_access_enabled': settings.LOG_UVICORN_ACCESS_ENABLED,
+            },
+        )
+    ]